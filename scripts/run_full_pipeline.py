@@ -3,13 +3,13 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from llm_trader.common import create_redis_client, get_logger
+from llm_trader.common.serialization import dumps
 from llm_trader.config import get_settings
 from llm_trader.data.ingestion import DataIngestionService
 from llm_trader.data.pipelines.ohlcv import OhlcvPipeline
@@ -177,12 +177,16 @@ class PipelineController:
         repository: Optional[ParquetRepository] = None,
         status_dir: Optional[Path] = None,
         status_filename: str = STATUS_FILENAME,
+        status_writer: Optional[Callable[[str], None]] = None,
     ) -> None:
+        """``status_writer`` 接收完整的状态 JSON 文本，默认覆盖写入 ``status_dir/status_filename``。"""
+
         self._settings = get_settings()
         self._repository = repository or ParquetRepository()
         base_dir = Path(status_dir or self._settings.trading.report_output_dir)
         base_dir.mkdir(parents=True, exist_ok=True)
         self._status_path = base_dir / status_filename
+        self._status_writer = status_writer or self._write_status_file
         self._status = PipelineStatus(execution_mode=self._settings.trading.execution_mode)
         self._alert = AlertEmitter(channel=self._settings.monitoring.channel)
         self._session_factory = create_session_factory()
@@ -323,8 +327,11 @@ class PipelineController:
     def _write_status(self) -> None:
         self._status.updated_at = self._now()
         payload = self._status.to_dict()
-        with self._status_path.open("w", encoding="utf-8") as fp:
-            json.dump(payload, fp, ensure_ascii=False, indent=2)
+        # 状态文件供人工直接查看，保持缩进格式
+        self._status_writer(dumps(payload, indent=True))
+
+    def _write_status_file(self, text: str) -> None:
+        self._status_path.write_text(text, encoding="utf-8")
 
     @staticmethod
     def _map_result_status(status: str) -> str:
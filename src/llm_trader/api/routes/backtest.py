@@ -59,10 +59,10 @@ def _prepare_orders(bars: List[Dict[str, object]], rules: List[RuleConfig]) -> D
     df["dt"] = pd.to_datetime(df["dt"])
     df.sort_values("dt", inplace=True)
     orders_by_date: Dict[datetime, List[Order]] = defaultdict(list)
+    engine = StrategyEngine(rules)
 
     for symbol, group in df.groupby("symbol"):
         group = group.set_index("dt").sort_index()
-        engine = StrategyEngine(rules)
         evaluated = engine.evaluate(group)
         evaluated["symbol"] = symbol
         orders = generate_orders_from_signals(evaluated, symbol=symbol)
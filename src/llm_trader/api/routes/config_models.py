@@ -19,7 +19,10 @@ from llm_trader.api.security import require_api_key
 from llm_trader.db.models.config import ModelEndpoint
 from llm_trader.db.session import session_scope
 from llm_trader.model_gateway import ModelEndpointSettings, ModelGateway, ModelGatewaySettings
-from llm_trader.model_gateway.loader import build_gateway_settings_from_records
+from llm_trader.model_gateway.loader import (
+    build_gateway_settings_from_records,
+    invalidate_gateway_settings,
+)
 
 
 router = APIRouter(prefix="/config/models", tags=["config"], dependencies=[Depends(require_api_key)])
@@ -74,6 +77,7 @@ def _record_to_payload(record: ModelEndpoint) -> ModelEndpointItem:
 
 
 def _refresh_gateway_from_db() -> None:
+    invalidate_gateway_settings()
     with session_scope() as session:
         records = session.exec(select(ModelEndpoint)).all()
     _get_gateway().update_settings(build_gateway_settings_from_records(records))
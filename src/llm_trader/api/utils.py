@@ -44,8 +44,8 @@ def load_ohlcv(symbols: Iterable[str], freq: str, start: Optional[datetime], end
         if end:
             df = df[df["dt"] <= end]
         df = df.sort_values("dt")
-        for _, row in df.iterrows():
-            records.append(row.to_dict())
+        # 按列整体转换为记录，避免 iterrows 为每行构造 Series
+        records.extend(df.to_dict(orient="records"))
     return records
 
 
@@ -2,7 +2,7 @@
 
 from .engine import BacktestResult, BacktestRunner
 from .execution import ExecutionConfig, ExecutionEngine
-from .models import Account, Order, OrderSide, Position, Trade
+from .models import Account, EquityCurve, EquityRecord, Order, OrderSide, Position, Trade
 
 __all__ = [
     "BacktestRunner",
@@ -10,6 +10,8 @@ __all__ = [
     "ExecutionConfig",
     "ExecutionEngine",
     "Account",
+    "EquityCurve",
+    "EquityRecord",
     "Order",
     "OrderSide",
     "Position",
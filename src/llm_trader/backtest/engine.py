@@ -11,7 +11,7 @@ from uuid import uuid4
 
 from llm_trader.backtest.execution import ExecutionConfig, ExecutionEngine
 from llm_trader.backtest.metrics import compute_metrics
-from llm_trader.backtest.models import Account, Order, OrderSide
+from llm_trader.backtest.models import Account, EquityRecord, Order, OrderSide
 from llm_trader.data.repositories.parquet import ParquetRepository
 
 Bar = Dict[str, Union[float, datetime, str]]
@@ -21,7 +21,7 @@ Bar = Dict[str, Union[float, datetime, str]]
 class BacktestResult:
     account: Account
     trades: List
-    equity_curve: List[Dict[str, float]]
+    equity_curve: List[EquityRecord]
     metrics: Dict[str, float]
     storage_paths: Dict[str, Path]
 
@@ -52,10 +52,10 @@ class BacktestRunner:
     ) -> BacktestResult:
         grouped = defaultdict(dict)
         for bar in bars:
-            dt = bar["dt"]
-            if isinstance(dt, str):
-                dt = datetime.fromisoformat(dt)
-            grouped[dt][bar["symbol"]] = bar
+            bar_dt = bar["dt"]
+            if isinstance(bar_dt, str):
+                bar_dt = datetime.fromisoformat(bar_dt)
+            grouped[bar_dt][bar["symbol"]] = bar
 
         dates = sorted(grouped.keys())
         account = Account(cash=self.initial_cash)
@@ -78,15 +78,15 @@ class BacktestRunner:
                     continue
                 close_price = float(symbols.get(symbol, {}).get("close", price_lookup(symbol, OrderSide.BUY)))
                 equity += position.volume * close_price
-            account.equity_curve.append({"date": dt, "equity": equity})
+            account.equity_curve.add(dt, equity)
 
-        metrics = compute_metrics(account.equity_curve)
+        equity_records = account.equity_curve.to_records()
+        metrics = compute_metrics(equity_records)
         run_identifier = run_id or f"run-{uuid4().hex[:8]}"
         run_date = dates[-1] if dates else datetime.utcnow()
         storage_paths: Dict[str, Path] = {}
 
         if persist:
-            equity_records = account.equity_curve
             trades_records = [
                 {
                     "trade_id": trade.trade_id,
@@ -112,7 +112,7 @@ class BacktestRunner:
         return BacktestResult(
             account=account,
             trades=all_trades,
-            equity_curve=account.equity_curve,
+            equity_curve=equity_records,
             metrics=metrics,
             storage_paths=storage_paths,
         )
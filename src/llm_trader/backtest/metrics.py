@@ -5,8 +5,10 @@ from __future__ import annotations
 from math import sqrt
 from typing import Dict, Sequence
 
+from llm_trader.backtest.models import EquityRecord
 
-def compute_metrics(equity_curve: Sequence[Dict[str, float]]) -> Dict[str, float]:
+
+def compute_metrics(equity_curve: Sequence[EquityRecord]) -> Dict[str, float]:
     if not equity_curve:
         return {}
     equity_values = [item["equity"] for item in equity_curve]
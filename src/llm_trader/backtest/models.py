@@ -5,7 +5,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, TypedDict, Union, overload
+
+import numpy as np
 
 
 class OrderSide(str, Enum):
@@ -105,17 +107,117 @@ class Position:
         return not self.lots
 
 
+class EquityRecord(TypedDict):
+    """权益曲线上的单个点。"""
+
+    date: datetime
+    equity: float
+
+
+class EquityCurve:
+    """权益曲线的列式存储。
+
+    时间与权益分别保存在预分配的 numpy 数组中，容量不足时按倍数扩容；
+    对外仍以 ``{"date": ..., "equity": ...}`` 字典的形式追加与遍历。
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self, points: Iterable[EquityRecord] = ()) -> None:
+        self._dates = np.empty(self._INITIAL_CAPACITY, dtype=object)
+        self._values = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._size = 0
+        for point in points:
+            self.append(point)
+
+    def append(self, point: EquityRecord) -> None:
+        """追加一个权益点，兼容原列表接口。"""
+
+        self.add(point["date"], float(point["equity"]))
+
+    def add(self, dt: datetime, equity: float) -> None:
+        """追加时间与权益值。"""
+
+        if self._size == self._values.size:
+            self._grow()
+        self._dates[self._size] = dt
+        self._values[self._size] = equity
+        self._size += 1
+
+    @property
+    def dates(self) -> np.ndarray:
+        """返回时间列的只读视图。"""
+
+        view = self._dates[: self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def values(self) -> np.ndarray:
+        """返回权益列的只读视图。"""
+
+        view = self._values[: self._size]
+        view.flags.writeable = False
+        return view
+
+    def to_records(self) -> List[EquityRecord]:
+        """转换为字典列表，便于序列化与落盘。"""
+
+        return list(self)
+
+    def _grow(self) -> None:
+        capacity = self._values.size * 2
+        dates = np.empty(capacity, dtype=object)
+        dates[: self._size] = self._dates[: self._size]
+        values = np.empty(capacity, dtype=np.float64)
+        values[: self._size] = self._values[: self._size]
+        self._dates = dates
+        self._values = values
+
+    def _point(self, index: int) -> EquityRecord:
+        return {"date": self._dates[index], "equity": float(self._values[index])}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[EquityRecord]:
+        for index in range(self._size):
+            yield self._point(index)
+
+    @overload
+    def __getitem__(self, index: int) -> EquityRecord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[EquityRecord]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[EquityRecord, List[EquityRecord]]:
+        if isinstance(index, slice):
+            return [self._point(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("权益曲线索引越界")
+        return self._point(index)
+
+    def __repr__(self) -> str:
+        return f"EquityCurve(size={self._size})"
+
+
 @dataclass
 class Account:
     cash: float
     positions: Dict[str, Position] = field(default_factory=dict)
     trades: List[Trade] = field(default_factory=list)
-    equity_curve: List[Dict[str, float]] = field(default_factory=list)
+    equity_curve: EquityCurve = field(default_factory=EquityCurve)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.equity_curve, EquityCurve):
+            self.equity_curve = EquityCurve(self.equity_curve)
 
     def total_equity(self) -> float:
         if not self.equity_curve:
             return self.cash
-        return self.equity_curve[-1]["equity"]
+        return float(self.equity_curve.values[-1])
 
     def get_position(self, symbol: str) -> Position:
         if symbol not in self.positions:
@@ -0,0 +1,103 @@
+"""JSON 序列化工具。
+
+安装 orjson 时使用其 C 扩展实现，否则回退标准库 ``json``；
+各模块统一通过 ``loads``/``dumps`` 调用，避免各自处理可选依赖。
+两条路径输出保持一致：时间按 ISO 8601 输出，NaN/Infinity 输出为 ``null``，
+提示词内容与缓存键因此不随是否安装 orjson 而变化。"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import math
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Callable, Optional, Union
+from uuid import UUID
+
+try:  # pragma: no cover - 可选依赖
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - 未安装时回退标准库
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """解析 JSON 文本或 UTF-8 字节，格式错误时抛出 ``json.JSONDecodeError``。"""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(
+    value: Any,
+    *,
+    default: Optional[Callable[[Any], Any]] = None,
+    sort_keys: bool = False,
+    indent: bool = False,
+) -> str:
+    """序列化为 JSON 字符串，非 ASCII 字符原样保留；默认紧凑输出，``indent`` 时按两空格缩进。
+
+    orjson 不支持的类型（如非字符串键）回退标准库处理，输出语义保持一致。
+    """
+
+    if orjson is not None:
+        # numpy 标量与数组直接按原生数值输出，无需经过 default 回调
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(value, default=default, option=option).decode("utf-8")
+        except TypeError:
+            pass
+    fallback_default: Optional[Callable[[Any], Any]] = None
+    if default is not None:
+        user_default = default
+
+        def fallback_default(obj: Any) -> Any:
+            return _to_plain(user_default(obj))
+
+    return json.dumps(
+        _to_plain(value),
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        default=fallback_default,
+        sort_keys=sort_keys,
+        allow_nan=False,
+    )
+
+
+def _to_plain(value: Any) -> Any:
+    """按 orjson 的原生规则把值转换为标准库可直接输出的结构。
+
+    时间、枚举、UUID、dataclass 与 numpy 对象按 orjson 的方式展开，非有限浮点数转为 ``None``；
+    其余类型原样返回，交由 ``default`` 处理。
+    """
+
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, (str, int, bool)) or value is None:
+        return value
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(item) for item in value]
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return _to_plain(value.value)
+    if isinstance(value, UUID):
+        return str(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: _to_plain(getattr(value, field.name)) for field in dataclasses.fields(value)}
+    if hasattr(value, "tolist") and type(value).__module__ == "numpy":
+        return _to_plain(value.tolist())
+    return value
+
+
+__all__ = ["loads", "dumps"]
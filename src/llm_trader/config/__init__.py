@@ -11,6 +11,7 @@ from .settings import (
     SchedulerSettings,
     TradingSettings,
     get_settings,
+    override_settings,
 )
 
 __all__ = [
@@ -24,4 +25,5 @@ __all__ = [
     "SchedulerSettings",
     "TradingSettings",
     "get_settings",
+    "override_settings",
 ]
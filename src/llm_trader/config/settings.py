@@ -7,12 +7,13 @@ from __future__ import annotations
 
 import json
 import os
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional
 
-from llm_trader.model_gateway.config import ModelEndpointSettings, ModelGatewaySettings
+from llm_trader.config.model_gateway import ModelEndpointSettings, ModelGatewaySettings
 
 # python-dotenv 在尚未安装依赖时可能不可用，因此提供兜底实现
 try:
@@ -107,6 +108,8 @@ class DataStoreSettings:
         default_factory=lambda: _getenv("DATA_PARQUET_PARTITION_TEMPLATE", "freq/symbol/%Y%m")
     )
     auto_create: bool = field(default_factory=lambda: _env_bool("DATA_AUTO_CREATE", True))
+    # 为空时沿用各数据集的默认压缩；``none`` 表示不压缩（测试等小数据场景）
+    parquet_compression: str = field(default_factory=lambda: _getenv("DATA_PARQUET_COMPRESSION", ""))
 
     def resolve_base_dir(self) -> Path:
         """返回绝对路径，必要时创建目录。"""
@@ -272,11 +275,13 @@ def _load_model_endpoints(default_model: str) -> List[ModelEndpointSettings]:
 def _load_model_gateway_settings() -> ModelGatewaySettings:
     default_model = _getenv("MODEL_GATEWAY_DEFAULT_MODEL", _getenv("TRADING_LLM_MODEL", "gpt-4.1-mini"))
     endpoints = _load_model_endpoints(default_model)
+    hedge_delay_ms = _env_int("MODEL_GATEWAY_HEDGE_DELAY_MS", 0)
     return ModelGatewaySettings(
         enabled=_env_bool("MODEL_GATEWAY_ENABLED", True),
         default_model=default_model,
         audit_enabled=_env_bool("MODEL_GATEWAY_AUDIT_ENABLED", True),
         endpoints=endpoints,
+        hedge_delay_ms=hedge_delay_ms if hedge_delay_ms > 0 else None,
     )
 
 
@@ -304,6 +309,33 @@ def get_settings() -> AppSettings:
     return AppSettings()
 
 
+@contextmanager
+def override_settings(section: str, **values: Any) -> Iterator[AppSettings]:
+    """临时覆盖缓存配置中某一分组的字段，退出时恢复原值。
+
+    直接修改 ``get_settings()`` 返回的单例，无需清空缓存并重新解析全部环境变量，
+    主要用于测试中切换数据目录等场景。
+
+    参数:
+        section: ``AppSettings`` 的分组属性名，例如 ``"data_store"``
+        **values: 需要覆盖的字段及取值
+    """
+
+    settings = get_settings()
+    target = getattr(settings, section)
+    previous = {key: getattr(target, key) for key in values}
+    for key, value in values.items():
+        setattr(target, key, value)
+    try:
+        yield settings
+    finally:
+        for key, value in previous.items():
+            setattr(target, key, value)
+        if get_settings() is not settings:
+            # 期间缓存被清空并重建时，丢弃基于临时状态构建的新实例
+            get_settings.cache_clear()
+
+
 __all__ = [
     "AppSettings",
     "DataStoreSettings",
@@ -318,4 +350,5 @@ __all__ = [
     "ModelGatewaySettings",
     "ModelEndpointSettings",
     "get_settings",
+    "override_settings",
 ]
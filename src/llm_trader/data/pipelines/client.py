@@ -12,6 +12,7 @@ import httpx
 from tenacity import RetryError, retry, stop_after_attempt, wait_exponential
 
 from llm_trader.common import DataSourceError, get_logger
+from llm_trader.common.serialization import loads
 
 
 _DEFAULT_HEADERS: Mapping[str, str] = {
@@ -21,6 +22,9 @@ _DEFAULT_HEADERS: Mapping[str, str] = {
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36",
 }
 
+# 管道会连续请求同一批主机，保留足够的空闲长连接以复用 TCP/TLS 握手
+_DEFAULT_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30.0)
+
 
 class EastMoneyClient:
     """东方财富同步客户端。"""
@@ -32,6 +36,7 @@ class EastMoneyClient:
         max_retries: int = 3,
         headers: Optional[Mapping[str, str]] = None,
         transport: Optional[httpx.BaseTransport] = None,
+        limits: Optional[httpx.Limits] = None,
     ) -> None:
         self._logger = get_logger(self.__class__.__name__)
         merged_headers = dict(_DEFAULT_HEADERS)
@@ -39,7 +44,12 @@ class EastMoneyClient:
             merged_headers.update(headers)
         self._timeout = timeout
         self._max_retries = max_retries
-        self._client = httpx.Client(headers=merged_headers, timeout=timeout, transport=transport)
+        self._client = httpx.Client(
+            headers=merged_headers,
+            timeout=timeout,
+            transport=transport,
+            limits=limits or _DEFAULT_LIMITS,
+        )
 
     def close(self) -> None:
         """关闭底层客户端。"""
@@ -52,6 +62,15 @@ class EastMoneyClient:
     def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
         self.close()
 
+    @staticmethod
+    def _decode_json(response: httpx.Response) -> Any:
+        """直接解码原始字节，非 UTF-8 内容回退 httpx 的编码探测。"""
+
+        try:
+            return loads(response.content)
+        except ValueError:
+            return response.json()
+
     def _retry_policy(self):
         return retry(
             stop=stop_after_attempt(self._max_retries),
@@ -71,7 +90,7 @@ class EastMoneyClient:
             effective_params.setdefault("t", f"{random.randint(10_000, 99_999)}")
             response = self._client.get(url, params=effective_params)
             response.raise_for_status()
-            data = response.json()
+            data = self._decode_json(response)
             return data
 
         try:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from llm_trader.common import DataSourceError, get_logger
 from llm_trader.data.repositories.parquet import ParquetRepository
@@ -14,6 +14,29 @@ from .client import EastMoneyClient
 _QUOTES_URL = "https://push2.eastmoney.com/api/qt/ulist.np/get"
 _LOGGER = get_logger("data.pipeline.realtime")
 
+# 行情记录字段与东方财富字段的对应关系，解析时按表逐项取值
+_QUOTE_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("name", "f14"),
+    ("last_price", "f2"),
+    ("change", "f3"),
+    ("change_ratio", "f4"),
+    ("volume", "f5"),
+    ("amount", "f6"),
+    ("high", "f15"),
+    ("low", "f16"),
+    ("open", "f17"),
+    ("prev_close", "f18"),
+    ("turnover_rate", "f10"),
+    ("amplitude", "f7"),
+    ("pe", "f128"),
+)
+_EXCHANGE_CODES: Dict[str, str] = {
+    "1": "SH",
+    "0": "SZ",
+    "2": "BJ",
+    "3": "HK",
+}
+
 
 class RealtimeQuotesPipeline:
     """东方财富最新行情快照。"""
@@ -35,6 +58,8 @@ class RealtimeQuotesPipeline:
             return []
 
         records: List[Dict[str, object]] = []
+        # 同一批次共享快照时间，避免逐条调用 utcnow
+        snapshot_time = datetime.utcnow()
         # 东方财富一次最多支持 60+ 证券，按 50 分组稳妥
         chunk_size = 50
         for i in range(0, len(symbol_list), chunk_size):
@@ -50,10 +75,10 @@ class RealtimeQuotesPipeline:
             if not data:
                 continue
             diff = data.get("diff") or []
-            for item in diff:
-                parsed = self._parse_quote(item)
-                if parsed:
-                    records.append(parsed)
+            parse = self._parse_quote
+            records.extend(
+                parsed for parsed in (parse(item, snapshot_time) for item in diff) if parsed
+            )
 
         if not records:
             raise DataSourceError("未获取到实时行情")
@@ -88,47 +113,21 @@ class RealtimeQuotesPipeline:
         return symbol
 
     @staticmethod
-    def _parse_quote(item: Dict[str, object]) -> Optional[Dict[str, object]]:
+    def _parse_quote(
+        item: Dict[str, object],
+        snapshot_time: Optional[datetime] = None,
+    ) -> Optional[Dict[str, object]]:
         symbol_code = item.get("f12")
-        exchange = item.get("f13")
-        name = item.get("f14")
         if not symbol_code:
             return None
-        if exchange is None or str(exchange) == "":
-            return None
-        normalized_exchange = RealtimeQuotesPipeline._normalize_exchange(exchange)
+        normalized_exchange = RealtimeQuotesPipeline._normalize_exchange(item.get("f13"))
         if not normalized_exchange:
             return None
-        symbol = f"{symbol_code}.{normalized_exchange}"
-        price = item.get("f2")
-        change = item.get("f3")
-        change_ratio = item.get("f4")
-        volume = item.get("f5")
-        amount = item.get("f6")
-        high = item.get("f15")
-        low = item.get("f16")
-        open_price = item.get("f17")
-        prev_close = item.get("f18")
-        turnover_rate = item.get("f10")
-        amplitude = item.get("f7")
-        pe = item.get("f128")
-        return {
-            "symbol": symbol,
-            "name": name,
-            "last_price": price,
-            "change": change,
-            "change_ratio": change_ratio,
-            "volume": volume,
-            "amount": amount,
-            "high": high,
-            "low": low,
-            "open": open_price,
-            "prev_close": prev_close,
-            "turnover_rate": turnover_rate,
-            "amplitude": amplitude,
-            "pe": pe,
-            "snapshot_time": datetime.utcnow(),
-        }
+        record: Dict[str, object] = {"symbol": f"{symbol_code}.{normalized_exchange}"}
+        for field, source in _QUOTE_FIELDS:
+            record[field] = item.get(source)
+        record["snapshot_time"] = snapshot_time or datetime.utcnow()
+        return record
 
     @staticmethod
     def _normalize_exchange(value: object) -> Optional[str]:
@@ -137,13 +136,7 @@ class RealtimeQuotesPipeline:
         text = str(value).strip()
         if not text:
             return None
-        mapping = {
-            "1": "SH",
-            "0": "SZ",
-            "2": "BJ",
-            "3": "HK",
-        }
-        return mapping.get(text, text.upper())
+        return _EXCHANGE_CODES.get(text, text.upper())
 
 
 __all__ = ["RealtimeQuotesPipeline"]
@@ -6,25 +6,71 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
 from llm_trader.common import get_logger
+from llm_trader.config import get_settings
 from llm_trader.data import DataStoreManager, DatasetConfig, DatasetKind, default_manager
 from llm_trader.data.quality import drop_duplicates, drop_na
 
 Record = Dict[str, Any]
+Columns = Mapping[str, Sequence[Any]]
 
 _LOGGER = get_logger("data.repo.parquet")
 
+# 交易流水的列式 schema，写入时直接按列构建 Arrow 表，避免逐行推断类型
+_TRADING_ORDERS_SCHEMA = pa.schema(
+    [
+        ("order_id", pa.string()),
+        ("symbol", pa.string()),
+        ("side", pa.string()),
+        ("volume", pa.int64()),
+        ("price", pa.float64()),
+        ("status", pa.string()),
+        ("filled_volume", pa.int64()),
+        ("filled_amount", pa.float64()),
+        ("created_at", pa.timestamp("us")),
+    ]
+)
+_TRADING_TRADES_SCHEMA = pa.schema(
+    [
+        ("trade_id", pa.string()),
+        ("order_id", pa.string()),
+        ("symbol", pa.string()),
+        ("side", pa.string()),
+        ("volume", pa.int64()),
+        ("price", pa.float64()),
+        ("fee", pa.float64()),
+        ("tax", pa.float64()),
+        ("timestamp", pa.timestamp("us")),
+    ]
+)
+# 证券主表写入参数：仅对基数极低的字符串列使用 Parquet 字典编码，Arrow 类型仍为 string，
+# 读取方（含 pandas）拿到的仍是普通字符串列而非 category
+_SYMBOLS_WRITE_OPTIONS: Dict[str, Any] = {
+    "compression": "zstd",
+    "use_dictionary": ["board", "exchange", "industry", "status"],
+}
+
+# K 线写入参数：zstd 压缩，仅对 symbol/freq 使用字典编码；价格与成交量保持 float64，
+# 以免 float32 量化改变 10.7 等两位小数价格的回读值
+_OHLCV_WRITE_OPTIONS: Dict[str, Any] = {
+    "compression": "zstd",
+    "use_dictionary": ["symbol", "freq"],
+}
+
 
 @dataclass
 class ParquetRepository:
     """负责将数据写入 Parquet 并处理增量逻辑。"""
 
     manager: DataStoreManager = field(default_factory=default_manager)
+    # 覆盖所有 pq.write_table 调用的写入参数，例如 {"compression": None, "write_statistics": False}
+    write_options: Optional[Dict[str, Any]] = None
 
     def write_ohlcv_daily(
         self,
@@ -74,7 +120,8 @@ class ParquetRepository:
         cleaned = drop_duplicates(records, subset=["symbol"])
         cleaned = drop_na(cleaned, subset=["symbol", "name"])
         path = self.manager.path_for(DatasetKind.SYMBOLS)
-        self._write_table(path, cleaned)
+        table = pa.Table.from_pylist(list(cleaned))
+        pq.write_table(table, path, **self._resolve_write_options(_SYMBOLS_WRITE_OPTIONS))
         _LOGGER.info("已写入证券主表", extra={"rows": len(cleaned), "path": str(path)})
         return path
 
@@ -177,7 +224,7 @@ class ParquetRepository:
                     subset=("symbol", "dt", "freq"),
                     sort_key="dt",
                 )
-                self._write_table(path, combined)
+                self._write_table(path, combined, **_OHLCV_WRITE_OPTIONS)
                 _LOGGER.info(
                     "已写入行情数据",
                     extra={"symbol": symbol, "freq": freq, "rows": len(day_records), "path": str(path)},
@@ -188,7 +235,7 @@ class ParquetRepository:
         strategy_id: str,
         run_id: str,
         run_date: datetime,
-        equity_curve: Sequence[Record],
+        equity_curve: Sequence[Mapping[str, Any]],
         trades: Sequence[Record],
     ) -> Dict[str, Path]:
         path = self.manager.path_for(
@@ -266,13 +313,8 @@ class ParquetRepository:
             freq=strategy_id,
             timestamp=timestamp,
         )
-        combined = self._merge_existing(
-            path,
-            normalized,
-            subset=("order_id",),
-            sort_key="created_at",
-        )
-        self._write_table(path, combined)
+        table = self._table_from_records(normalized, _TRADING_ORDERS_SCHEMA)
+        self._merge_write_table(path, table, key="order_id", sort_key="created_at")
         _LOGGER.info(
             "已写入交易订单",
             extra={
@@ -299,13 +341,8 @@ class ParquetRepository:
             freq=strategy_id,
             timestamp=timestamp,
         )
-        combined = self._merge_existing(
-            path,
-            normalized,
-            subset=("trade_id",),
-            sort_key="timestamp",
-        )
-        self._write_table(path, combined)
+        table = self._table_from_records(normalized, _TRADING_TRADES_SCHEMA)
+        self._merge_write_table(path, table, key="trade_id", sort_key="timestamp")
         _LOGGER.info(
             "已写入交易成交",
             extra={
@@ -316,13 +353,75 @@ class ParquetRepository:
             },
         )
 
+    def write_trading_orders_columnar(
+        self,
+        session_id: str,
+        strategy_id: str,
+        timestamp: datetime,
+        columns: Columns,
+    ) -> None:
+        """以列式结构写入交易订单，字段需与订单 schema 对齐。"""
+
+        rows = self._write_columnar(
+            DatasetKind.TRADING_ORDERS,
+            session_id,
+            strategy_id,
+            timestamp,
+            columns,
+            schema=_TRADING_ORDERS_SCHEMA,
+            key="order_id",
+            sort_key="created_at",
+        )
+        if rows:
+            _LOGGER.info(
+                "已写入交易订单",
+                extra={"session_id": session_id, "strategy_id": strategy_id, "rows": rows},
+            )
+
+    def write_trading_trades_columnar(
+        self,
+        session_id: str,
+        strategy_id: str,
+        timestamp: datetime,
+        columns: Columns,
+    ) -> None:
+        """以列式结构写入成交记录，字段需与成交 schema 对齐。"""
+
+        rows = self._write_columnar(
+            DatasetKind.TRADING_TRADES,
+            session_id,
+            strategy_id,
+            timestamp,
+            columns,
+            schema=_TRADING_TRADES_SCHEMA,
+            key="trade_id",
+            sort_key="timestamp",
+        )
+        if rows:
+            _LOGGER.info(
+                "已写入交易成交",
+                extra={"session_id": session_id, "strategy_id": strategy_id, "rows": rows},
+            )
+
     def write_trading_equity(
         self,
         session_id: str,
         strategy_id: str,
         snapshot: Record,
     ) -> None:
-        normalized = self._ensure_datetime_field([snapshot], "timestamp")
+        self.write_trading_equity_many(session_id, strategy_id, [snapshot])
+
+    def write_trading_equity_many(
+        self,
+        session_id: str,
+        strategy_id: str,
+        snapshots: Sequence[Record],
+    ) -> None:
+        """批量写入权益快照，整批只构建一次 Arrow 表并合并写入一次文件。"""
+
+        if not snapshots:
+            return
+        normalized = self._ensure_datetime_field(snapshots, "timestamp")
         timestamp = normalized[0]["timestamp"]
         path = self.manager.path_for(
             DatasetKind.TRADING_EQUITY,
@@ -330,22 +429,39 @@ class ParquetRepository:
             freq=strategy_id,
             timestamp=timestamp,
         )
-        combined = self._merge_existing(
-            path,
-            normalized,
-            subset=("timestamp",),
-            sort_key="timestamp",
-        )
-        self._write_table(path, combined)
+        table = self._table_from_records(normalized)
+        self._merge_write_table(path, table, key="timestamp", sort_key="timestamp")
         _LOGGER.info(
             "已写入交易权益",
             extra={
                 "session_id": session_id,
                 "strategy_id": strategy_id,
+                "rows": len(normalized),
                 "path": str(path),
             },
         )
 
+    def write_trading_tick(
+        self,
+        session_id: str,
+        strategy_id: str,
+        timestamp: datetime,
+        *,
+        orders_columns: Columns,
+        trades_columns: Columns,
+        equity_snapshots: Sequence[Record],
+    ) -> None:
+        """依次写入同一交易日的订单、成交与权益快照。
+
+        三个数据集分别合并写入各自的文件，彼此之间不是原子操作：中途失败时，
+        已写入的订单可能缺少对应的成交或权益记录。权益快照合并后只读写一次文件，
+        避免逐条追加时的重复读写。
+        """
+
+        self.write_trading_orders_columnar(session_id, strategy_id, timestamp, orders_columns)
+        self.write_trading_trades_columnar(session_id, strategy_id, timestamp, trades_columns)
+        self.write_trading_equity_many(session_id, strategy_id, equity_snapshots)
+
     def write_trading_run_summary(
         self,
         *,
@@ -359,13 +475,8 @@ class ParquetRepository:
             symbol=strategy_id,
             freq=session_id,
         )
-        combined = self._merge_existing(
-            path,
-            normalized,
-            subset=("timestamp",),
-            sort_key="timestamp",
-        )
-        self._write_table(path, combined)
+        table = self._table_from_records(normalized)
+        self._merge_write_table(path, table, key="timestamp", sort_key="timestamp")
         _LOGGER.info(
             "已写入交易历史摘要",
             extra={
@@ -409,6 +520,90 @@ class ParquetRepository:
         combined = sorted(combined, key=lambda record: record.get(sort_key))
         return combined
 
+    def _write_columnar(
+        self,
+        kind: DatasetKind,
+        session_id: str,
+        strategy_id: str,
+        timestamp: datetime,
+        columns: Columns,
+        *,
+        schema: pa.Schema,
+        key: str,
+        sort_key: str,
+    ) -> int:
+        """按 schema 构建 Arrow 表并与已有文件合并，返回新写入的行数。"""
+
+        table = pa.Table.from_pydict(dict(columns), schema=schema)
+        if table.num_rows == 0:
+            return 0
+        path = self.manager.path_for(
+            kind,
+            symbol=session_id,
+            freq=strategy_id,
+            timestamp=timestamp,
+        )
+        self._merge_write_table(path, table, key=key, sort_key=sort_key)
+        return table.num_rows
+
+    @staticmethod
+    def _table_from_records(
+        records: Sequence[Record],
+        schema: Optional[pa.Schema] = None,
+    ) -> pa.Table:
+        """将记录转换为 Arrow 表；字段与 schema 吻合时跳过逐值类型推断。"""
+
+        if schema is not None:
+            names = set(schema.names)
+            if all(names.issuperset(record) for record in records):
+                try:
+                    return pa.Table.from_pylist(list(records), schema=schema)
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    pass  # 字段类型与 schema 不一致时回退为类型推断
+        return pa.Table.from_pylist(list(records))
+
+    def _resolve_write_options(self, defaults: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        """合并写入参数：数据集默认值 < 配置中的压缩算法 < 实例级 ``write_options``。"""
+
+        options: Dict[str, Any] = dict(defaults or {})
+        compression = get_settings().data_store.parquet_compression.strip().lower()
+        if compression:
+            options["compression"] = None if compression == "none" else compression
+        if self.write_options:
+            options.update(self.write_options)
+        return options
+
+    def _merge_write_table(self, path: Path, table: pa.Table, *, key: str, sort_key: str) -> None:
+        """在 Arrow 层合并已有文件与新数据，按键去重、排序后整体写回。
+
+        新数据优先：已有文件中与新数据同键的行通过 ``is_in`` 哈希过滤剔除，
+        只需对新批次内部做去重，无需在合并后的整表上再次去重。
+        """
+
+        incoming = ParquetRepository._dedupe_keep_last(table, key)
+        combined = incoming
+        if path.exists():
+            existing = pq.read_table(path)
+            stale = pc.is_in(existing.column(key), value_set=incoming.column(key).combine_chunks())
+            existing = existing.filter(pc.invert(stale))
+            combined = pa.concat_tables([existing, incoming], promote_options="permissive")
+        combined = combined.take(pc.sort_indices(combined, sort_keys=[(sort_key, "ascending")]))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(combined, path, **self._resolve_write_options())
+
+    @staticmethod
+    def _dedupe_keep_last(table: pa.Table, key: str) -> pa.Table:
+        """与 drop_duplicates 保持一致：同键保留最后一条记录。"""
+
+        column = table.column(key)
+        if pc.count_distinct(column, mode="all").as_py() == table.num_rows:
+            return table
+        positions: Dict[Any, int] = {}
+        for index, value in enumerate(column.to_pylist()):
+            positions[value] = index
+        keep = sorted(positions.values())
+        return table.take(pa.array(keep, type=pa.int64()))
+
     @staticmethod
     def _ensure_datetime_field(records: Sequence[Record], field: str) -> List[Record]:
         normalized: List[Record] = []
@@ -425,11 +620,10 @@ class ParquetRepository:
             normalized.append({**record, field: dt_value})
         return normalized
 
-    @staticmethod
-    def _write_table(path: Path, records: Sequence[Record]) -> None:
+    def _write_table(self, path: Path, records: Sequence[Mapping[str, Any]], **options: Any) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         table = pa.Table.from_pylist(list(records))
-        pq.write_table(table, path)
+        pq.write_table(table, path, **self._resolve_write_options(options))
 
     @staticmethod
     def _group_by_symbol(records: Sequence[Record]) -> Dict[str, List[Record]]:
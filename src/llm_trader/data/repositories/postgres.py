@@ -5,11 +5,27 @@ from __future__ import annotations
 """
 
 from collections import defaultdict
-from datetime import datetime
-from typing import Dict, Iterable, List, Optional, Sequence
+from datetime import date, datetime
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    cast,
+)
 
-from sqlalchemy import select
-from sqlmodel import Session
+from pydantic import BeforeValidator, ConfigDict, TypeAdapter, with_config
+from sqlalchemy import FromClause, Row, Table, delete, func, insert, inspect, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, SQLModel
+from typing_extensions import TypedDict
 
 from llm_trader.db.models import (
     AccountPosition,
@@ -20,39 +36,104 @@ from llm_trader.db.models import (
 from llm_trader.db.models.enums import RiskPosture
 
 
+def _safe_float(value: object) -> Optional[float]:
+    """宽松解析数值，空值或无法解析的取值（如行情源的 ``'-'`` 占位）记为 ``None``。"""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+
+
+def _safe_date(value: object) -> object:
+    """宽松解析日期，``datetime`` 取日期部分，无法解析的字符串记为 ``None``。"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value.strip()[:10])
+        except ValueError:
+            return None
+    return value
+
+
+def _table(model: Type[SQLModel]) -> Table:
+    """返回模型映射的数据表，供 Core 语句直接引用列。"""
+    return cast(Table, inspect(model, raiseerr=True).local_table)
+
+
+_LenientFloat = Annotated[Optional[float], BeforeValidator(_safe_float)]
+_LenientDate = Annotated[Optional[date], BeforeValidator(_safe_date)]
+
+
+@with_config(ConfigDict(coerce_numbers_to_str=True))
+class _MasterSymbolRow(TypedDict):
+    """证券主表写入行，字段与 ``master_symbols`` 列一一对应。"""
+
+    symbol: str
+    exchange: str
+    board: str
+    name: str
+    is_st: bool
+    list_date: _LenientDate
+    industry: Optional[str]
+    market_cap: _LenientFloat
+    float_cap: _LenientFloat
+    pe_ttm: _LenientFloat
+    pb: _LenientFloat
+    tick_size: float
+    lot_size: int
+    trading_status: str
+    as_of_date: _LenientDate
+    version: int
+
+
 class PostgresDataRepository:
     """封装对 SQLModel Session 的数据访问。"""
 
+    # 整批校验并转换主表行，替代逐字段的 str/bool/float/int 调用；
+    # 估值与日期字段宽松解析，单个脏值只置空该字段，不拒绝整批
+    _SYMBOLS_ADAPTER: TypeAdapter[List[_MasterSymbolRow]] = TypeAdapter(List[_MasterSymbolRow])
+    # 支持 ``ON CONFLICT DO UPDATE`` 的方言及其 insert 构造函数，其余方言回退为逐行合并
+    _UPSERT_INSERTS: Dict[str, Callable[[Table], Any]] = {
+        "postgresql": pg_insert,
+        "sqlite": sqlite_insert,
+    }
+    # 单条批量写入语句的最大行数，超出后分段执行以控制参数列表占用的内存
+    _UPSERT_CHUNK_SIZE = 10_000
+
     def __init__(self, session: Session) -> None:
         self.session = session
 
     # -- Master Symbols -------------------------------------------------
     def upsert_master_symbols(self, records: Sequence[Dict[str, object]]) -> int:
         """写入证券主表，存在时覆盖。"""
-        affected = 0
-        for record in records:
-            symbol = str(record["symbol"])
-            instance = MasterSymbol(
-                symbol=symbol,
-                exchange=str(record.get("exchange") or "") or "UNKNOWN",
-                board=str(record.get("board") or "") or "未知",
-                name=str(record.get("name") or symbol),
-                is_st=bool(record.get("is_st", False)),
-                list_date=record.get("listed_date"),
-                industry=record.get("industry"),
-                market_cap=record.get("market_cap"),
-                float_cap=record.get("float_cap"),
-                pe_ttm=record.get("pe_ttm"),
-                pb=record.get("pb"),
-                tick_size=float(record.get("tick_size", 0.01) or 0.01),
-                lot_size=int(record.get("lot_size", 100) or 100),
-                trading_status=str(record.get("status") or "active"),
-                as_of_date=record.get("as_of_date"),
-                version=int(record.get("version") or 1),
-            )
-            self.session.merge(instance)
-            affected += 1
-        return affected
+        # 这里只做字段改名与缺省值填充，类型转换交给 TypeAdapter 一次性完成
+        rows = self._SYMBOLS_ADAPTER.validate_python(
+            [
+                {
+                    "symbol": record["symbol"],
+                    "exchange": record.get("exchange") or "UNKNOWN",
+                    "board": record.get("board") or "未知",
+                    "name": record.get("name") or record["symbol"],
+                    "is_st": record.get("is_st") or False,
+                    "list_date": record.get("listed_date"),
+                    "industry": record.get("industry"),
+                    "market_cap": record.get("market_cap"),
+                    "float_cap": record.get("float_cap"),
+                    "pe_ttm": record.get("pe_ttm"),
+                    "pb": record.get("pb"),
+                    "tick_size": record.get("tick_size") or 0.01,
+                    "lot_size": record.get("lot_size") or 100,
+                    "trading_status": record.get("status") or "active",
+                    "as_of_date": record.get("as_of_date"),
+                    "version": record.get("version") or 1,
+                }
+                for record in records
+            ]
+        )
+        return self._bulk_upsert(MasterSymbol, rows, key="symbol")
 
     def list_active_symbols(self, *, limit: Optional[int] = None) -> List[str]:
         """返回活跃证券列表。"""
@@ -79,30 +160,28 @@ class PostgresDataRepository:
     # -- Realtime Quotes ------------------------------------------------
     def upsert_realtime_quotes(self, records: Sequence[Dict[str, object]]) -> int:
         """写入实时行情。"""
-        affected = 0
+        rows: List[Dict[str, object]] = []
         for record in records:
-            symbol = str(record["symbol"])
-            snapshot_time = record.get("snapshot_time") or datetime.utcnow()
-            quote = RealtimeQuote(
-                symbol=symbol,
-                name=record.get("name"),
-                last_price=self._safe_float(record.get("last_price")),
-                change=self._safe_float(record.get("change")),
-                change_ratio=self._safe_float(record.get("change_ratio")),
-                volume=self._safe_float(record.get("volume")),
-                amount=self._safe_float(record.get("amount")),
-                high=self._safe_float(record.get("high")),
-                low=self._safe_float(record.get("low")),
-                open=self._safe_float(record.get("open")),
-                prev_close=self._safe_float(record.get("prev_close")),
-                turnover_rate=self._safe_float(record.get("turnover_rate")),
-                amplitude=self._safe_float(record.get("amplitude")),
-                pe=self._safe_float(record.get("pe")),
-                snapshot_time=snapshot_time,
+            rows.append(
+                {
+                    "symbol": str(record["symbol"]),
+                    "name": record.get("name"),
+                    "last_price": _safe_float(record.get("last_price")),
+                    "change": _safe_float(record.get("change")),
+                    "change_ratio": _safe_float(record.get("change_ratio")),
+                    "volume": _safe_float(record.get("volume")),
+                    "amount": _safe_float(record.get("amount")),
+                    "high": _safe_float(record.get("high")),
+                    "low": _safe_float(record.get("low")),
+                    "open": _safe_float(record.get("open")),
+                    "prev_close": _safe_float(record.get("prev_close")),
+                    "turnover_rate": _safe_float(record.get("turnover_rate")),
+                    "amplitude": _safe_float(record.get("amplitude")),
+                    "pe": _safe_float(record.get("pe")),
+                    "snapshot_time": record.get("snapshot_time") or datetime.utcnow(),
+                }
             )
-            self.session.merge(quote)
-            affected += 1
-        return affected
+        return self._bulk_upsert(RealtimeQuote, rows, key="symbol")
 
     def get_latest_quotes(self, symbols: Iterable[str]) -> Dict[str, RealtimeQuote]:
         """返回指定标的的最新行情。"""
@@ -135,21 +214,23 @@ class PostgresDataRepository:
         )
         self.session.add(snapshot)
 
-        existing_positions = self.session.exec(
-            select(AccountPosition).where(AccountPosition.captured_at == captured_at)
-        ).all()
-        for row in existing_positions:
-            self.session.delete(row)
-
-        for record in positions:
-            position = AccountPosition(
-                captured_at=captured_at,
-                symbol=str(record["symbol"]),
-                qty=float(record.get("qty", 0.0)),
-                avg_price=self._safe_float(record.get("avg_price")),
-                market_value=self._safe_float(record.get("market_value")),
-            )
-            self.session.add(position)
+        positions_table = _table(AccountPosition)
+        self.session.execute(
+            delete(positions_table).where(positions_table.c.captured_at == captured_at)
+        )
+        rows = [
+            {
+                "captured_at": captured_at,
+                "symbol": str(record["symbol"]),
+                "qty": float(record.get("qty", 0.0)),
+                "avg_price": _safe_float(record.get("avg_price")),
+                "market_value": _safe_float(record.get("market_value")),
+            }
+            for record in positions
+        ]
+        if rows:
+            # 单条语句 + 参数列表，由驱动走 executemany 批量写入
+            self.session.execute(insert(positions_table), rows)
 
     def latest_account_snapshot(self) -> Optional[AccountSnapshot]:
         """获取最新账户资金快照。"""
@@ -168,32 +249,66 @@ class PostgresDataRepository:
         return {row.symbol: row for row in rows}
 
     # -- Utilities -----------------------------------------------------
-    @staticmethod
-    def _safe_float(value: object) -> Optional[float]:
-        if value is None or value == "":
-            return None
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return None
+    def _bulk_upsert(
+        self, model: Type[SQLModel], rows: Sequence[Mapping[str, object]], *, key: str
+    ) -> int:
+        """以单条 ``INSERT ... ON CONFLICT DO UPDATE`` 语句批量写入。
+
+        参数列表整体交给 ``session.execute``，SQLAlchemy 会按方言的参数上限分批执行，
+        避免逐行 ``merge`` 带来的查询与往返开销；不支持冲突子句的方言回退为逐行合并。
+        同一批内重复的键只保留最后一行，否则 PostgreSQL 会拒绝在一条语句中重复更新同一行。
+        """
+        if not rows:
+            return 0
+        rows = list({row[key]: row for row in rows}.values())
+        dialect_insert = self._UPSERT_INSERTS.get(self.session.get_bind().dialect.name)
+        if dialect_insert is None:
+            for row in rows:
+                self.session.merge(model(**row))
+            return len(rows)
+
+        statement = dialect_insert(_table(model))
+        statement = statement.on_conflict_do_update(
+            index_elements=[key],
+            set_={column: statement.excluded[column] for column in rows[0] if column != key},
+        )
+        chunk_size = self._UPSERT_CHUNK_SIZE
+        for start in range(0, len(rows), chunk_size):
+            self.session.execute(statement, rows[start : start + chunk_size])
+        return len(rows)
 
     def to_position_payload(self) -> List[Dict[str, object]]:
-        """返回最新持仓的序列化结果，主要给观测构建使用。"""
-        positions = self.latest_positions()
-        latest_quote_map = self.get_latest_quotes(positions.keys())
-        payload: List[Dict[str, object]] = []
-        for symbol, position in positions.items():
-            quote = latest_quote_map.get(symbol)
-            payload.append(
-                {
-                    "symbol": symbol,
-                    "qty": position.qty,
-                    "avg_price": position.avg_price,
-                    "market_value": position.market_value,
-                    "last_price": quote.last_price if quote else None,
-                }
+        """返回最新持仓的序列化结果，主要给观测构建使用。
+
+        以单条 ``LEFT JOIN`` 查询直接取所需列，不加载 ORM 实体。
+        """
+        positions_table = _table(AccountPosition)
+        snapshots_table = _table(AccountSnapshot)
+        quotes_table = _table(RealtimeQuote)
+        latest_captured = select(func.max(snapshots_table.c.captured_at)).scalar_subquery()
+        statement = (
+            select(
+                positions_table.c.symbol,
+                positions_table.c.qty,
+                positions_table.c.avg_price,
+                positions_table.c.market_value,
+                quotes_table.c.last_price,
             )
-        return payload
+            .select_from(
+                positions_table.outerjoin(quotes_table, quotes_table.c.symbol == positions_table.c.symbol)
+            )
+            .where(positions_table.c.captured_at == latest_captured)
+        )
+        payload: Dict[str, Dict[str, object]] = {}
+        for symbol, qty, avg_price, market_value, last_price in self.session.execute(statement):
+            payload[symbol] = {
+                "symbol": symbol,
+                "qty": qty,
+                "avg_price": avg_price,
+                "market_value": market_value,
+                "last_price": last_price,
+            }
+        return list(payload.values())
 
     def to_universe_features(
         self,
@@ -201,40 +316,77 @@ class PostgresDataRepository:
         symbols: Sequence[str],
         include_quotes: bool = True,
     ) -> Dict[str, Dict[str, object]]:
-        """根据标的列表构建观测特征。"""
+        """根据标的列表构建观测特征。
+
+        主表与行情通过一次 ``LEFT JOIN`` 查询取回所需列，逐行组装特征，
+        避免分别加载两组 ORM 实体后再按代码匹配。
+        """
         universe = list(dict.fromkeys(symbols))
         if not universe:
             return {}
-        master_map = self.get_master_symbol_map(universe)
-        quotes_map = self.get_latest_quotes(universe) if include_quotes else {}
+        master_table = _table(MasterSymbol)
+        quotes_table = _table(RealtimeQuote)
+        columns = [master_table.c.symbol, master_table.c.trading_status, master_table.c.is_st]
+        source: FromClause = master_table
+        if include_quotes:
+            columns += [
+                quotes_table.c.last_price,
+                quotes_table.c.prev_close,
+                quotes_table.c.change_ratio,
+                quotes_table.c.volume,
+                quotes_table.c.amount,
+                quotes_table.c.turnover_rate,
+            ]
+            source = master_table.outerjoin(quotes_table, quotes_table.c.symbol == master_table.c.symbol)
+        statement = select(*columns).select_from(source).where(master_table.c.symbol.in_(universe))
+
+        rows: Dict[str, Row[Any]] = {row[0]: row for row in self.session.execute(statement)}
         features: Dict[str, Dict[str, object]] = {}
         for symbol in universe:
-            master = master_map.get(symbol)
-            quote = quotes_map.get(symbol)
-            if not master:
+            row = rows.get(symbol)
+            if row is None:
                 continue
-            last_price = quote.last_price if quote else None
-            prev_close = quote.prev_close if quote else None
-            change_ratio = quote.change_ratio if quote else None
-            ret_5m = None
-            if change_ratio is not None:
-                ret_5m = change_ratio / 100.0
+            trading_status, is_st = row[1], row[2]
+            last_price, prev_close, change_ratio, volume, amount, turnover_rate = (
+                row[3:] if include_quotes else (None,) * 6
+            )
             features[symbol] = {
                 "last": last_price,
                 "prev_close": prev_close,
-                "ret_5m": ret_5m,
-                "volume": quote.volume if quote else None,
-                "turnover": quote.amount if quote else None,
-                "turnover_rate": quote.turnover_rate if quote else None,
-                "risk_flags": self._build_risk_flags(master),
+                "ret_5m": change_ratio / 100.0 if change_ratio is not None else None,
+                "volume": volume,
+                "turnover": amount,
+                "turnover_rate": turnover_rate,
+                "risk_flags": self._risk_flags(trading_status, is_st),
             }
         return features
 
+    def get_market_rules(self, symbols: Iterable[str]) -> Dict[str, Dict[str, object]]:
+        """返回指定标的的交易规则（最小变动价位、交易单位），只查询所需列。"""
+        symbol_list = list(symbols)
+        if not symbol_list:
+            return {}
+        master_table = _table(MasterSymbol)
+        statement = select(
+            master_table.c.symbol,
+            master_table.c.tick_size,
+            master_table.c.lot_size,
+        ).where(master_table.c.symbol.in_(symbol_list))
+        return {
+            symbol: {
+                "tick_size": tick_size,
+                "lot_size": lot_size,
+                "price_band": {"up": None, "down": None},
+            }
+            for symbol, tick_size, lot_size in self.session.execute(statement)
+        }
+
     @staticmethod
-    def _build_risk_flags(master: MasterSymbol) -> List[str]:
+    def _risk_flags(trading_status: Optional[str], is_st: bool) -> List[str]:
         flags: List[str] = []
-        if master.trading_status and master.trading_status.lower() != "active":
-            flags.append(master.trading_status.lower())
-        if master.is_st:
+        if trading_status and trading_status.lower() != "active":
+            flags.append(trading_status.lower())
+        if is_st:
             flags.append("st")
         return flags
+
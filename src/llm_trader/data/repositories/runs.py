@@ -0,0 +1,55 @@
+"""交易历史摘要的存储实现。"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Tuple
+
+import pandas as pd
+import pyarrow as pa
+
+from llm_trader.data import DatasetKind
+from llm_trader.data.repositories.parquet import ParquetRepository
+
+
+class ParquetRunsSink:
+    """默认的交易历史摘要存储，写入数据目录下的 ``runs.parquet``。"""
+
+    def write(self, strategy_id: str, session_id: str, record: Dict[str, Any]) -> None:
+        # 每次写入时按当前配置解析数据目录
+        ParquetRepository().write_trading_run_summary(
+            strategy_id=strategy_id,
+            session_id=session_id,
+            record=record,
+        )
+
+    def read(self, strategy_id: str, session_id: str) -> pd.DataFrame:
+        path = ParquetRepository().manager.path_for(
+            DatasetKind.TRADING_RUNS,
+            symbol=strategy_id,
+            freq=session_id,
+        )
+        if not path.exists():
+            return pd.DataFrame()
+        return pd.read_parquet(path)
+
+
+class InMemoryRunsSink:
+    """内存中的交易历史摘要存储，以 Arrow 表保存记录，跳过 Parquet 编解码，主要用于测试。"""
+
+    def __init__(self) -> None:
+        self._tables: Dict[Tuple[str, str], pa.Table] = {}
+
+    def write(self, strategy_id: str, session_id: str, record: Dict[str, Any]) -> None:
+        key = (strategy_id, session_id)
+        table = pa.Table.from_pylist([record])
+        existing = self._tables.get(key)
+        if existing is not None:
+            table = pa.concat_tables([existing, table], promote_options="default")
+        self._tables[key] = table
+
+    def read(self, strategy_id: str, session_id: str) -> pd.DataFrame:
+        table = self._tables.get((strategy_id, session_id))
+        return pd.DataFrame() if table is None else table.to_pandas()
+
+
+__all__ = ["InMemoryRunsSink", "ParquetRunsSink"]
@@ -9,11 +9,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Mapping, Optional
+from string import Formatter
+from typing import Dict, FrozenSet, Mapping, Optional, Tuple
 
 from llm_trader.common import data_store_dir
 
@@ -37,6 +38,14 @@ class DatasetKind(str, Enum):
     STRATEGY_PROMPTS = "strategy_prompts"
 
 
+def _template_fields(template: Optional[str]) -> FrozenSet[str]:
+    """解析模板中的占位符名称。"""
+
+    if not template:
+        return frozenset()
+    return frozenset(name for _, name, _, _ in Formatter().parse(template) if name)
+
+
 @dataclass(frozen=True)
 class DatasetConfig:
     """单个数据集的存储配置。"""
@@ -47,6 +56,32 @@ class DatasetConfig:
     partition_template: Optional[str] = None
     description: str = ""
 
+    # 模板占位符与静态分区只在构造时解析一次；不参与比较与展示，也不影响 pickle
+    _partition_fields: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _filename_fields: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _static_partition: Optional[Path] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        partition_fields = _template_fields(self.partition_template)
+        object.__setattr__(self, "_partition_fields", partition_fields)
+        object.__setattr__(self, "_filename_fields", _template_fields(self.filename_template))
+        object.__setattr__(
+            self,
+            "_static_partition",
+            Path(self.partition_template or "") if not partition_fields else None,
+        )
+
+    def build_path_parts(
+        self,
+        symbol: Optional[str] = None,
+        freq: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> Tuple[str, str]:
+        """返回 ``(分区相对路径, 文件名)``，缺少模板变量时抛出 ``ValueError``。"""
+
+        context = self.build_context(symbol=symbol, freq=freq, timestamp=timestamp)
+        return str(self.render_partition(context)), self.render_filename(context)
+
     def build_context(
         self,
         symbol: Optional[str],
@@ -61,19 +96,20 @@ class DatasetConfig:
         if freq:
             context["freq"] = freq
         if timestamp:
-            context["date"] = timestamp.strftime("%Y%m%d")
-            context["year"] = timestamp.strftime("%Y")
-            context["month"] = timestamp.strftime("%m")
-            context["day"] = timestamp.strftime("%d")
+            date_text = timestamp.strftime("%Y%m%d")
+            context["date"] = date_text
+            context["year"] = date_text[:4]
+            context["month"] = date_text[4:6]
+            context["day"] = date_text[6:]
         return context
 
     def render_partition(self, context: Mapping[str, str]) -> Path:
         """根据上下文渲染分区路径。"""
 
-        if not self.partition_template:
-            return Path()
+        if self._static_partition is not None:
+            return self._static_partition
         try:
-            return Path(self.partition_template.format(**context))
+            return Path((self.partition_template or "").format_map(context))
         except KeyError as exc:  # pragma: no cover - 仅在配置错误时触发
             missing = exc.args[0]
             raise ValueError(f"缺少分区模板所需变量：{missing}") from exc
@@ -81,8 +117,10 @@ class DatasetConfig:
     def render_filename(self, context: Mapping[str, str]) -> str:
         """根据上下文渲染文件名。"""
 
+        if not self._filename_fields:
+            return self.filename_template
         try:
-            return self.filename_template.format(**context)
+            return self.filename_template.format_map(context)
         except KeyError as exc:  # pragma: no cover - 仅在配置错误时触发
             missing = exc.args[0]
             raise ValueError(f"缺少文件名模板所需变量：{missing}") from exc
@@ -121,14 +159,12 @@ class DataStoreManager:
         """生成指定数据集的文件路径。"""
 
         config = self.get(kind)
-        context = config.build_context(symbol=symbol, freq=freq, timestamp=timestamp)
-        partition = config.render_partition(context)
+        partition, filename = config.build_path_parts(symbol, freq, timestamp)
         directory = self.base_dir / config.relative_dir / partition
 
         if ensure_dir:
             directory.mkdir(parents=True, exist_ok=True)
 
-        filename = config.render_filename(context)
         return directory / filename
 
     def directory_for(self, kind: DatasetKind | str) -> Path:
@@ -140,133 +176,117 @@ class DataStoreManager:
         return directory
 
 
+# 默认数据集配置为不可变对象，模块加载时构建一次，各管理器实例共享
+_DEFAULT_DATASETS: Tuple[DatasetConfig, ...] = (
+    DatasetConfig(
+        kind=DatasetKind.SYMBOLS,
+        relative_dir="metadata",
+        filename_template="symbols.parquet",
+        description="证券主表元数据",
+    ),
+    DatasetConfig(
+        kind=DatasetKind.TRADING_CALENDAR,
+        relative_dir="metadata",
+        filename_template="trading_calendar.parquet",
+        description="交易日历数据",
+    ),
+    DatasetConfig(
+        kind=DatasetKind.OHLCV_DAILY,
+        relative_dir="ohlcv/daily",
+        partition_template="freq={freq}/symbol={symbol}/year={year}/month={month}",
+        filename_template="{date}.parquet",
+        description="日线行情数据",
+    ),
+    DatasetConfig(
+        kind=DatasetKind.OHLCV_INTRADAY,
+        relative_dir="ohlcv/intraday",
+        partition_template="freq={freq}/symbol={symbol}/date={date}",
+        filename_template="{symbol}_{freq}.parquet",
+        description="分钟线行情数据",
+    ),
+    DatasetConfig(
+        kind=DatasetKind.FUNDAMENTALS,
+        relative_dir="fundamentals",
+        partition_template="symbol={symbol}/year={year}",
+        filename_template="{symbol}_{year}.parquet",
+        description="基础指标与财务摘要",
+    ),
+    DatasetConfig(
+        kind=DatasetKind.STRATEGY_SIGNALS,
+        relative_dir="strategies/signals",
+        partition_template="strategy={symbol}/version={freq}",
+        filename_template="signals.parquet",
+        description="策略信号输出（symbol=策略ID，freq=版本号）",
+    ),
+    DatasetConfig(
+        kind=DatasetKind.BACKTEST_RESULTS,
+        relative_dir="backtests",
+        partition_template="strategy={symbol}/run_date={date}",
+        filename_template="result.parquet",
+        description="回测结果集（symbol=策略ID）",
+    ),
+    DatasetConfig(
+        kind=DatasetKind.REALTIME_QUOTES,
+        relative_dir="realtime/quotes",
+        partition_template="date={date}",
+        filename_template="quotes_{symbol}_{year}{month}{day}.parquet",
+        description="实时行情快照",
+    ),
+    DatasetConfig(
+        kind=DatasetKind.TRADING_ORDERS,
+        relative_dir="trading/orders",
+        partition_template="session={symbol}/strategy={freq}/date={date}",
+        filename_template="orders.parquet",
+        description="自动交易订单流水",
+    ),
+    DatasetConfig(
+        kind=DatasetKind.TRADING_TRADES,
+        relative_dir="trading/trades",
+        partition_template="session={symbol}/strategy={freq}/date={date}",
+        filename_template="trades.parquet",
+        description="自动交易成交流水",
+    ),
+    DatasetConfig(
+        kind=DatasetKind.TRADING_EQUITY,
+        relative_dir="trading/equity",
+        partition_template="session={symbol}/strategy={freq}",
+        filename_template="equity.parquet",
+        description="自动交易权益曲线与资金快照",
+    ),
+    DatasetConfig(
+        kind=DatasetKind.TRADING_RUNS,
+        relative_dir="trading/runs",
+        partition_template="strategy={symbol}/session={freq}",
+        filename_template="runs.parquet",
+        description="自动交易循环历史摘要",
+    ),
+    DatasetConfig(
+        kind=DatasetKind.STRATEGY_LLM_LOGS,
+        relative_dir="strategies/llm_logs",
+        partition_template="strategy={symbol}/session={freq}/date={date}",
+        filename_template="logs.jsonl",
+        description="LLM 策略提示与响应记录",
+    ),
+    DatasetConfig(
+        kind=DatasetKind.STRATEGY_PROMPTS,
+        relative_dir="prompts/templates",
+        filename_template="{symbol}.txt",
+        description="可编辑提示词模板（symbol=模板名称）",
+    ),
+)
+
+
+_DEFAULT_REGISTRY: Dict[str, DatasetConfig] = {
+    (config.kind.value if isinstance(config.kind, DatasetKind) else str(config.kind)): config
+    for config in _DEFAULT_DATASETS
+}
+
+
 def default_manager(base_dir: Optional[Path] = None) -> DataStoreManager:
     """返回带默认配置的存储管理器。"""
 
     manager = DataStoreManager(base_dir=base_dir)
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.SYMBOLS,
-            relative_dir="metadata",
-            filename_template="symbols.parquet",
-            description="证券主表元数据",
-        )
-    )
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.TRADING_CALENDAR,
-            relative_dir="metadata",
-            filename_template="trading_calendar.parquet",
-            description="交易日历数据",
-        )
-    )
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.OHLCV_DAILY,
-            relative_dir="ohlcv/daily",
-            partition_template="freq={freq}/symbol={symbol}/year={year}/month={month}",
-            filename_template="{date}.parquet",
-            description="日线行情数据",
-        )
-    )
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.OHLCV_INTRADAY,
-            relative_dir="ohlcv/intraday",
-            partition_template="freq={freq}/symbol={symbol}/date={date}",
-            filename_template="{symbol}_{freq}.parquet",
-            description="分钟线行情数据",
-        )
-    )
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.FUNDAMENTALS,
-            relative_dir="fundamentals",
-            partition_template="symbol={symbol}/year={year}",
-            filename_template="{symbol}_{year}.parquet",
-            description="基础指标与财务摘要",
-        )
-    )
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.STRATEGY_SIGNALS,
-            relative_dir="strategies/signals",
-            partition_template="strategy={symbol}/version={freq}",
-            filename_template="signals.parquet",
-            description="策略信号输出（symbol=策略ID，freq=版本号）",
-        )
-    )
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.BACKTEST_RESULTS,
-            relative_dir="backtests",
-            partition_template="strategy={symbol}/run_date={date}",
-            filename_template="result.parquet",
-            description="回测结果集（symbol=策略ID）",
-        )
-    )
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.REALTIME_QUOTES,
-            relative_dir="realtime/quotes",
-            partition_template="date={date}",
-            filename_template="quotes_{symbol}_{year}{month}{day}.parquet",
-            description="实时行情快照",
-        )
-    )
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.TRADING_ORDERS,
-            relative_dir="trading/orders",
-            partition_template="session={symbol}/strategy={freq}/date={date}",
-            filename_template="orders.parquet",
-            description="自动交易订单流水",
-        )
-    )
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.TRADING_TRADES,
-            relative_dir="trading/trades",
-            partition_template="session={symbol}/strategy={freq}/date={date}",
-            filename_template="trades.parquet",
-            description="自动交易成交流水",
-        )
-    )
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.TRADING_EQUITY,
-            relative_dir="trading/equity",
-            partition_template="session={symbol}/strategy={freq}",
-            filename_template="equity.parquet",
-            description="自动交易权益曲线与资金快照",
-        )
-    )
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.TRADING_RUNS,
-            relative_dir="trading/runs",
-            partition_template="strategy={symbol}/session={freq}",
-            filename_template="runs.parquet",
-            description="自动交易循环历史摘要",
-        )
-    )
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.STRATEGY_LLM_LOGS,
-            relative_dir="strategies/llm_logs",
-            partition_template="strategy={symbol}/session={freq}/date={date}",
-            filename_template="logs.jsonl",
-            description="LLM 策略提示与响应记录",
-        )
-    )
-    manager.register(
-        DatasetConfig(
-            kind=DatasetKind.STRATEGY_PROMPTS,
-            relative_dir="prompts/templates",
-            filename_template="{symbol}.txt",
-            description="可编辑提示词模板（symbol=模板名称）",
-        )
-    )
+    manager._configs.update(_DEFAULT_REGISTRY)
     return manager
 
 
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from llm_trader.common.serialization import dumps
 from llm_trader.db.models.enums import ModelRole
 from llm_trader.model_gateway import ModelGateway
 from llm_trader.model_gateway.service import GatewayResponse
-from .schema import ActorDecisionPayload, CheckerResultPayload, ObservationSnapshot
+from .schema import (
+    ActorDecisionPayload,
+    CheckerResultPayload,
+    ObservationSnapshot,
+    extract_json_object,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from llm_trader.observation.service import ObservationPayload
@@ -78,16 +83,16 @@ class CheckerService:
     def _snapshot_dict(self, observation: "ObservationPayload" | Dict[str, Any]) -> Dict[str, Any]:
         to_dict = getattr(observation, "to_dict", None)
         if callable(to_dict):
+            # ObservationBuilder 产出的快照由我们自己构建且已可 JSON 序列化，跳过重复校验
             return to_dict()
-        return observation
+        return ObservationSnapshot.model_validate(observation).model_dump(mode="json")
 
     def _build_messages(
         self,
-        observation: Dict[str, Any],
+        observation_payload: Dict[str, Any],
         decision: Dict[str, Any],
         context: CheckerContext,
     ) -> list[Dict[str, str]]:
-        observation_payload = ObservationSnapshot.model_validate(observation).model_dump(mode="json")
         envelope = {
             "session": context.session_id,
             "strategy": context.strategy_id,
@@ -97,7 +102,7 @@ class CheckerService:
         }
         return [
             {"role": "system", "content": self._system_prompt},
-            {"role": "user", "content": json.dumps(envelope, ensure_ascii=False)},
+            {"role": "user", "content": dumps(envelope, default=str)},
         ]
 
     def _extract_message_content(self, response: GatewayResponse) -> str:
@@ -108,7 +113,7 @@ class CheckerService:
             raise ValueError("模型返回格式异常，缺少 message.content") from exc
         if not isinstance(content, str) or not content.strip():
             raise ValueError("模型返回内容为空")
-        return content
+        return extract_json_object(content)
 
 
 __all__ = ["CheckerService", "CheckerContext"]
@@ -2,10 +2,31 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime
 from typing import Dict, List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
+
+# 动作校验用到的常量，避免每次校验重复构建集合与字典
+_ORDER_ACTION_TYPES = frozenset({"place_order", "modify_order"})
+_TARGETED_ACTION_TYPES = frozenset({"modify_order", "cancel_order"})
+_ORDER_REQUIRED_FIELDS = ("symbol", "side", "order_type", "qty")
+
+# 模型偶尔在 JSON 外包裹 Markdown 代码块或说明文字，预编译提取用的正则
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_JSON_BLOCK_RE = re.compile(r"(\{.*\})", re.DOTALL)
+
+
+def extract_json_object(content: str) -> str:
+    """从模型输出中提取 JSON 对象文本；本身即为 JSON 对象时原样返回。"""
+
+    stripped = content.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        return stripped
+    match = _FENCE_RE.search(stripped) or _JSON_BLOCK_RE.search(stripped)
+    return match.group(1) if match else stripped
+
 
 
 class ObservationSnapshot(BaseModel):
@@ -40,22 +61,17 @@ class DecisionActionPayload(BaseModel):
 
     @model_validator(mode="after")
     def validate_action(self) -> "DecisionActionPayload":
-        if self.type in {"place_order", "modify_order"}:
-            missing = [
-                name
-                for name, value in {
-                    "symbol": self.symbol,
-                    "side": self.side,
-                    "order_type": self.order_type,
-                    "qty": self.qty,
-                }.items()
-                if value is None
-            ]
-            if missing:
-                raise ValueError(f"动作 {self.type} 缺失字段: {', '.join(missing)}")
+        # 每个动作都会执行一次：合法输入只做直接的 None 判断，缺失字段列表仅在出错时构建
+        action_type = self.type
+        if action_type == "no_op":
+            return self
+        if action_type in _ORDER_ACTION_TYPES:
+            if self.symbol is None or self.side is None or self.order_type is None or self.qty is None:
+                missing = [name for name in _ORDER_REQUIRED_FIELDS if getattr(self, name) is None]
+                raise ValueError(f"动作 {action_type} 缺失字段: {', '.join(missing)}")
             if self.order_type == "limit" and self.price is None:
                 raise ValueError("限价委托必须包含 price")
-        if self.type in {"modify_order", "cancel_order"} and not self.target_order_id:
+        if action_type in _TARGETED_ACTION_TYPES and not self.target_order_id:
             raise ValueError("改单/撤单动作必须提供 target_order_id")
         return self
 
@@ -71,14 +87,8 @@ class ActorDecisionPayload(BaseModel):
     account_view: Dict[str, float]
     global_intent: Optional[Dict[str, object]] = None
     notes: Optional[str] = Field(default=None, max_length=500)
-    actions: List[DecisionActionPayload] = Field(default_factory=list)
-
-    @field_validator("actions")
-    @classmethod
-    def ensure_actions(cls, actions: List[DecisionActionPayload]) -> List[DecisionActionPayload]:
-        if not actions:
-            raise ValueError("决策必须包含至少一个动作")
-        return actions
+    # 至少包含一个动作，长度约束由 pydantic-core 直接校验，无需 Python 层校验器
+    actions: List[DecisionActionPayload] = Field(default_factory=list, min_length=1)
 
 
 class CheckerResultPayload(BaseModel):
@@ -104,4 +114,5 @@ __all__ = [
     "DecisionActionPayload",
     "CheckerResultPayload",
     "ObservationSnapshot",
+    "extract_json_object",
 ]
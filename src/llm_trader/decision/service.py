@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
-from sqlmodel import Session, select
+from sqlalchemy import delete, insert
+from sqlmodel import Session
 
 from llm_trader.db.models import (
     CheckerResult,
@@ -73,6 +74,7 @@ class DecisionService:
         observation_id: str,
         payload: ActorDecisionPayload,
     ) -> Decision:
+        actions_table = DecisionAction.__table__
         existing = session.get(Decision, payload.decision_id)
         decision = existing or Decision(decision_id=payload.decision_id)
         decision.timestamp = payload.timestamp
@@ -95,14 +97,13 @@ class DecisionService:
             session.add(decision)
             session.flush()
         else:
-            # 清理旧的动作以避免重复
-            actions = session.exec(
-                select(DecisionAction).where(DecisionAction.decision_id == decision.decision_id)
-            ).all()
-            for action in actions:
-                session.delete(action)
+            # 清理旧的动作以避免重复，单条 DELETE 语句即可，无需逐个加载实例
             session.flush()
+            session.execute(
+                delete(actions_table).where(actions_table.c.decision_id == decision.decision_id)
+            )
 
+        action_rows: List[Dict[str, object]] = []
         for action_payload in payload.actions:
             if not action_payload.symbol or not action_payload.type:
                 continue
@@ -128,20 +129,24 @@ class DecisionService:
                     tif = OrderTimeInForce(action_payload.tif)
                 except ValueError:
                     tif = None
-            action = DecisionAction(
-                decision_id=decision.decision_id,
-                type=action_type,
-                symbol=action_payload.symbol,
-                side=side,
-                order_type=order_type,
-                price=action_payload.price,
-                qty=action_payload.qty,
-                tif=tif,
-                target_order_id=action_payload.target_order_id,
-                intent_rationale=action_payload.intent_rationale,
-                intent_confidence=action_payload.intent_confidence,
+            action_rows.append(
+                {
+                    "decision_id": decision.decision_id,
+                    "type": action_type.value,
+                    "symbol": action_payload.symbol,
+                    "side": side.value if side else None,
+                    "order_type": order_type.value if order_type else None,
+                    "price": action_payload.price,
+                    "qty": action_payload.qty,
+                    "tif": tif.value if tif else None,
+                    "target_order_id": action_payload.target_order_id,
+                    "intent_rationale": action_payload.intent_rationale,
+                    "intent_confidence": action_payload.intent_confidence,
+                }
             )
-            session.add(action)
+        if action_rows:
+            # 动作明细走单条语句 + 参数列表，由驱动批量执行，跳过逐实例的工作单元开销
+            session.execute(insert(actions_table), action_rows)
         session.flush()
         return decision
 
@@ -2,13 +2,24 @@ from __future__ import annotations
 
 """模型网关配置加载工具。"""
 
-from typing import Sequence
+import threading
+import time
+import weakref
+from typing import Sequence, Tuple
 
 from sqlmodel import select
 
 from llm_trader.db.models.config import ModelEndpoint
 from llm_trader.model_gateway.config import ModelEndpointSettings, ModelGatewaySettings
 
+# 数据库配置缓存的有效期（秒）；端点变更接口会调用 invalidate_gateway_settings 主动失效
+_SETTINGS_TTL_SECONDS = 60.0
+# 以 session_factory 为弱引用键，工厂被回收后缓存项随之释放，不会串用其它数据库的配置
+_SETTINGS_CACHE: "weakref.WeakKeyDictionary[object, Tuple[float, ModelGatewaySettings]]" = (
+    weakref.WeakKeyDictionary()
+)
+_SETTINGS_LOCK = threading.Lock()
+
 
 def build_gateway_settings_from_records(
     records: Sequence[ModelEndpoint],
@@ -45,19 +56,50 @@ def build_gateway_settings_from_records(
             default_model=settings.default_model,
             audit_enabled=settings.audit_enabled,
             endpoints=endpoints,
+            hedge_delay_ms=settings.hedge_delay_ms,
         )
     return settings
 
 
-def load_gateway_settings(session_factory) -> ModelGatewaySettings:
-    """从数据库加载模型网关配置，失败时回退到默认配置。"""
+def load_gateway_settings(session_factory, *, use_cache: bool = True) -> ModelGatewaySettings:
+    """从数据库加载模型网关配置，失败时回退到默认配置。
+
+    成功读取的结果按 ``session_factory`` 缓存 ``_SETTINGS_TTL_SECONDS`` 秒；
+    回退的默认配置不缓存，数据库恢复后下一次调用即可读到真实配置。
+    """
 
+    now = time.monotonic()
+    if use_cache:
+        with _SETTINGS_LOCK:
+            cached = _cache_get(session_factory)
+        if cached is not None and cached[0] > now:
+            return cached[1]
     try:
         with session_factory() as session:
             result = session.exec(select(ModelEndpoint)).all()
     except Exception:
         return _default_settings()
-    return build_gateway_settings_from_records(result)
+    settings = build_gateway_settings_from_records(result)
+    with _SETTINGS_LOCK:
+        try:
+            _SETTINGS_CACHE[session_factory] = (now + _SETTINGS_TTL_SECONDS, settings)
+        except TypeError:  # pragma: no cover - 不支持弱引用的工厂不缓存
+            pass
+    return settings
+
+
+def invalidate_gateway_settings() -> None:
+    """清空配置缓存，端点增删改后调用。"""
+
+    with _SETTINGS_LOCK:
+        _SETTINGS_CACHE.clear()
+
+
+def _cache_get(session_factory) -> Tuple[float, ModelGatewaySettings] | None:
+    try:
+        return _SETTINGS_CACHE.get(session_factory)
+    except TypeError:  # pragma: no cover - 不支持弱引用的工厂
+        return None
 
 
 def _default_settings() -> ModelGatewaySettings:
@@ -66,4 +108,8 @@ def _default_settings() -> ModelGatewaySettings:
     return get_settings().model_gateway
 
 
-__all__ = ["build_gateway_settings_from_records", "load_gateway_settings"]
+__all__ = [
+    "build_gateway_settings_from_records",
+    "invalidate_gateway_settings",
+    "load_gateway_settings",
+]
@@ -2,16 +2,20 @@ from __future__ import annotations
 
 """模型网关核心服务，实现 OpenAI 兼容转发与调用审计。"""
 
-import json
+import hashlib
+import importlib.util
 import logging
 import random
+import threading
 import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import httpx
+from llm_trader.common.serialization import dumps, loads
 from llm_trader.db.models import LLMCallAudit
 from llm_trader.db.models.enums import ModelRole
 from llm_trader.db.session import create_session_factory
@@ -19,6 +23,20 @@ from llm_trader.model_gateway.config import ModelEndpointSettings, ModelGatewayS
 from llm_trader.model_gateway.loader import load_gateway_settings
 LOGGER = logging.getLogger("llm_trader.model_gateway")
 
+# 同一网关实例复用长连接，避免每次调用重新建立 TCP/TLS；安装 h2 时启用 HTTP/2 多路复用
+_DEFAULT_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _prompt_hash(messages: object) -> str:
+    """计算提示词摘要：键排序后的紧凑 JSON 经 BLAKE2b 取 128 位十六进制。"""
+
+    try:
+        serialised = dumps(messages, default=str, sort_keys=True)
+    except (TypeError, ValueError):
+        serialised = dumps(str(messages))
+    return hashlib.blake2b(serialised.encode("utf-8"), digest_size=16).hexdigest()
+
 
 @dataclass
 class EndpointStats:
@@ -51,6 +69,9 @@ class ModelGateway:
         if session_factory is None:
             session_factory = create_session_factory()
         self._session_factory = session_factory
+        # 对冲调用共用的线程池，首次对冲时创建；线程按需启动，close 时等待落后的请求结束
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
         if settings is None:
             resolved_settings = load_gateway_settings(self._session_factory)
         else:
@@ -58,13 +79,23 @@ class ModelGateway:
         self._settings = resolved_settings
         self._stats: Dict[str, EndpointStats] = {endpoint.name: EndpointStats() for endpoint in resolved_settings.endpoints}
         timeout = self._max_timeout(resolved_settings)
-        self._client = client or httpx.Client(timeout=timeout or 30.0)
+        self._client = client or httpx.Client(
+            timeout=timeout or 30.0,
+            limits=_DEFAULT_LIMITS,
+            http2=_HTTP2_AVAILABLE,
+        )
 
     @property
     def settings(self) -> ModelGatewaySettings:
         return self._settings
 
     def close(self) -> None:
+        """等待对冲调用遗留的请求结束后再关闭 http 客户端，避免其在已关闭的客户端上发送。"""
+
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
         try:
             self._client.close()
         except Exception:  # pragma: no cover - 关闭异常不影响主流程
@@ -91,6 +122,15 @@ class ModelGateway:
         request_body = dict(payload)
         request_body["model"] = request_model
         attempts = self._weighted_attempts(endpoints)
+        hedge_delay_ms = self._settings.hedge_delay_ms
+        if hedge_delay_ms and len(attempts) > 1:
+            return self._hedged_completions(
+                attempts,
+                request_body,
+                role=role,
+                decision_id=decision_id,
+                hedge_delay=hedge_delay_ms / 1000.0,
+            )
         last_exception: Optional[Exception] = None
         for endpoint in attempts:
             if not self._is_endpoint_available(endpoint):
@@ -128,6 +168,82 @@ class ModelGateway:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _hedged_completions(
+        self,
+        attempts: List[ModelEndpointSettings],
+        request_body: Dict[str, object],
+        *,
+        role: ModelRole,
+        decision_id: Optional[str],
+        hedge_delay: float,
+    ) -> GatewayResponse:
+        """对冲调用：当前端点超过 ``hedge_delay`` 秒未返回或失败时并发启动下一个端点，取最先成功的结果。
+
+        请求在网关共用的线程池中复用同一个 httpx 客户端；熔断统计与审计只在调用线程中更新。
+        """
+
+        candidates = iter([endpoint for endpoint in attempts if self._is_endpoint_available(endpoint)])
+        executor = self._hedge_executor()
+        pending: Dict[Future, ModelEndpointSettings] = {}
+
+        def launch_next() -> None:
+            endpoint = next(candidates, None)
+            if endpoint is not None:
+                pending[executor.submit(self._timed_invoke, endpoint, request_body)] = endpoint
+
+        last_exception: Optional[Exception] = None
+        try:
+            launch_next()
+            while pending:
+                done, _ = wait(pending, timeout=hedge_delay, return_when=FIRST_COMPLETED)
+                if not done:
+                    launch_next()
+                    continue
+                for future in done:
+                    endpoint = pending.pop(future)
+                    try:
+                        response_json, latency_ms = future.result()
+                    except Exception as exc:  # pragma: no cover - 失败时尝试其它端点
+                        LOGGER.warning(
+                            "模型端点调用失败，将尝试下一个端点",
+                            extra={"endpoint": endpoint.name, "error": str(exc)},
+                        )
+                        self._record_failure(endpoint, exc)
+                        last_exception = exc
+                        launch_next()
+                        continue
+                    self._record_success(endpoint)
+                    self._record_audit(
+                        endpoint=endpoint,
+                        payload=request_body,
+                        response=response_json,
+                        role=role,
+                        decision_id=decision_id,
+                        latency_ms=latency_ms,
+                    )
+                    return GatewayResponse(payload=response_json, endpoint=endpoint, latency_ms=latency_ms)
+        finally:
+            # 落后的请求不再等待，其结果直接丢弃；尚未开始的请求取消，已开始的由 close 等待结束
+            for future in pending:
+                future.cancel()
+        if last_exception is None:
+            raise RuntimeError("模型网关没有可用端点")
+        raise last_exception
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # 默认上限足以容纳并发调用各自的对冲请求，线程只在需要时启动
+                self._executor = ThreadPoolExecutor(thread_name_prefix="model-gateway")
+            return self._executor
+
+    def _timed_invoke(
+        self, endpoint: ModelEndpointSettings, request_body: Dict[str, object]
+    ) -> Tuple[Dict[str, object], int]:
+        start = time.perf_counter()
+        response_json = self._invoke_endpoint(endpoint, request_body)
+        return response_json, int((time.perf_counter() - start) * 1000)
+
     def _invoke_endpoint(self, endpoint: ModelEndpointSettings, request_body: Dict[str, object]) -> Dict[str, object]:
         url = f"{endpoint.base_url.rstrip('/')}/v1/chat/completions"
         headers = {"Content-Type": "application/json"}
@@ -144,9 +260,9 @@ class ModelGateway:
             if isinstance(extra_params, dict):
                 payload.update(extra_params)
         payload.update(request_body)
-        response = self._client.post(url, json=payload, headers=headers, timeout=endpoint.timeout)
+        response = self._client.post(url, content=dumps(payload), headers=headers, timeout=endpoint.timeout)
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
     def _weighted_attempts(self, endpoints: Iterable[ModelEndpointSettings]) -> List[ModelEndpointSettings]:
         weighted: List[ModelEndpointSettings] = []
@@ -218,12 +334,7 @@ class ModelGateway:
         prompt_tokens = int(usage.get("prompt_tokens", 0) or 0)
         completion_tokens = int(usage.get("completion_tokens", 0) or 0)
         total_cost = self._estimate_cost(endpoint, prompt_tokens, completion_tokens)
-        messages = payload.get("messages", [])
-        try:
-            serialised_messages = json.dumps(messages, ensure_ascii=False, sort_keys=True)
-        except (TypeError, ValueError):
-            serialised_messages = json.dumps(str(messages), ensure_ascii=False)
-        prompt_hash = uuid.uuid5(uuid.NAMESPACE_OID, serialised_messages).hex
+        prompt_hash = _prompt_hash(payload.get("messages", []))
         trace_id = uuid.uuid4().hex
         with self._session_factory() as session:
             audit = LLMCallAudit(
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import sys
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Optional, TextIO
+
+from llm_trader.common.serialization import dumps
 
 
 class AlertChannel:
@@ -22,15 +23,26 @@ class AlertEmitter:
     channel: str = AlertChannel.LOG
 
     def emit(self, message: str, *, details: Optional[Dict[str, object]] = None) -> None:
-        payload = {"alert_message": message, "details": details or {}}
+        details = details or {}
         if self.channel == AlertChannel.LOG:
-            logging.getLogger("monitoring.alert").warning(message, extra=payload)
+            # LogRecord 保留了 message 字段，extra 中改用 alert_message
+            logging.getLogger("monitoring.alert").warning(
+                message, extra={"alert_message": message, "details": details}
+            )
         elif self.channel == AlertChannel.STDOUT:
-            print(json.dumps(payload, ensure_ascii=False))
+            self._write(sys.stdout, message, details)
         elif self.channel == AlertChannel.STDERR:  # pragma: no cover - rarely used
-            print(json.dumps(payload, ensure_ascii=False), file=sys.stderr)
+            self._write(sys.stderr, message, details)
         else:  # pragma: no cover - 扩展渠道
-            logging.getLogger("monitoring.alert").error("Unsupported alert channel", extra=payload)
+            logging.getLogger("monitoring.alert").error(
+                "Unsupported alert channel", extra={"alert_message": message, "details": details}
+            )
+
+    @staticmethod
+    def _write(stream: TextIO, message: str, details: Dict[str, object]) -> None:
+        """整行一次写出 JSON；时间等非原生类型转为字符串，避免告警因序列化失败丢失。"""
+
+        stream.write(dumps({"message": message, "details": details}, default=str) + "\n")
 
 
 __all__ = ["AlertEmitter", "AlertChannel"]
@@ -4,11 +4,11 @@ from __future__ import annotations
 观测构建服务：聚合主表、行情、账户与风险信息，写入 Observation 表。
 """
 
-import json
 import uuid
+import zlib
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta, timezone
 from sys import version_info
 from typing import Any, Callable, ContextManager, Dict, List, Optional, Sequence
 
@@ -17,6 +17,7 @@ from redis import Redis
 from sqlmodel import Session
 
 from llm_trader.common import get_logger
+from llm_trader.common.serialization import dumps, loads
 from llm_trader.data.repositories.postgres import PostgresDataRepository
 from llm_trader.db.models import Observation
 from llm_trader.db.models.enums import ClockPhase, RiskPosture
@@ -28,6 +29,17 @@ SessionFactory = Callable[[], ContextManager[Session]]
 
 _DATACLASS_ARGS = {"slots": True} if version_info >= (3, 10) else {}
 
+# 观测缓存以 zlib 压缩后的 JSON 字节写入 Redis；压缩流首字节固定为 0x78，可与明文 JSON 区分
+_CACHE_COMPRESS_LEVEL = 1
+_ZLIB_HEADER = 0x78
+
+# A 股交易时段边界（北京时间），模块加载时构建一次
+_MARKET_TZ = pendulum.timezone("Asia/Shanghai")
+_MORNING_OPEN = time(9, 30)
+_LUNCH_START = time(11, 30)
+_AFTERNOON_OPEN = time(13, 0)
+_MARKET_CLOSE = time(15, 0)
+
 
 @dataclass(**_DATACLASS_ARGS)
 class ObservationPayload:
@@ -45,9 +57,18 @@ class ObservationPayload:
     risk_snapshot: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
+        data = self._fields()
+        data["generated_at"] = self.generated_at.isoformat()
+        return data
+
+    def to_json(self) -> str:
+        # generated_at 与行情中的 numpy 数值交由 orjson 原生序列化，default 仅兜底少见类型
+        return dumps(self._fields(), default=str)
+
+    def _fields(self) -> Dict[str, Any]:
         return {
             "observation_id": self.observation_id,
-            "generated_at": self.generated_at.isoformat(),
+            "generated_at": self.generated_at,
             "valid_ttl_ms": self.valid_ttl_ms,
             "clock": self.clock,
             "account": self.account,
@@ -58,9 +79,6 @@ class ObservationPayload:
             "risk_snapshot": self.risk_snapshot,
         }
 
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict(), ensure_ascii=False, default=str)
-
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ObservationPayload":
         generated_at_raw = data.get("generated_at")
@@ -143,7 +161,7 @@ class ObservationBuilder:
                 observation_id=observation_id,
                 generated_at=generated_at,
                 valid_ttl_ms=self._valid_ttl_ms,
-                clock={"phase": self._detect_clock_phase()},
+                clock={"phase": self._detect_clock_phase(generated_at)},
                 account=account_payload,
                 positions=positions_payload,
                 universe=universe,
@@ -179,8 +197,19 @@ class ObservationBuilder:
             return
         ttl_seconds = max(int(self._valid_ttl_ms / 1000), 1)
         key = f"observation:{payload.observation_id}"
-        self._redis.setex(name=key, time=ttl_seconds, value=payload.to_json())
-        self._redis.setex(name=self._latest_cache_key, time=ttl_seconds, value=payload.to_json())
+        # 两个键共用同一份序列化结果，只编码一次
+        value = self._encode_cache_value(payload)
+        self._redis.setex(name=key, time=ttl_seconds, value=value)
+        self._redis.setex(name=self._latest_cache_key, time=ttl_seconds, value=value)
+
+    def _encode_cache_value(self, payload: ObservationPayload) -> bytes | str:
+        """序列化观测；客户端开启 decode_responses 时保留明文，否则压缩以减少传输字节。"""
+
+        text = payload.to_json()
+        pool = getattr(self._redis, "connection_pool", None)
+        if pool is not None and pool.connection_kwargs.get("decode_responses"):
+            return text
+        return zlib.compress(text.encode("utf-8"), _CACHE_COMPRESS_LEVEL)
 
     def _load_cached(self) -> Optional[ObservationPayload]:
         if not self._redis:
@@ -189,7 +218,9 @@ class ObservationBuilder:
         if not raw:
             return None
         try:
-            data = json.loads(raw)
+            if isinstance(raw, (bytes, bytearray)) and raw[:1] == bytes([_ZLIB_HEADER]):
+                raw = zlib.decompress(raw)
+            data = loads(raw)
             payload = ObservationPayload.from_dict(data)
         except Exception:  # pragma: no cover - 缓存损坏直接忽略
             return None
@@ -209,33 +240,18 @@ class ObservationBuilder:
         repo: PostgresDataRepository,
         symbols: Sequence[str],
     ) -> Dict[str, Dict[str, Any]]:
-        master_map = repo.get_master_symbol_map(symbols)
-        rules: Dict[str, Dict[str, Any]] = {}
-        for symbol, master in master_map.items():
-            rules[symbol] = {
-                "tick_size": master.tick_size,
-                "lot_size": master.lot_size,
-                "price_band": {
-                    "up": None,
-                    "down": None,
-                },
-            }
-        return rules
-
-    def _detect_clock_phase(self) -> ClockPhase:
-        """根据北京时间推断交易时钟阶段。"""
-        now = pendulum.now("Asia/Shanghai")
-        morning_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-        lunch_start = now.replace(hour=11, minute=30, second=0, microsecond=0)
-        afternoon_open = now.replace(hour=13, minute=0, second=0, microsecond=0)
-        close = now.replace(hour=15, minute=0, second=0, microsecond=0)
-
-        if now < morning_open:
+        return repo.get_market_rules(symbols)
+
+    def _detect_clock_phase(self, generated_at: datetime) -> ClockPhase:
+        """根据观测生成时刻（UTC）换算北京时间，推断交易时钟阶段。"""
+        now = generated_at.replace(tzinfo=timezone.utc).astimezone(_MARKET_TZ).time()
+
+        if now < _MORNING_OPEN:
             return ClockPhase.PRE_OPEN
-        if morning_open <= now <= lunch_start:
+        if _MORNING_OPEN <= now <= _LUNCH_START:
             return ClockPhase.CONTINUOUS_TRADING
-        if lunch_start < now < afternoon_open:
+        if _LUNCH_START < now < _AFTERNOON_OPEN:
             return ClockPhase.OFF_MARKET
-        if afternoon_open <= now <= close:
+        if _AFTERNOON_OPEN <= now <= _MARKET_CLOSE:
             return ClockPhase.CONTINUOUS_TRADING
         return ClockPhase.CLOSE
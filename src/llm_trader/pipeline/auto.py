@@ -15,7 +15,7 @@ from llm_trader.backtest import BacktestRunner, Order
 from llm_trader.backtest.models import OrderSide
 from llm_trader.config import get_settings
 from llm_trader.common import get_logger
-from llm_trader.data.repositories.parquet import ParquetRepository
+from llm_trader.data.repositories.runs import InMemoryRunsSink, ParquetRunsSink
 from llm_trader.reports import ReportBuilder, ReportPayload, ReportWriter, load_report_payload
 from llm_trader.trading import TradingCycleConfig, run_managed_trading_cycle
 from llm_trader.trading.manager import ManagedTradingResult
@@ -193,19 +193,23 @@ __all__ = [
     "BacktestCriteria",
     "AutoTradingConfig",
     "AutoTradingResult",
+    "InMemoryRunsSink",
+    "ParquetRunsSink",
     "record_trading_run_summary",
     "run_full_automation",
 ]
 
 
+_default_runs_sink = ParquetRunsSink()
+
+
 def record_trading_run_summary(
     config: TradingCycleConfig,
     managed: ManagedTradingResult,
     status: str,
 ) -> None:
-    """将单次交易循环的核心信息写入历史摘要。"""
+    """将单次交易循环的核心信息写入历史摘要（默认 ``runs.parquet``，见 ``_default_runs_sink``）。"""
 
-    repo = ParquetRepository()
     raw = managed.raw_result or {}
     suggestion = raw.get("suggestion")
     if suggestion is not None:
@@ -245,11 +249,7 @@ def record_trading_run_summary(
         "objective": config.objective,
         "indicators": json.dumps(list(config.indicators), ensure_ascii=False),
     }
-    repo.write_trading_run_summary(
-        strategy_id=config.strategy_id,
-        session_id=config.session_id,
-        record=record,
-    )
+    _default_runs_sink.write(config.strategy_id, config.session_id, record)
 
 
 def _main() -> None:  # pragma: no cover - 简易 CLI
@@ -7,7 +7,7 @@ import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
 
 from apscheduler.schedulers.background import BackgroundScheduler
 
@@ -39,15 +39,31 @@ def load_scheduler_config(path: Path | str) -> SchedulerConfig:
     return SchedulerConfig(timezone=raw.get("timezone"), jobs=jobs)
 
 
-def start_scheduler_from_dict(data: Dict[str, Any]) -> BackgroundScheduler:
+def start_scheduler_from_dict(
+    data: Dict[str, Any],
+    *,
+    start: bool = True,
+    clock: Callable[[], datetime] = datetime.utcnow,
+) -> BackgroundScheduler:
     config = SchedulerConfig(
         timezone=data.get("timezone"),
         jobs=[JobConfig(**item) for item in data.get("jobs", [])],
     )
-    return start_scheduler_from_config(config)
+    return start_scheduler_from_config(config, start=start, clock=clock)
+
+
+def start_scheduler_from_config(
+    config: SchedulerConfig,
+    *,
+    start: bool = True,
+    clock: Callable[[], datetime] = datetime.utcnow,
+) -> BackgroundScheduler:
+    """按配置注册任务并启动调度器。
 
+    ``start=False`` 时只注册不启动，便于测试直接同步调用任务；
+    ``clock`` 决定一次性（date）任务的触发时间，可注入固定时钟。
+    """
 
-def start_scheduler_from_config(config: SchedulerConfig) -> BackgroundScheduler:
     scheduler = BackgroundScheduler(timezone=config.timezone)
     for job_cfg in config.jobs:
         func = _resolve_callable(job_cfg.callable_path)
@@ -66,13 +82,14 @@ def start_scheduler_from_config(config: SchedulerConfig) -> BackgroundScheduler:
             scheduler.add_job(
                 func,
                 "date",
-                run_date=datetime.utcnow(),
+                run_date=clock(),
                 id=job_cfg.id,
                 kwargs=job_cfg.kwargs,
             )
         else:  # pragma: no cover - 仅在配置错误时触发
             raise ValueError(f"Unsupported trigger: {job_cfg.trigger}")
-    scheduler.start()
+    if start:
+        scheduler.start()
     return scheduler
 
 
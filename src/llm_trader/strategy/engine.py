@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import operator
 from dataclasses import dataclass
-from typing import Dict, List, Sequence
+from typing import Callable, Dict, List, Sequence
 
 import pandas as pd
 
 from llm_trader.strategy.library.indicators import get_indicator
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuleConfig:
+    """单条策略规则；不可变且使用 ``__slots__``，构造与比较只涉及五个字段。"""
+
     indicator: str
     column: str
     params: Dict[str, int | float]
@@ -19,35 +22,49 @@ class RuleConfig:
     threshold: float
 
 
+RuleMask = Callable[[pd.DataFrame], pd.Series]
+
+_COMPARATORS: Dict[str, Callable[[pd.Series, float], pd.Series]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "cross_up": lambda series, threshold: (series > threshold) & (series.shift(1) <= threshold),
+    "cross_down": lambda series, threshold: (series < threshold) & (series.shift(1) >= threshold),
+}
+
+
+def compile_rule(rule: RuleConfig) -> RuleMask:
+    """将规则预先解析为闭包：指标函数、参数与比较符只查找一次，调用时仅做列运算。"""
+
+    comparator = _COMPARATORS.get(rule.operator)
+    if comparator is None:
+        raise ValueError(f"不支持的比较符：{rule.operator}")
+    indicator_fn = get_indicator(rule.indicator)
+    params = dict(rule.params or {})
+    if rule.indicator == "ema" and "span" not in params and "window" in params:
+        params["span"] = params.pop("window")
+    column = rule.column
+    threshold = rule.threshold
+
+    def mask(df: pd.DataFrame) -> pd.Series:
+        return comparator(indicator_fn(df[column], **params), threshold)
+
+    return mask
+
+
 class StrategyEngine:
     def __init__(self, rules: Sequence[RuleConfig], long_only: bool = True) -> None:
         self.rules = list(rules)
         self.long_only = long_only
+        # 规则在构造时编译一次，同一引擎评估多个标的时复用
+        self._masks: List[RuleMask] = [compile_rule(rule) for rule in self.rules]
 
     def evaluate(self, df: pd.DataFrame) -> pd.DataFrame:
         working = df.copy()
         signals = pd.Series(True, index=working.index)
-        for idx, rule in enumerate(self.rules):
-            indicator_fn = get_indicator(rule.indicator)
-            params = dict(rule.params or {})
-            if rule.indicator == "ema" and "span" not in params and "window" in params:
-                params["span"] = params.pop("window")
-            series = indicator_fn(working[rule.column], **params)
-            op = rule.operator
-            if op == ">":
-                mask = series > rule.threshold
-            elif op == ">=":
-                mask = series >= rule.threshold
-            elif op == "<":
-                mask = series < rule.threshold
-            elif op == "<=":
-                mask = series <= rule.threshold
-            elif op == "cross_up":
-                mask = (series > rule.threshold) & (series.shift(1) <= rule.threshold)
-            elif op == "cross_down":
-                mask = (series < rule.threshold) & (series.shift(1) >= rule.threshold)
-            else:
-                raise ValueError(f"不支持的比较符：{op}")
+        for idx, rule_mask in enumerate(self._masks):
+            mask = rule_mask(working)
             signals = signals & mask.fillna(False)
             working[f"rule_{idx}"] = mask
         working["entry"] = signals
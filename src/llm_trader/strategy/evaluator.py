@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Dict, List
 from uuid import uuid4
@@ -37,7 +37,7 @@ def select_and_register_best(
             version_id=version_id,
             run_id=selected.metrics.get("run_id", version_id),
             created_at=datetime.utcnow(),
-            rules=[rule.__dict__ for rule in selected.rules],
+            rules=[asdict(rule) for rule in selected.rules],
             metrics=selected.metrics,
         )
     )
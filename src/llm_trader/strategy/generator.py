@@ -2,21 +2,40 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
+from datetime import datetime
 from itertools import product
-from typing import Dict, Iterable, List, Sequence
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
-from collections import defaultdict
-from datetime import datetime
-from typing import Dict, Iterable, List, Sequence
+from llm_trader.backtest import BacktestRunner, EquityRecord, Order, OrderSide
+from llm_trader.strategy.engine import RuleConfig
+from llm_trader.strategy.library.indicators import get_indicator
 
-import pandas as pd
+_IndicatorKey = Tuple[str, str, Tuple[Tuple[str, int | float], ...]]
+
+
+def _shift_down(values: np.ndarray) -> np.ndarray:
+    """沿时间轴下移一行，首行补 NaN，对应 ``Series.shift(1)``。"""
 
-from llm_trader.backtest import BacktestRunner, Order
-from llm_trader.strategy.engine import RuleConfig, StrategyEngine
-from llm_trader.strategy.signals import generate_orders_from_signals
+    shifted = np.empty_like(values)
+    shifted[0] = np.nan
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+# 与 engine._COMPARATORS 语义一致的矩阵版本：values 为 [n_bars, n_candidates]，thresholds 为 [n_candidates]
+_MATRIX_COMPARATORS: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "cross_up": lambda values, thresholds: (values > thresholds) & (_shift_down(values) <= thresholds),
+    "cross_down": lambda values, thresholds: (values < thresholds) & (_shift_down(values) >= thresholds),
+}
 
 
 @dataclass
@@ -34,7 +53,7 @@ class RuleSpace:
 class StrategyCandidate:
     rules: List[RuleConfig]
     metrics: Dict[str, float]
-    equity_curve: List[Dict[str, float]]
+    equity_curve: List[EquityRecord]
 
 
 @dataclass
@@ -56,18 +75,27 @@ class StrategyGenerator:
         df = pd.DataFrame(bars)
         df["dt"] = pd.to_datetime(df["dt"])
         symbols = df["symbol"].unique().tolist() if "symbol" in df.columns else ["AUTO"]
-
-        for combo in self._iter_rule_combinations(rule_spaces):
+        frames = {
+            symbol: (df[df["symbol"] == symbol] if "symbol" in df.columns else df).set_index("dt")
+            for symbol in symbols
+        }
+        combos = list(self._iter_rule_combinations(rule_spaces))
+        if not combos:
+            self.results = []
+            return self.results
+        # 每个标的一次性得到 [n_bars, n_candidates] 的信号矩阵，参数组合之间不再逐个跑 pandas 评估
+        signal_matrices = {
+            symbol: self._signal_matrix(symbol_df, combos) for symbol, symbol_df in frames.items()
+        }
+
+        for column, combo in enumerate(combos):
             orders_by_date: Dict[datetime, List[Order]] = defaultdict(list)
-            for symbol in symbols:
-                symbol_df = df[df["symbol"] == symbol].copy() if "symbol" in df.columns else df.copy()
-                symbol_df.set_index("dt", inplace=True)
-                engine = StrategyEngine(combo, long_only=self.long_only)
-                evaluated = engine.evaluate(symbol_df)
-                evaluated["symbol"] = symbol
-                orders = generate_orders_from_signals(evaluated, symbol=symbol)
-                for order in orders:
+            for symbol, symbol_df in frames.items():
+                for order in self._orders_from_signals(symbol_df, signal_matrices[symbol][:, column], symbol):
                     orders_by_date[order.created_at].append(order)
+            if not orders_by_date and self.min_trades > 0:
+                # 没有任何订单必然不产生成交，无需回测
+                continue
 
             result = self.runner.run(
                 bars,
@@ -90,6 +118,83 @@ class StrategyGenerator:
         self.results = candidates[: self.top_n]
         return self.results
 
+    def _signal_matrix(self, df: pd.DataFrame, combos: Sequence[List[RuleConfig]]) -> np.ndarray:
+        """批量计算全部候选的信号，语义与 ``StrategyEngine.evaluate`` 的 ``signal`` 列一致。
+
+        相同 ``(indicator, column, params)`` 的指标只计算一次，按候选堆叠成矩阵后
+        与阈值广播比较；返回 int8 矩阵，1 为入场、-1 为做空离场（仅 ``long_only=False``）。
+        """
+
+        n_bars = len(df)
+        indicator_cache: Dict[_IndicatorKey, np.ndarray] = {}
+        entry = np.ones((n_bars, len(combos)), dtype=bool)
+        depth = max(len(combo) for combo in combos)
+        for position in range(depth):
+            members = [idx for idx, combo in enumerate(combos) if len(combo) > position]
+            rules = [combos[idx][position] for idx in members]
+            values = np.column_stack([self._indicator_values(df, rule, indicator_cache) for rule in rules])
+            thresholds = np.array([rule.threshold for rule in rules], dtype=np.float64)
+            operators = np.array([rule.operator for rule in rules])
+            masks = np.zeros_like(values, dtype=bool)
+            for op in np.unique(operators):
+                comparator = _MATRIX_COMPARATORS.get(str(op))
+                if comparator is None:
+                    raise ValueError(f"不支持的比较符：{op}")
+                selected = operators == op
+                masks[:, selected] = comparator(values[:, selected], thresholds[selected])
+            entry[:, members] &= masks
+
+        previous = np.empty_like(entry)
+        previous[1:] = entry[:-1]
+        # 首行 shift 后为缺失值，与任意信号都视为“变化”
+        previous[:1] = ~entry[:1]
+        exit_ = (entry != previous) & ~entry
+        signals = np.zeros(entry.shape, dtype=np.int8)
+        signals[entry] = 1
+        if not self.long_only:
+            signals[exit_] = -1
+        return signals
+
+    @staticmethod
+    def _indicator_values(
+        df: pd.DataFrame,
+        rule: RuleConfig,
+        cache: Dict[_IndicatorKey, np.ndarray],
+    ) -> np.ndarray:
+        params = dict(rule.params or {})
+        if rule.indicator == "ema" and "span" not in params and "window" in params:
+            params["span"] = params.pop("window")
+        key: _IndicatorKey = (rule.indicator, rule.column, tuple(sorted(params.items())))
+        values = cache.get(key)
+        if values is None:
+            indicator_fn = get_indicator(rule.indicator)
+            values = indicator_fn(df[rule.column], **params).to_numpy(dtype=np.float64)
+            cache[key] = values
+        return values
+
+    @staticmethod
+    def _orders_from_signals(df: pd.DataFrame, signals: np.ndarray, symbol: str) -> List[Order]:
+        """仅遍历非零信号所在行生成订单，字段与 ``generate_orders_from_signals`` 默认参数一致。"""
+
+        price_column = "open" if "open" in df.columns else "close" if "close" in df.columns else None
+        prices = df[price_column].to_numpy(dtype=np.float64) if price_column else np.zeros(len(df))
+        orders: List[Order] = []
+        for row in np.flatnonzero(signals):
+            dt = df.index[row]
+            side = OrderSide.BUY if signals[row] == 1 else OrderSide.SELL
+            prefix = "buy" if side is OrderSide.BUY else "sell"
+            orders.append(
+                Order(
+                    order_id=f"{prefix}-{dt.isoformat()}",
+                    symbol=symbol,
+                    side=side,
+                    volume=100,
+                    price=float(prices[row]),
+                    created_at=dt if isinstance(dt, datetime) else datetime.fromisoformat(str(dt)),
+                )
+            )
+        return orders
+
     def _iter_rule_combinations(self, rule_spaces: Sequence[RuleSpace]) -> Iterable[List[RuleConfig]]:
         for space in rule_spaces:
             param_keys = list(space.params_grid.keys())
@@ -2,21 +2,108 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict
+import math
+from typing import Callable, Dict, Optional
 
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ModuleNotFoundError:  # pragma: no cover - 未安装 numba 时沿用 pandas 滚动实现
+    njit = None
+
+
+def _rolling_mean_kernel(values: np.ndarray, window: int) -> np.ndarray:
+    """滑动窗口求和的移动平均，前 ``window - 1`` 个位置为 NaN。"""
+
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    for i in range(n):
+        total += values[i]
+        if i >= window:
+            total -= values[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+    return out
+
+
+def _ema_kernel(values: np.ndarray, span: int) -> np.ndarray:
+    """``adjust=False`` 的指数平滑递推 ``y[i] = a * x[i] + (1 - a) * y[i - 1]``。"""
+
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    alpha = 2.0 / (span + 1.0)
+    current = 0.0
+    for i in range(n):
+        if i == 0:
+            current = values[0]
+        else:
+            current = alpha * values[i] + (1.0 - alpha) * current
+        if i >= span - 1:
+            out[i] = current
+    return out
+
+
+def _return_volatility_kernel(values: np.ndarray, window: int) -> np.ndarray:
+    """单次遍历计算收益率的滚动样本标准差（Welford 增删），与 ``pct_change().rolling().std()`` 对齐。"""
+
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    mean = 0.0
+    m2 = 0.0
+    count = 0
+    for i in range(1, n):
+        value = values[i] / values[i - 1] - 1.0
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+        if count > window:
+            old = values[i - window] / values[i - window - 1] - 1.0
+            count -= 1
+            old_mean = mean
+            mean -= (old - mean) / count
+            m2 -= (old - old_mean) * (old - mean)
+        if count == window and window > 1:
+            out[i] = math.sqrt(max(m2, 0.0) / (window - 1))
+    return out
+
+
+if njit is not None:
+    _rolling_mean_kernel = njit(cache=True)(_rolling_mean_kernel)
+    _ema_kernel = njit(cache=True)(_ema_kernel)
+    _return_volatility_kernel = njit(cache=True)(_return_volatility_kernel)
+
+
+def _kernel_input(series: pd.Series, window: int) -> Optional[np.ndarray]:
+    """满足编译内核前提（已安装 numba、窗口合法、无缺失值）时返回 float64 数组，否则返回 None。"""
+
+    if njit is None or window < 1:
+        return None
+    values = series.to_numpy(dtype=np.float64)
+    if np.isnan(values).any():
+        return None
+    return values
+
 
 def sma(series: pd.Series, window: int) -> pd.Series:
     """简单移动平均线。"""
 
-    return series.rolling(window=window, min_periods=window).mean()
+    values = _kernel_input(series, window)
+    if values is None:
+        return series.rolling(window=window, min_periods=window).mean()
+    return pd.Series(_rolling_mean_kernel(values, window), index=series.index, name=series.name)
 
 
 def ema(series: pd.Series, span: int) -> pd.Series:
     """指数移动平均线。"""
 
-    return series.ewm(span=span, adjust=False, min_periods=span).mean()
+    values = _kernel_input(series, span)
+    if values is None:
+        return series.ewm(span=span, adjust=False, min_periods=span).mean()
+    return pd.Series(_ema_kernel(values, span), index=series.index, name=series.name)
 
 
 def momentum(series: pd.Series, window: int) -> pd.Series:
@@ -35,7 +122,10 @@ def rate_of_change(series: pd.Series, window: int) -> pd.Series:
 def volatility(series: pd.Series, window: int) -> pd.Series:
     """滚动波动率。"""
 
-    return series.pct_change().rolling(window=window, min_periods=window).std()
+    values = _kernel_input(series, window)
+    if values is None or not values[:-1].all():
+        return series.pct_change().rolling(window=window, min_periods=window).std()
+    return pd.Series(_return_volatility_kernel(values, window), index=series.index, name=series.name)
 
 
 def volume_ratio(volume: pd.Series, window: int) -> pd.Series:
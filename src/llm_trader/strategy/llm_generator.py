@@ -10,10 +10,21 @@ from typing import Callable, List, Optional, Sequence
 from llm_trader.strategy.engine import RuleConfig
 from llm_trader.strategy.prompts import PromptTemplateManager
 
-try:  # pragma: no cover - 在测试中会通过依赖注入替代
-    from openai import OpenAI
-except Exception:  # pragma: no cover - 无 openai 依赖时
-    OpenAI = None  # type: ignore
+# openai SDK 导入开销较大，首次需要客户端时再加载；测试可直接替换该属性
+OpenAI = None
+
+
+def _resolve_openai():
+    """返回 OpenAI 客户端类，未安装 openai 时返回 None。"""
+
+    global OpenAI
+    if OpenAI is None:
+        try:  # pragma: no cover - 在测试中会通过依赖注入替代
+            from openai import OpenAI as client_cls
+        except Exception:  # pragma: no cover - 无 openai 依赖时
+            return None
+        OpenAI = client_cls
+    return OpenAI
 
 
 @dataclass
@@ -57,7 +68,8 @@ class LLMStrategyGenerator:
         self.last_prompt: Optional[str] = None
         self.last_raw_response: Optional[str] = None
         if completion_fn is None:
-            if OpenAI is None:
+            client_cls = _resolve_openai()
+            if client_cls is None:
                 raise RuntimeError("openai 库未安装，无法使用 LLMStrategyGenerator")
             resolved_key = api_key or os.getenv("OPENAI_API_KEY")
             if not resolved_key:
@@ -65,7 +77,7 @@ class LLMStrategyGenerator:
             client_kwargs = {"api_key": resolved_key}
             if base_url:
                 client_kwargs["base_url"] = base_url
-            self._client = OpenAI(**client_kwargs)  # type: ignore[arg-type]
+            self._client = client_cls(**client_kwargs)  # type: ignore[arg-type]
 
     def generate(self, context: LLMStrategyContext) -> LLMStrategySuggestion:
         prompt = self._build_prompt(context)
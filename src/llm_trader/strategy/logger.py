@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Optional
 
@@ -14,7 +14,7 @@ from llm_trader.data import DatasetKind, DataStoreManager, default_manager
 class LLMStrategyLogRepository:
     """负责记录 LLM 提示词与响应内容。"""
 
-    manager: DataStoreManager = default_manager()
+    manager: DataStoreManager = field(default_factory=default_manager)
 
     def append(
         self,
@@ -2,13 +2,14 @@
 
 from .policy import RiskPolicy, RiskThresholds, RiskDecision
 from .manager import ManagedTradingResult, run_managed_trading_cycle
-from .session import TradingSession, TradingSessionConfig
+from .session import TradingSession, TradingSessionConfig, safe_price_lookup
 from .orchestrator import TradingCycleConfig, run_ai_trading_cycle
 from .execution_adapters import create_execution_adapter
 
 __all__ = [
     "TradingSession",
     "TradingSessionConfig",
+    "safe_price_lookup",
     "TradingCycleConfig",
     "run_ai_trading_cycle",
     "create_execution_adapter",
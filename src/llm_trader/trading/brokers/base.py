@@ -21,7 +21,13 @@ class BrokerConfig:
 
 
 class BrokerClient(ABC):
-    """券商客户端抽象基类。"""
+    """券商客户端抽象基类。
+
+    ``ordered_trades`` 为 True 表示成交按提交顺序返回且与订单一一对应，
+    会话结算时可按位置匹配订单而无需构建索引。
+    """
+
+    ordered_trades: bool = False
 
     def __init__(self, config: BrokerConfig) -> None:
         self.config = config
@@ -13,6 +13,8 @@ from .base import BrokerClient, BrokerConfig
 class MockBrokerClient(BrokerClient):
     """基于行情价即时成交的模拟券商。"""
 
+    ordered_trades = True
+
     def __init__(self, config: BrokerConfig, price_lookup) -> None:
         super().__init__(config)
         self._price_lookup = price_lookup
@@ -66,7 +66,7 @@ def run_managed_trading_cycle(
         **kwargs,
     )
     session: TradingSession = result["session"]
-    equity_curve = session.account.equity_curve
+    equity_curve = session.account.equity_curve.to_records()
     positions = session.snapshot_positions()
     decision = policy.evaluate(equity_curve, positions)
     if decision_service and result.get("decision"):
@@ -30,7 +30,7 @@ from llm_trader.strategy.llm_generator import (
     LLMStrategySuggestion,
 )
 from llm_trader.trading.execution_adapters import create_execution_adapter
-from llm_trader.trading.session import TradingSession, TradingSessionConfig
+from llm_trader.trading.session import TradingSession, TradingSessionConfig, safe_price_lookup
 from llm_trader.data.pipelines.realtime_quotes import RealtimeQuotesPipeline
 from llm_trader.data.pipelines.symbols import SymbolsPipeline
 from llm_trader.data.repositories.parquet import ParquetRepository
@@ -382,6 +382,7 @@ def _build_price_lookup(
         if symbol and close:
             fallback_price[symbol] = float(close)
 
+    @safe_price_lookup
     def price_lookup(symbol: str, _side: OrderSide) -> float:
         if symbol in latest_price:
             return latest_price[symbol]
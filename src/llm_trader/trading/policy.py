@@ -6,7 +6,7 @@ import statistics
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from llm_trader.common import get_logger
 
@@ -46,7 +46,7 @@ class RiskPolicy:
 
     def evaluate(
         self,
-        equity_curve: List[Dict[str, object]],
+        equity_curve: Sequence[Mapping[str, object]],
         positions: List[Dict[str, object]],
     ) -> RiskDecision:
         alerts: List[str] = []
@@ -74,7 +74,7 @@ class RiskPolicy:
     def _default_alert(self, message: str, details: Dict[str, object]) -> None:
         self._logger.warning(message, extra={"details": details})
 
-    def _normalize_equity(self, equity_curve: List[Dict[str, object]]) -> List[Tuple[object, float]]:
+    def _normalize_equity(self, equity_curve: Sequence[Mapping[str, object]]) -> List[Tuple[object, float]]:
         series: List[Tuple[object, float]] = []
         for item in equity_curve:
             equity = item.get("equity")
@@ -7,20 +7,68 @@
 from __future__ import annotations
 
 import json
+import operator
+import queue
+import threading
+import weakref
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Callable, Dict, List, Optional, Sequence
+from datetime import date, datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from llm_trader.backtest.execution import ExecutionConfig, ExecutionEngine
 from llm_trader.backtest.models import Account, Order, OrderSide, Position, Trade
+from llm_trader.common import data_store_dir, get_logger
+from llm_trader.data import default_manager
 from llm_trader.data.repositories.parquet import ParquetRepository
 
 from .execution_adapters import ExecutionAdapter, SandboxExecutionAdapter
 from .brokers.base import BrokerClient
 
+try:
+    from numba import njit
+except ModuleNotFoundError:  # pragma: no cover - 未安装 numba 时使用 numpy 向量化实现
+    njit = None
+
 
 PriceLookup = Callable[[str, OrderSide], float]
+Columns = Dict[str, List[object]]
+PendingRecord = Tuple[datetime, Columns, Columns, Dict[str, object]]
+
+_ORDER_COLUMNS = (
+    "order_id",
+    "symbol",
+    "side",
+    "volume",
+    "price",
+    "status",
+    "filled_volume",
+    "filled_amount",
+    "created_at",
+)
+_TRADE_COLUMNS = (
+    "trade_id",
+    "order_id",
+    "symbol",
+    "side",
+    "volume",
+    "price",
+    "fee",
+    "tax",
+    "timestamp",
+)
+_ORDER_FIELDS = operator.attrgetter(*_ORDER_COLUMNS)
+_TRADE_FIELDS = operator.attrgetter(*_TRADE_COLUMNS)
+_SIDE_VALUES = {side: side.value for side in OrderSide}
 
+_LOGGER = get_logger("trading.session")
+_SAFE_LOOKUP_ATTR = "_llm_trader_safe"
+
+_DEFAULT_REPOSITORIES: Dict[Path, ParquetRepository] = {}
+_DEFAULT_REPOSITORY_LOCK = threading.Lock()
 
 @dataclass
 class TradingSessionConfig:
@@ -29,6 +77,80 @@ class TradingSessionConfig:
     session_id: str
     strategy_id: str
     initial_cash: float = 1_000_000.0
+    # 开启后交易记录由后台线程写入，需调用 close() 或以 with 语句使用会话以确保落盘；
+    # 未关闭的会话仅在解释器正常退出时补写剩余记录
+    async_record: bool = False
+    record_queue_size: int = 1024
+
+
+def safe_price_lookup(func: PriceLookup) -> PriceLookup:
+    """标记价格查询函数不会抛出异常，估值时可跳过异常兜底。"""
+
+    setattr(func, _SAFE_LOOKUP_ATTR, True)
+    return func
+
+
+def _default_repository() -> ParquetRepository:
+    """按数据目录缓存默认仓储，目录配置变化时重新构建。"""
+
+    base_dir = data_store_dir(ensure_exists=False)
+    with _DEFAULT_REPOSITORY_LOCK:
+        repository = _DEFAULT_REPOSITORIES.get(base_dir)
+        if repository is None:
+            repository = ParquetRepository(manager=default_manager(base_dir=data_store_dir()))
+            _DEFAULT_REPOSITORIES[base_dir] = repository
+        return repository
+
+
+def _settle_cash_deltas(
+    prices: np.ndarray,
+    volumes: np.ndarray,
+    fees: np.ndarray,
+    taxes: np.ndarray,
+    is_buy: np.ndarray,
+) -> np.ndarray:
+    """逐笔计算成交对现金的影响：买入扣除成交额，卖出计入成交额，费用税费均扣除。"""
+
+    notional = prices * volumes
+    return np.where(is_buy, -notional, notional) - fees - taxes
+
+
+if njit is not None:
+    _settle_cash_deltas = njit(cache=True)(_settle_cash_deltas)
+
+
+def _stop_writer(write_queue: "queue.Queue[Optional[PendingRecord]]", writer: threading.Thread) -> None:
+    """通知后台写入线程退出并等待已排队记录落盘。"""
+
+    write_queue.put(None)
+    writer.join()
+
+
+def _as_columns(
+    records: Sequence[object],
+    names: Tuple[str, ...],
+    getter: Callable[[object], Tuple[object, ...]],
+) -> Dict[str, List[object]]:
+    """按字段一次性取出记录属性并转置为列，方向枚举映射为字符串；无记录时返回各列的空列表。"""
+
+    if not records:
+        return {name: [] for name in names}
+    rows = list(map(getter, records))
+    columns = {name: list(values) for name, values in zip(names, zip(*rows), strict=True)}
+    columns["side"] = [_SIDE_VALUES[side] for side in columns["side"]]
+    return columns
+
+
+def _order_columns(orders: Sequence[Order]) -> Dict[str, List[object]]:
+    """将订单序列按列展开，供仓储直接构建 Arrow 表。"""
+
+    return _as_columns(orders, _ORDER_COLUMNS, _ORDER_FIELDS)
+
+
+def _trade_columns(trades: Sequence[Trade]) -> Dict[str, List[object]]:
+    """将成交序列按列展开，供仓储直接构建 Arrow 表。"""
+
+    return _as_columns(trades, _TRADE_COLUMNS, _TRADE_FIELDS)
 
 
 class TradingSession:
@@ -44,9 +166,66 @@ class TradingSession:
     ) -> None:
         self.config = config
         self.account = Account(cash=config.initial_cash)
-        self.repository = repository or ParquetRepository()
-        self.execution_engine = ExecutionEngine(execution_config)
+        if repository is not None:
+            self.repository = repository
+        self._execution_config = execution_config
         self.adapter = adapter or SandboxExecutionAdapter()
+        self._write_queue: Optional["queue.Queue[Optional[PendingRecord]]"] = None
+        self._writer: Optional[threading.Thread] = None
+        self._writer_finalizer: Optional[weakref.finalize] = None
+        self._write_error: Optional[BaseException] = None
+        if config.async_record:
+            self._write_queue = queue.Queue(maxsize=config.record_queue_size)
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                name=f"trading-writer-{config.session_id}",
+                daemon=True,
+            )
+            self._writer.start()
+            # 写入线程为守护线程，未调用 close() 时由 finalize 在解释器退出前补写剩余记录
+            self._writer_finalizer = weakref.finalize(
+                self, _stop_writer, self._write_queue, self._writer
+            )
+
+    @cached_property
+    def repository(self) -> ParquetRepository:
+        """未显式注入时，复用按数据目录缓存的默认仓储。"""
+
+        return _default_repository()
+
+    @cached_property
+    def execution_engine(self) -> ExecutionEngine:
+        """撮合引擎在首次沙盒执行时构建。"""
+
+        return ExecutionEngine(self._execution_config)
+
+    def flush(self) -> None:
+        """等待后台写入队列清空，并抛出写入过程中出现的异常。"""
+
+        if self._write_queue is not None:
+            self._write_queue.join()
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise error
+
+    def close(self) -> None:
+        """停止后台写入线程，确保已排队的记录全部落盘；关闭后的记录改为同步写入。"""
+
+        if self._writer_finalizer is not None:
+            self._writer_finalizer()
+            self._writer_finalizer = None
+            self._writer = None
+        try:
+            self.flush()
+        finally:
+            # 写入线程已退出，不再保留队列，避免后续记录滞留其中、flush 永久阻塞
+            self._write_queue = None
+
+    def __enter__(self) -> "TradingSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def execute(
         self,
@@ -83,7 +262,7 @@ class TradingSession:
         """实盘执行路径，委托给券商客户端。"""
 
         trades = broker_client.submit_orders(orders, dt)
-        self._settle_trades(orders, trades, dt)
+        self._settle_trades(orders, trades, dt, ordered=broker_client.ordered_trades)
         self._record(dt, orders, trades, price_lookup)
         broker_client.sync_positions()
         return trades
@@ -93,31 +272,61 @@ class TradingSession:
         orders: Sequence[Order],
         trades: Sequence[Trade],
         trading_dt: datetime,
+        *,
+        ordered: bool = False,
     ) -> None:
-        order_map = {order.order_id: order for order in orders}
-        for trade in trades:
-            order = order_map.get(trade.order_id)
-            if order:
-                order.status = "filled"
-                order.filled_volume = trade.volume
-                order.filled_amount = trade.price * trade.volume
-            if trade.side == OrderSide.BUY:
-                total_cost = trade.price * trade.volume + trade.fee + trade.tax
-                self.account.cash -= total_cost
-                position = self.account.get_position(trade.symbol)
-                position.add_lot(trade.volume, trade.price, trading_dt)
-            else:
-                position = self.account.positions.get(trade.symbol)
-                if position:
-                    proceeds = trade.price * trade.volume - trade.fee - trade.tax
-                    allowed_before = trading_dt
-                    position.remove_volume(trade.volume, before=allowed_before)
-                    self.account.cash += proceeds
-                    if position.is_empty():
-                        del self.account.positions[trade.symbol]
+        if not trades:
+            return
+        count = len(trades)
+        cash_deltas = _settle_cash_deltas(
+            np.fromiter((trade.price for trade in trades), dtype=np.float64, count=count),
+            np.fromiter((trade.volume for trade in trades), dtype=np.float64, count=count),
+            np.fromiter((trade.fee for trade in trades), dtype=np.float64, count=count),
+            np.fromiter((trade.tax for trade in trades), dtype=np.float64, count=count),
+            np.fromiter((trade.side == OrderSide.BUY for trade in trades), dtype=np.bool_, count=count),
+        )
+
+        settled = 0
+        try:
+            for order, trade in self._match_orders(orders, trades, ordered=ordered):
+                if order:
+                    order.status = "filled"
+                    order.filled_volume = trade.volume
+                    order.filled_amount = trade.price * trade.volume
+                if trade.side == OrderSide.BUY:
+                    position = self.account.get_position(trade.symbol)
+                    position.add_lot(trade.volume, trade.price, trading_dt)
                 else:
-                    self.account.cash += trade.price * trade.volume - trade.fee - trade.tax
-            self.account.trades.append(trade)
+                    position = self.account.positions.get(trade.symbol)
+                    if position:
+                        position.remove_volume(trade.volume, before=trading_dt)
+                        if position.is_empty():
+                            del self.account.positions[trade.symbol]
+                self.account.trades.append(trade)
+                settled += 1
+        finally:
+            # 只结算已完成持仓簿记的成交，中途失败时现金与持仓保持一致
+            self.account.cash += float(cash_deltas[:settled].sum())
+
+    @staticmethod
+    def _match_orders(
+        orders: Sequence[Order],
+        trades: Sequence[Trade],
+        *,
+        ordered: bool,
+    ) -> Iterable[Tuple[Optional[Order], Trade]]:
+        """为每笔成交匹配对应订单，顺序一致时按位置配对，否则回退到按订单号索引。"""
+
+        if (
+            ordered
+            and len(orders) == len(trades)
+            and all(
+                order.order_id == trade.order_id for order, trade in zip(orders, trades, strict=True)
+            )
+        ):
+            return zip(orders, trades, strict=True)
+        order_map = {order.order_id: order for order in orders}
+        return ((order_map.get(trade.order_id), trade) for trade in trades)
 
     def _record(
         self,
@@ -126,60 +335,75 @@ class TradingSession:
         trades: Sequence[Trade],
         price_lookup: PriceLookup,
     ) -> None:
-        orders_payload = [
-            {
-                "order_id": order.order_id,
-                "symbol": order.symbol,
-                "side": order.side.value,
-                "volume": order.volume,
-                "price": order.price,
-                "status": order.status,
-                "filled_volume": order.filled_volume,
-                "filled_amount": order.filled_amount,
-                "created_at": order.created_at,
-            }
-            for order in orders
-        ]
-        self.repository.write_trading_orders(
-            self.config.session_id,
-            self.config.strategy_id,
-            dt,
-            orders_payload,
-        )
-
-        trades_payload = [
-            {
-                "trade_id": trade.trade_id,
-                "order_id": trade.order_id,
-                "symbol": trade.symbol,
-                "side": trade.side.value,
-                "volume": trade.volume,
-                "price": trade.price,
-                "fee": trade.fee,
-                "tax": trade.tax,
-                "timestamp": trade.timestamp,
-            }
-            for trade in trades
-        ]
-        self.repository.write_trading_trades(
-            self.config.session_id,
-            self.config.strategy_id,
-            dt,
-            trades_payload,
-        )
-
-        snapshot = {
+        equity = self._compute_equity(price_lookup)
+        snapshot: Dict[str, object] = {
             "timestamp": dt,
             "cash": self.account.cash,
-            "equity": self._compute_equity(price_lookup),
+            "equity": equity,
             "positions": json.dumps(self._serialize_positions()),
         }
-        self.account.equity_curve.append({"date": dt, "equity": snapshot["equity"]})
-        self.repository.write_trading_equity(
-            self.config.session_id,
-            self.config.strategy_id,
-            snapshot,
-        )
+        self.account.equity_curve.add(dt, equity)
+        record: PendingRecord = (dt, _order_columns(orders), _trade_columns(trades), snapshot)
+        if self._write_queue is not None:
+            self._write_queue.put(record)
+        else:
+            self._write_records([record])
+
+    def _write_records(self, records: Sequence[PendingRecord]) -> None:
+        """按交易日合并订单、成交与权益快照，每个交易日调用一次仓储写入（三个数据集依次写入，非原子）。"""
+
+        batches: Dict[date, Tuple[datetime, Columns, Columns, List[Dict[str, object]]]] = {}
+        for dt, orders_columns, trades_columns, snapshot in records:
+            key = dt.date()
+            if key not in batches:
+                batches[key] = (
+                    dt,
+                    {name: [] for name in _ORDER_COLUMNS},
+                    {name: [] for name in _TRADE_COLUMNS},
+                    [],
+                )
+            _, merged_orders, merged_trades, snapshots = batches[key]
+            for name, values in orders_columns.items():
+                merged_orders[name].extend(values)
+            for name, values in trades_columns.items():
+                merged_trades[name].extend(values)
+            snapshots.append(snapshot)
+
+        for dt, orders_columns, trades_columns, snapshots in batches.values():
+            self.repository.write_trading_tick(
+                self.config.session_id,
+                self.config.strategy_id,
+                dt,
+                orders_columns=orders_columns,
+                trades_columns=trades_columns,
+                equity_snapshots=snapshots,
+            )
+
+    def _writer_loop(self) -> None:
+        """后台线程：批量取出队列中的记录并写入仓储。"""
+
+        assert self._write_queue is not None
+        while True:
+            items = [self._write_queue.get()]
+            while True:
+                try:
+                    items.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            # None 为退出信号，其余均为待写入的记录
+            records = [item for item in items if item is not None]
+            stop = len(records) < len(items)
+            try:
+                if records:
+                    self._write_records(records)
+            except Exception as exc:  # pragma: no cover - 写入失败由 flush 抛出
+                _LOGGER.exception("交易记录后台写入失败", extra={"session_id": self.config.session_id})
+                self._write_error = exc
+            finally:
+                for _ in items:
+                    self._write_queue.task_done()
+            if stop:
+                return
 
     def snapshot_positions(self) -> List[Dict[str, object]]:
         """返回当前持仓的结构化快照。"""
@@ -232,11 +456,15 @@ class TradingSession:
     def _compute_equity(self, price_lookup: PriceLookup) -> float:
         """根据账户现金与持仓估算权益。"""
 
+        safe = getattr(price_lookup, _SAFE_LOOKUP_ATTR, False)
         equity = self.account.cash
         for symbol, position in self.account.positions.items():
             if position.volume == 0:
                 continue
-            price = self._safe_price_lookup(price_lookup, symbol, position)
+            if safe:
+                price = float(price_lookup(symbol, OrderSide.SELL))
+            else:
+                price = self._safe_price_lookup(price_lookup, symbol, position)
             equity += position.volume * price
         return float(equity)
 
@@ -248,3 +476,6 @@ class TradingSession:
             return float(price_lookup(symbol, OrderSide.SELL))
         except Exception:  # pragma: no cover - 极端场景兜底
             return float(position.cost_price)
+
+
+__all__ = ["PriceLookup", "TradingSessionConfig", "TradingSession", "safe_price_lookup"]
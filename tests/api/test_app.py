@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import pytest
 from fastapi.testclient import TestClient
 
 from llm_trader.api.security import reset_rate_limits
 
 
+pytestmark = pytest.mark.usefixtures("ensure_data_directory")
+
+
 def test_health_check(api_client: TestClient) -> None:
     response = api_client.get("/api/health")
     assert response.status_code == 200
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 from datetime import datetime
+from pathlib import Path
 
 import pandas as pd
+import pytest
 from fastapi.testclient import TestClient
 
 from llm_trader.data import DatasetKind, default_manager
 from llm_trader.strategy import StrategyRepository, StrategyVersion
 
 
-def _prepare_data(tmp_path, monkeypatch) -> None:
-    monkeypatch.setenv("DATA_STORE_DIR", str(tmp_path / "data_store"))
-    manager = default_manager()
+pytestmark = pytest.mark.usefixtures("ensure_data_directory")
+
+
+def _prepare_data(base_dir: Path) -> None:
+    manager = default_manager(base_dir=base_dir)
     symbols_path = manager.path_for(DatasetKind.SYMBOLS)
     df_symbols = pd.DataFrame(
         [
@@ -91,8 +95,8 @@ def _prepare_strategy() -> StrategyVersion:
     return version
 
 
-def test_strategy_versions_endpoint(tmp_path, monkeypatch, api_client: TestClient) -> None:
-    _prepare_data(tmp_path, monkeypatch)
+def test_strategy_versions_endpoint(isolated_data_store: Path, api_client: TestClient) -> None:
+    _prepare_data(isolated_data_store)
     version = _prepare_strategy()
     response = api_client.get("/api/strategy/versions", params={"strategy_id": "demo"})
     assert response.status_code == 200
@@ -100,8 +104,8 @@ def test_strategy_versions_endpoint(tmp_path, monkeypatch, api_client: TestClien
     assert payload["data"][0]["version_id"] == version.version_id
 
 
-def test_backtest_run_endpoint(tmp_path, monkeypatch, api_client: TestClient) -> None:
-    _prepare_data(tmp_path, monkeypatch)
+def test_backtest_run_endpoint(isolated_data_store: Path, api_client: TestClient) -> None:
+    _prepare_data(isolated_data_store)
     version = _prepare_strategy()
     body = {
         "strategy_id": "demo",
@@ -7,12 +7,11 @@ from typing import Any, Dict, List
 import pytest
 from fastapi.testclient import TestClient
 
-from llm_trader.api.app import app
 from llm_trader.api.routes import config_models
 from llm_trader.model_gateway.config import ModelEndpointSettings
 
 
-client = TestClient(app)
+pytestmark = pytest.mark.usefixtures("ensure_data_directory")
 
 
 @dataclass
@@ -94,15 +93,12 @@ def _patch_dependencies(monkeypatch):
     monkeypatch.setattr(config_models, "session_scope", lambda: fake_scope())
     monkeypatch.setattr(config_models, "build_gateway_settings_from_records", fake_records_to_settings)
     yield stub_gateway, stub_session
-    monkeypatch.delenv("LLM_TRADER_API_KEY", raising=False)
 
 
-def test_list_and_upsert_model_endpoint(_patch_dependencies, monkeypatch):
+def test_list_and_upsert_model_endpoint(api_client: TestClient, _patch_dependencies, headers):
     stub_gateway, stub_session = _patch_dependencies
-    monkeypatch.setenv("LLM_TRADER_API_KEY", "secret")
-    headers = {"X-API-Key": "secret"}
 
-    resp = client.get("/api/config/models", headers=headers)
+    resp = api_client.get("/api/config/models", headers=headers)
     assert resp.status_code == 200
     assert resp.json()["data"] == []
 
@@ -119,18 +115,18 @@ def test_list_and_upsert_model_endpoint(_patch_dependencies, monkeypatch):
         "prompt_cost_per_1k": 0.5,
         "completion_cost_per_1k": 1.5,
     }
-    resp = client.put("/api/config/models", json=payload, headers=headers)
+    resp = api_client.put("/api/config/models", json=payload, headers=headers)
     assert resp.status_code == 200
     data = resp.json()["data"]
     assert data["model_alias"] == "gpt"
     assert stub_gateway.settings and stub_gateway.settings[0].name == "gpt"
 
-    resp = client.get("/api/config/models", headers=headers)
+    resp = api_client.get("/api/config/models", headers=headers)
     assert resp.status_code == 200
     assert resp.json()["data"][0]["model_alias"] == "gpt"
 
 
-def test_metrics_endpoint(_patch_dependencies, monkeypatch):
+def test_metrics_endpoint(api_client: TestClient, _patch_dependencies, headers):
     stub_gateway, _ = _patch_dependencies
     stub_gateway.metrics = [
         {
@@ -144,8 +140,6 @@ def test_metrics_endpoint(_patch_dependencies, monkeypatch):
             "last_error": None,
         }
     ]
-    monkeypatch.setenv("LLM_TRADER_API_KEY", "secret")
-    headers = {"X-API-Key": "secret"}
-    resp = client.get("/api/config/models/metrics", headers=headers)
+    resp = api_client.get("/api/config/models/metrics", headers=headers)
     assert resp.status_code == 200
     assert resp.json()["data"][0]["endpoint"] == "mock"
@@ -6,13 +6,17 @@ from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
+import pytest
 from fastapi.testclient import TestClient
 
 from llm_trader.data import DatasetKind, default_manager
 
 
-def _prepare_symbols(tmp_path: Path) -> None:
-    manager = default_manager()
+pytestmark = pytest.mark.usefixtures("ensure_data_directory")
+
+
+def _prepare_symbols(base_dir: Path) -> None:
+    manager = default_manager(base_dir=base_dir)
     path = manager.path_for(DatasetKind.SYMBOLS)
     df = pd.DataFrame(
         [
@@ -29,8 +33,8 @@ def _prepare_symbols(tmp_path: Path) -> None:
     df.to_parquet(path, index=False)
 
 
-def _prepare_ohlcv(tmp_path: Path) -> None:
-    manager = default_manager()
+def _prepare_ohlcv(base_dir: Path) -> None:
+    manager = default_manager(base_dir=base_dir)
     path = manager.path_for(
         DatasetKind.OHLCV_DAILY,
         symbol="600000.SH",
@@ -55,18 +59,16 @@ def _prepare_ohlcv(tmp_path: Path) -> None:
     df.to_parquet(path, index=False)
 
 
-def test_list_symbols_returns_data(tmp_path, monkeypatch, api_client: TestClient) -> None:
-    monkeypatch.setenv("DATA_STORE_DIR", str(tmp_path / "data_store"))
-    _prepare_symbols(tmp_path)
+def test_list_symbols_returns_data(isolated_data_store: Path, api_client: TestClient) -> None:
+    _prepare_symbols(isolated_data_store)
     response = api_client.get("/api/data/symbols")
     assert response.status_code == 200
     payload = response.json()
     assert payload["data"][0]["symbol"] == "600000.SH"
 
 
-def test_list_ohlcv_returns_data(tmp_path, monkeypatch, api_client: TestClient) -> None:
-    monkeypatch.setenv("DATA_STORE_DIR", str(tmp_path / "data_store"))
-    _prepare_ohlcv(tmp_path)
+def test_list_ohlcv_returns_data(isolated_data_store: Path, api_client: TestClient) -> None:
+    _prepare_ohlcv(isolated_data_store)
     response = api_client.get("/api/data/ohlcv", params={"symbol": "600000.SH"})
     assert response.status_code == 200
     payload = response.json()
@@ -7,11 +7,11 @@ from typing import Any, Dict, List
 import pytest
 from fastapi.testclient import TestClient
 
-from llm_trader.api.app import app
 from llm_trader.api.routes import monitoring
 from llm_trader.db.models.enums import ModelRole
 
-client = TestClient(app)
+
+pytestmark = pytest.mark.usefixtures("ensure_data_directory")
 
 
 @dataclass
@@ -75,13 +75,10 @@ def _patch_monitoring_session(monkeypatch: pytest.MonkeyPatch):
 
     monkeypatch.setattr(monitoring, "session_scope", lambda: fake_scope())
     yield stub_session
-    monkeypatch.delenv("LLM_TRADER_API_KEY", raising=False)
 
 
-def test_list_llm_calls_returns_records(_patch_monitoring_session, monkeypatch):
-    monkeypatch.setenv("LLM_TRADER_API_KEY", "secret")
-    headers = {"X-API-Key": "secret"}
-    resp = client.get("/api/monitor/llm-calls?role=actor&limit=10", headers=headers)
+def test_list_llm_calls_returns_records(api_client: TestClient, _patch_monitoring_session, headers):
+    resp = api_client.get("/api/monitor/llm-calls?role=actor&limit=10", headers=headers)
     assert resp.status_code == 200
     body = resp.json()
     assert body["code"] == "OK"
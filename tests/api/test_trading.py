@@ -2,148 +2,59 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-import json
+from pathlib import Path
+from typing import Callable, Iterator, Mapping
 
+import pytest
 from fastapi.testclient import TestClient
 
-from llm_trader.api.app import app
-from llm_trader.data import default_manager
-from llm_trader.data.repositories.parquet import ParquetRepository
-from llm_trader.strategy.logger import LLMStrategyLogRepository
+from llm_trader.config import AppSettings
 
 
-client = TestClient(app)
+pytestmark = pytest.mark.usefixtures("ensure_data_directory")
 
 
-def _prepare_trading_data(tmp_path, monkeypatch) -> None:
-    monkeypatch.setenv("DATA_STORE_DIR", str(tmp_path / "data_store"))
-    manager = default_manager()
-    repo = ParquetRepository(manager=manager)
-    dt = datetime(2024, 1, 2, 9, 30)
+_QUERY = {"strategy_id": "strategy-ai", "session_id": "session-1"}
 
-    orders = [
-        {
-            "order_id": "o-1",
-            "symbol": "600000.SH",
-            "side": "buy",
-            "volume": 100,
-            "price": 10.0,
-            "status": "filled",
-            "filled_volume": 100,
-            "filled_amount": 1000.0,
-            "created_at": dt,
-        }
-    ]
-    repo.write_trading_orders("session-1", "strategy-ai", dt, orders)
 
-    trades = [
-        {
-            "trade_id": "t-1",
-            "order_id": "o-1",
-            "symbol": "600000.SH",
-            "side": "buy",
-            "volume": 100,
-            "price": 10.0,
-            "fee": 5.0,
-            "tax": 0.0,
-            "timestamp": dt,
-        }
-    ]
-    repo.write_trading_trades("session-1", "strategy-ai", dt, trades)
+@pytest.fixture
+def trading_store(
+    seeded_data_store: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    settings_factory: Callable[..., AppSettings],
+) -> Iterator[Path]:
+    """将数据目录指向会话级预置的交易数据，直接覆盖缓存配置而不重新解析环境变量。"""
 
-    snapshot = {
-        "timestamp": dt,
-        "cash": 99900.0,
-        "equity": 100500.0,
-        "positions": json.dumps(
-            [
-                {
-                    "symbol": "600000.SH",
-                    "volume": 100,
-                    "cost_price": 10.0,
-                }
-            ],
-            ensure_ascii=False,
-        ),
-    }
-    repo.write_trading_equity("session-1", "strategy-ai", snapshot)
+    monkeypatch.setenv("DATA_STORE_DIR", str(seeded_data_store))
+    settings_factory(data_store={"base_dir": seeded_data_store})
+    yield seeded_data_store
 
-    log_repo = LLMStrategyLogRepository(manager=manager)
-    log_repo.append(
-        strategy_id="strategy-ai",
-        session_id="session-1",
-        prompt="prompt",
-        response="response",
-        payload={"symbols": ["600000.SH"], "objective": "test"},
-        timestamp=dt,
-    )
 
-    repo.write_trading_run_summary(
-        strategy_id="strategy-ai",
-        session_id="session-1",
-        record={
-            "timestamp": dt,
-            "strategy_id": "strategy-ai",
-            "session_id": "session-1",
-            "status": "executed",
-            "decision_proceed": True,
-            "alerts": json.dumps([]),
-            "orders_executed": 1,
-            "trades_filled": 1,
-            "selected_symbols": json.dumps(["600000.SH"]),
-            "suggestion_description": "demo run",
-            "rules": json.dumps([{"indicator": "sma", "operator": ">", "threshold": 10.0}]),
-            "llm_prompt": "prompt",
-            "llm_response": json.dumps({"rules": []}),
-            "objective": "测试",
-            "indicators": json.dumps(["sma"]),
-        },
-    )
-
-
-def test_trading_endpoints(tmp_path, monkeypatch) -> None:
-    _prepare_trading_data(tmp_path, monkeypatch)
-    monkeypatch.setenv("LLM_TRADER_API_KEY", "secret")
-    headers = {"X-API-Key": "secret"}
-
-    resp = client.get(
-        "/api/trading/orders",
-        params={"strategy_id": "strategy-ai", "session_id": "session-1"},
-        headers=headers,
-    )
-    assert resp.status_code == 200
-    assert resp.json()["data"][0]["order_id"] == "o-1"
-
-    resp = client.get(
-        "/api/trading/trades",
-        params={"strategy_id": "strategy-ai", "session_id": "session-1"},
-        headers=headers,
-    )
-    assert resp.status_code == 200
-    assert resp.json()["data"][0]["trade_id"] == "t-1"
-
-    resp = client.get(
-        "/api/trading/equity",
-        params={"strategy_id": "strategy-ai", "session_id": "session-1"},
-        headers=headers,
-    )
+@pytest.mark.parametrize(
+    ("path", "field", "expected"),
+    [
+        ("/api/trading/orders", "order_id", "o-1"),
+        ("/api/trading/trades", "trade_id", "t-1"),
+        ("/api/trading/equity", "equity", 100500.0),
+        ("/api/trading/logs", "objective", "test"),
+    ],
+)
+@pytest.mark.usefixtures("trading_store")
+def test_trading_endpoints(
+    api_client: TestClient,
+    headers: Mapping[str, str],
+    path: str,
+    field: str,
+    expected: object,
+) -> None:
+    resp = api_client.get(path, params=_QUERY, headers=headers)
     assert resp.status_code == 200
-    assert resp.json()["data"][0]["equity"] == 100500.0
+    assert resp.json()["data"][0][field] == expected
 
-    resp = client.get(
-        "/api/trading/logs",
-        params={"strategy_id": "strategy-ai", "session_id": "session-1"},
-        headers=headers,
-    )
-    assert resp.status_code == 200
-    assert resp.json()["data"][0]["objective"] == "test"
 
-    resp = client.get(
-        "/api/trading/history",
-        params={"strategy_id": "strategy-ai", "session_id": "session-1"},
-        headers=headers,
-    )
+@pytest.mark.usefixtures("trading_store")
+def test_trading_history_endpoint(api_client: TestClient, headers: Mapping[str, str]) -> None:
+    resp = api_client.get("/api/trading/history", params=_QUERY, headers=headers)
     assert resp.status_code == 200
     history = resp.json()["data"]
     assert history
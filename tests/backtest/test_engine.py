@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict
 
 from llm_trader.backtest import BacktestRunner, Order, OrderSide
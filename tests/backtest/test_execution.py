@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from llm_trader.backtest import Account, ExecutionConfig, ExecutionEngine, Order, OrderSide
 
 
+_NOW = datetime(2024, 7, 1)
+
+
 def _price_lookup(prices):
     def lookup(symbol: str, _side: OrderSide) -> float:
         return prices[symbol]
@@ -23,7 +26,7 @@ def test_execute_buy_creates_position() -> None:
         side=OrderSide.BUY,
         volume=1000,
         price=10.0,
-        created_at=datetime.utcnow(),
+        created_at=_NOW,
     )
     trades = engine.execute(account, [order], _price_lookup({"600000.SH": 10.0}), datetime(2024, 7, 1))
     assert len(trades) == 1
@@ -41,7 +44,7 @@ def test_execute_sell_with_t_plus_one() -> None:
         side=OrderSide.BUY,
         volume=1000,
         price=10.0,
-        created_at=datetime.utcnow(),
+        created_at=_NOW,
     )
     engine.execute(account, [buy_order], _price_lookup({"600000.SH": 10.0}), datetime(2024, 7, 1))
 
@@ -51,7 +54,7 @@ def test_execute_sell_with_t_plus_one() -> None:
         side=OrderSide.SELL,
         volume=1000,
         price=11.0,
-        created_at=datetime.utcnow(),
+        created_at=_NOW,
     )
     trades = engine.execute(account, [sell_order], _price_lookup({"600000.SH": 11.0}), datetime(2024, 7, 1))
     assert trades == []
@@ -73,7 +76,7 @@ def test_allow_same_day_sell_config() -> None:
         side=OrderSide.BUY,
         volume=100,
         price=10.0,
-        created_at=datetime.utcnow(),
+        created_at=_NOW,
     )
     engine.execute(account, [buy_order], _price_lookup({"000001.SZ": 10.0}), datetime(2024, 7, 1))
 
@@ -83,7 +86,7 @@ def test_allow_same_day_sell_config() -> None:
         side=OrderSide.SELL,
         volume=100,
         price=10.5,
-        created_at=datetime.utcnow(),
+        created_at=_NOW,
     )
     trades = engine.execute(account, [sell_order], _price_lookup({"000001.SZ": 10.5}), datetime(2024, 7, 1))
     assert len(trades) == 1
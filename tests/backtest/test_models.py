@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from llm_trader.backtest import Account, Order, OrderSide
+from llm_trader.backtest import Account, EquityCurve, Order, OrderSide
+
+
+_NOW = datetime(2024, 7, 1)
 
 
 def test_account_equity_curve_default() -> None:
@@ -12,6 +15,20 @@ def test_account_equity_curve_default() -> None:
     assert account.total_equity() == 100000.0
 
 
+def test_equity_curve_grows_and_keeps_points() -> None:
+    curve = EquityCurve()
+    start = datetime(2024, 1, 1)
+    for index in range(200):
+        curve.add(start.replace(minute=index % 60), 100000.0 + index)
+    curve.append({"date": start, "equity": 123.0})
+
+    assert len(curve) == 201
+    assert curve[0] == {"date": start, "equity": 100000.0}
+    assert curve[-1]["equity"] == 123.0
+    assert curve.values[-2] == 100199.0
+    assert Account(cash=1.0, equity_curve=curve).total_equity() == 123.0
+
+
 def test_order_defaults() -> None:
     order = Order(
         order_id="1",
@@ -19,7 +36,7 @@ def test_order_defaults() -> None:
         side=OrderSide.BUY,
         volume=1000,
         price=10.0,
-        created_at=datetime.utcnow(),
+        created_at=_NOW,
     )
     assert order.status == "created"
     assert order.filled_volume == 0
@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import json
 import sys
+from contextlib import ExitStack
+from datetime import datetime
 from pathlib import Path
-from typing import Iterator
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, List, Mapping, Sequence
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import create_engine
+
+try:  # pragma: no cover - 可选依赖
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - 未安装时回退标准库
+    orjson = None  # type: ignore[assignment]
 
 # 将 src 目录加入 sys.path，确保测试可直接导入包
 _PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -22,8 +35,71 @@ from fastapi.testclient import TestClient
 
 from llm_trader.api.app import app
 from llm_trader.api.security import reset_rate_limits
-from llm_trader.config import AppSettings, get_settings
+from llm_trader.config import AppSettings, get_settings, override_settings
 from llm_trader.common.paths import data_store_dir
+from llm_trader.data import DataStoreManager, default_manager
+from llm_trader.data.repositories.parquet import ParquetRepository
+from llm_trader.model_gateway.loader import invalidate_gateway_settings
+from llm_trader.strategy import LLMStrategyLogRepository, StrategyRepository, StrategyVersion
+
+
+_API_HEADERS: Mapping[str, str] = MappingProxyType({"X-API-Key": "secret"})
+
+
+@pytest.fixture(autouse=True)
+def _reset_gateway_settings_cache() -> Iterator[None]:
+    """每个测试前后清空模型网关配置缓存，避免跨测试读到旧端点。"""
+
+    invalidate_gateway_settings()
+    yield
+    invalidate_gateway_settings()
+
+
+@pytest.fixture(autouse=True)
+def _uncompressed_parquet() -> Iterator[None]:
+    """测试数据量极小，Parquet 写入跳过压缩以节省编码开销。"""
+
+    with override_settings("data_store", parquet_compression="none"):
+        yield
+
+
+@pytest.fixture(scope="session")
+def sqlite_engine_factory() -> Iterator[Callable[[], Engine]]:
+    """创建单连接（StaticPool）内存 SQLite 引擎的工厂，会话结束时统一释放。
+
+    引擎支持嵌套 SAVEPOINT，建表与种子数据可在模块或会话级只执行一次，
+    单个用例在外层事务中运行并整体回滚。
+    """
+
+    engines: List[Engine] = []
+
+    def factory() -> Engine:
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+        # pysqlite 默认的隐式事务会破坏 SAVEPOINT，需交由 SQLAlchemy 显式 BEGIN；
+        # 同时关闭多余的同步写入并把临时表放在内存中（内存库不支持 WAL，无需设置 journal_mode）
+        @event.listens_for(engine, "connect")
+        def _configure_connection(dbapi_connection, _record) -> None:
+            dbapi_connection.isolation_level = None
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.close()
+
+        @event.listens_for(engine, "begin")
+        def _emit_begin(connection: Connection) -> None:
+            connection.exec_driver_sql("BEGIN")
+
+        engines.append(engine)
+        return engine
+
+    yield factory
+    for engine in engines:
+        engine.dispose()
 
 
 @pytest.fixture(scope="session")
@@ -33,22 +109,216 @@ def app_settings() -> AppSettings:
     return get_settings()
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture
+def settings_factory() -> Iterator[Callable[..., AppSettings]]:
+    """按分组覆盖缓存配置字段，测试结束后统一恢复。
+
+    例如 ``settings_factory(trading={"execution_mode": "sandbox"})``，直接修改
+    ``get_settings()`` 单例，无需设置环境变量再清空缓存重新解析。
+    """
+
+    with ExitStack() as stack:
+
+        def make(**sections: Mapping[str, Any]) -> AppSettings:
+            settings = get_settings()
+            for section, values in sections.items():
+                settings = stack.enter_context(override_settings(section, **values))
+            return settings
+
+        yield make
+
+
+@pytest.fixture(scope="session")
 def ensure_data_directory(app_settings: AppSettings) -> Iterator[Path]:
-    """在测试前保证数据目录存在。"""
+    """在测试前保证数据目录存在，由需要读写数据目录的测试模块按需启用。"""
 
     path = data_store_dir()
     yield path
 
 
+def _dumps(value: object) -> str:
+    """序列化种子数据中的 JSON 字段，优先使用 orjson。"""
+
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _write_trading_records(
+    repo: ParquetRepository,
+    session_id: str,
+    strategy_id: str,
+    timestamp: datetime,
+    *,
+    orders: Sequence[Mapping[str, Any]] = (),
+    trades: Sequence[Mapping[str, Any]] = (),
+    equity: Sequence[Mapping[str, Any]] = (),
+) -> None:
+    """依次写入同一会话的订单、成交与权益快照，供种子数据复用。"""
+
+    repo.write_trading_orders(session_id, strategy_id, timestamp, list(orders))
+    repo.write_trading_trades(session_id, strategy_id, timestamp, list(trades))
+    repo.write_trading_equity_many(session_id, strategy_id, list(equity))
+
+
+def _seed_trading_store(base_dir: Path) -> None:
+    """写入交易订单、成交、权益、策略版本与 LLM 日志等示例数据。"""
+
+    manager = default_manager(base_dir=base_dir)
+    repo = ParquetRepository(manager=manager)
+    dt = datetime(2024, 1, 2, 9, 30)
+    _write_trading_records(
+        repo,
+        "session-1",
+        "strategy-ai",
+        dt,
+        orders=[
+            {
+                "order_id": "o-1",
+                "symbol": "600000.SH",
+                "side": "buy",
+                "volume": 100,
+                "price": 10.0,
+                "status": "filled",
+                "filled_volume": 100,
+                "filled_amount": 1000.0,
+                "created_at": dt,
+            }
+        ],
+        trades=[
+            {
+                "trade_id": "t-1",
+                "order_id": "o-1",
+                "symbol": "600000.SH",
+                "side": "buy",
+                "volume": 100,
+                "price": 10.0,
+                "fee": 5.0,
+                "tax": 0.0,
+                "timestamp": dt,
+            }
+        ],
+        equity=[
+            {
+                "timestamp": dt,
+                "cash": 99900.0,
+                "equity": 100500.0,
+                "positions": _dumps([{"symbol": "600000.SH", "volume": 100}]),
+            }
+        ],
+    )
+    repo_meta = StrategyRepository()
+    repo_meta.register_version(
+        StrategyVersion(
+            strategy_id="strategy-ai",
+            version_id="v1",
+            run_id="run1",
+            created_at=dt,
+            rules=[],
+            metrics={"total_return": 0.1},
+        )
+    )
+    logger = LLMStrategyLogRepository(manager=manager)
+    logger.append(
+        strategy_id="strategy-ai",
+        session_id="session-1",
+        prompt="prompt",
+        response="response",
+        payload={"objective": "test"},
+        timestamp=dt,
+    )
+    repo.write_trading_run_summary(
+        strategy_id="strategy-ai",
+        session_id="session-1",
+        record={
+            "timestamp": dt,
+            "strategy_id": "strategy-ai",
+            "session_id": "session-1",
+            "status": "executed",
+            "decision_proceed": True,
+            "alerts": _dumps([]),
+            "orders_executed": 1,
+            "trades_filled": 1,
+            "selected_symbols": _dumps(["600000.SH"]),
+            "suggestion_description": "demo history",
+            "rules": _dumps([{"indicator": "sma", "operator": ">", "threshold": 9.0}]),
+            "llm_prompt": "prompt",
+            "llm_response": _dumps({"rules": []}),
+            "objective": "test",
+            "indicators": _dumps(["sma"]),
+        },
+    )
+
+
 @pytest.fixture
-def api_client() -> Iterator[TestClient]:
-    """为 API 测试提供独立的客户端实例，并在前后重置限流状态。"""
+def isolated_data_store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """为单个测试提供独立数据目录，环境变量与 ``default_manager`` 共用同一路径。"""
+
+    base_dir = tmp_path / "data_store"
+    # 环境变量保证缓存被清空后仍指向同一目录；缓存配置直接覆盖，避免重新解析
+    monkeypatch.setenv("DATA_STORE_DIR", str(base_dir))
+    with override_settings("data_store", base_dir=base_dir):
+        yield base_dir
+
+
+@pytest.fixture(scope="session")
+def seeded_data_store(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """会话级只读交易数据目录，仅写入一次供多个测试复用。"""
+
+    base_dir = tmp_path_factory.mktemp("seeded") / "data_store"
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("DATA_STORE_DIR", str(base_dir))
+        get_settings.cache_clear()
+        try:
+            _seed_trading_store(base_dir)
+        finally:
+            get_settings.cache_clear()
+    return base_dir
+
+
+@pytest.fixture(scope="session")
+def shared_data_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """会话级共享数据目录，供以唯一标识写入、无需隔离的测试复用。"""
+
+    return tmp_path_factory.mktemp("shared") / "data_store"
+
+
+@pytest.fixture(scope="session")
+def shared_manager(shared_data_dir: Path) -> DataStoreManager:
+    """基于共享目录的数据存储管理器，整个会话只构建一次。"""
+
+    return default_manager(base_dir=shared_data_dir)
+
+
+@pytest.fixture(scope="session")
+def shared_repository(shared_manager: DataStoreManager) -> ParquetRepository:
+    """基于共享目录的 Parquet 仓库，整个会话只构建一次。"""
+
+    return ParquetRepository(manager=shared_manager)
+
+
+@pytest.fixture
+def headers(monkeypatch: pytest.MonkeyPatch) -> Mapping[str, str]:
+    """配置 API Key 环境变量并返回携带该 Key 的只读请求头。"""
+
+    monkeypatch.setenv("LLM_TRADER_API_KEY", "secret")
+    return _API_HEADERS
+
+
+@pytest.fixture(scope="session")
+def _shared_api_client() -> Iterator[TestClient]:
+    """整个测试会话共享的 API 客户端，生命周期事件仅触发一次。"""
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def api_client(_shared_api_client: TestClient) -> Iterator[TestClient]:
+    """为 API 测试提供共享客户端，并在前后重置限流状态。"""
 
     reset_rate_limits()
-    client = TestClient(app)
     try:
-        yield client
+        yield _shared_api_client
     finally:
-        client.close()
         reset_rate_limits()
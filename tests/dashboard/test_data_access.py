@@ -3,111 +3,18 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
 
-from llm_trader.data import default_manager
-from llm_trader.data.repositories.parquet import ParquetRepository
-from llm_trader.strategy import LLMStrategyLogRepository, StrategyRepository, StrategyVersion
+import pytest
+
 from dashboard import data
 
 
-def _seed(tmp_path) -> None:
-    manager = default_manager(base_dir=tmp_path / "data_store")
-    repo = ParquetRepository(manager=manager)
-    dt = datetime(2024, 1, 2, 9, 30)
-    repo.write_trading_orders(
-        "session-1",
-        "strategy-ai",
-        dt,
-        [
-            {
-                "order_id": "o-1",
-                "symbol": "600000.SH",
-                "side": "buy",
-                "volume": 100,
-                "price": 10.0,
-                "status": "filled",
-                "filled_volume": 100,
-                "filled_amount": 1000.0,
-                "created_at": dt,
-            }
-        ],
-    )
-    repo.write_trading_trades(
-        "session-1",
-        "strategy-ai",
-        dt,
-        [
-            {
-                "trade_id": "t-1",
-                "order_id": "o-1",
-                "symbol": "600000.SH",
-                "side": "buy",
-                "volume": 100,
-                "price": 10.0,
-                "fee": 5.0,
-                "tax": 0.0,
-                "timestamp": dt,
-            }
-        ],
-    )
-    repo.write_trading_equity(
-        "session-1",
-        "strategy-ai",
-        {
-            "timestamp": dt,
-            "cash": 99900.0,
-            "equity": 100500.0,
-            "positions": json.dumps([{"symbol": "600000.SH", "volume": 100}]),
-        },
-    )
-    repo_meta = StrategyRepository()
-    repo_meta.register_version(
-        StrategyVersion(
-            strategy_id="strategy-ai",
-            version_id="v1",
-            run_id="run1",
-            created_at=dt,
-            rules=[],
-            metrics={"total_return": 0.1},
-        )
-    )
-    logger = LLMStrategyLogRepository(manager=manager)
-    logger.append(
-        strategy_id="strategy-ai",
-        session_id="session-1",
-        prompt="prompt",
-        response="response",
-        payload={"objective": "test"},
-        timestamp=dt,
-    )
-    repo.write_trading_run_summary(
-        strategy_id="strategy-ai",
-        session_id="session-1",
-        record={
-            "timestamp": dt,
-            "strategy_id": "strategy-ai",
-            "session_id": "session-1",
-            "status": "executed",
-            "decision_proceed": True,
-            "alerts": json.dumps([]),
-            "orders_executed": 1,
-            "trades_filled": 1,
-            "selected_symbols": json.dumps(["600000.SH"]),
-            "suggestion_description": "demo history",
-            "rules": json.dumps([{"indicator": "sma", "operator": ">", "threshold": 9.0}]),
-            "llm_prompt": "prompt",
-            "llm_response": json.dumps({"rules": []}),
-            "objective": "test",
-            "indicators": json.dumps(["sma"]),
-        },
-    )
-
-
-def test_data_access(tmp_path, monkeypatch) -> None:
-    monkeypatch.setenv("DATA_STORE_DIR", str(tmp_path / "data_store"))
+pytestmark = pytest.mark.usefixtures("ensure_data_directory")
+
+
+def test_data_access(seeded_data_store, monkeypatch) -> None:
+    monkeypatch.setenv("DATA_STORE_DIR", str(seeded_data_store))
     data.invalidate_cache()
-    _seed(tmp_path)
 
     orders = data.get_orders("strategy-ai", "session-1", limit=1)
     trades = data.get_trades("strategy-ai", "session-1", limit=1)
@@ -172,8 +79,8 @@ def test_load_pipeline_status_missing(tmp_path, monkeypatch) -> None:
     assert "不存在" in info["error"]
 
 
-def test_prompt_template_crud(tmp_path, monkeypatch) -> None:
-    monkeypatch.setenv("DATA_STORE_DIR", str(tmp_path / "data_store"))
+@pytest.mark.usefixtures("isolated_data_store")
+def test_prompt_template_crud() -> None:
     data.invalidate_cache()
     # 确保默认模板可列出
     templates = data.list_prompt_templates()
@@ -0,0 +1,109 @@
+"""数据层测试共享夹具。"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterator
+
+import pytest
+import respx
+from httpx import Response
+from sqlalchemy.engine import Connection, Engine
+from sqlmodel import Session, SQLModel
+
+from llm_trader.data.pipelines.client import EastMoneyClient
+from llm_trader.db.models import AccountPosition, AccountSnapshot, MasterSymbol, RealtimeQuote
+
+# 仓储测试只涉及以下数据表，其余表含 PostgreSQL 专属类型，无需在 SQLite 中建表
+_REPOSITORY_TABLES = [
+    MasterSymbol.__table__,
+    RealtimeQuote.__table__,
+    AccountSnapshot.__table__,
+    AccountPosition.__table__,
+]
+
+# 证券主表的东方财富候选端点，与 SymbolsPipeline 的回退顺序一致
+_EASTMONEY_HOSTS = (
+    "https://push2.eastmoney.com/api/qt/clist/get",
+    "https://80.push2.eastmoney.com/api/qt/clist/get",
+    "https://81.push2.eastmoney.com/api/qt/clist/get",
+    "https://82.push2.eastmoney.com/api/qt/clist/get",
+    "https://83.push2.eastmoney.com/api/qt/clist/get",
+)
+
+
+def _mock_eastmoney_all_502(router: respx.MockRouter) -> None:
+    """让东方财富全部端点返回 502，用于触发降级逻辑。"""
+
+    for host in _EASTMONEY_HOSTS:
+        router.get(host).mock(return_value=Response(502, json={}))
+
+
+@pytest.fixture(scope="module")
+def _module_router() -> Iterator[respx.MockRouter]:
+    """模块内共享的 respx 路由器，拦截器只安装一次。"""
+
+    with respx.mock(assert_all_called=False) as router:
+        yield router
+
+
+@pytest.fixture
+def eastmoney_router(_module_router: respx.MockRouter) -> Iterator[respx.MockRouter]:
+    """复用模块级路由器，用例结束后清空路由与调用记录，避免互相串扰。"""
+
+    yield _module_router
+    _module_router.clear()
+    _module_router.reset()
+
+
+@pytest.fixture
+def eastmoney_unavailable(eastmoney_router: respx.MockRouter) -> respx.MockRouter:
+    """东方财富端点均不可用的路由器，用例可继续在其上注册交易所接口。"""
+
+    _mock_eastmoney_all_502(eastmoney_router)
+    return eastmoney_router
+
+
+@pytest.fixture(scope="session")
+def em_client() -> Iterator[EastMoneyClient]:
+    """会话内复用的东方财富客户端，路由仍由各用例的 ``respx.mock`` 提供。"""
+
+    client = EastMoneyClient()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def sqlite_engine(sqlite_engine_factory: Callable[[], Engine]) -> Engine:
+    """会话级内存 SQLite 引擎，建表仅执行一次。"""
+
+    engine = sqlite_engine_factory()
+    SQLModel.metadata.create_all(engine, tables=_REPOSITORY_TABLES)
+    return engine
+
+
+@pytest.fixture
+def db_connection(sqlite_engine: Engine) -> Iterator[Connection]:
+    """在外层事务中运行单个测试，结束时整体回滚以隔离数据。"""
+
+    connection = sqlite_engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def db_session(db_connection: Connection) -> Iterator[Session]:
+    """绑定外层事务的会话，``commit`` 仅释放保存点，提交后不使已加载对象过期。"""
+
+    session = Session(
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+    try:
+        yield session
+    finally:
+        session.close()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from datetime import datetime
 from pathlib import Path
+from typing import Dict
 
 import pyarrow.parquet as pq
 import pytest
@@ -62,26 +63,28 @@ def regression_repo(tmp_path: Path) -> ParquetRepository:
     return repo
 
 
-def _read_parquet(path: Path) -> list:
-    table = pq.read_table(path)
-    return table.to_pylist()
+def _read_columns(path: Path, *columns: str) -> Dict[str, list]:
+    """仅读取断言所需的列，避免解码整表并逐行构造字典。"""
+
+    table = pq.read_table(path, columns=list(columns))
+    return table.to_pydict()
 
 
 def test_symbol_dataset_structure(regression_repo: ParquetRepository) -> None:
     manager = regression_repo.manager
     config = manager.get(DatasetKind.SYMBOLS)
     path = manager.base_dir / config.relative_dir / config.filename_template
-    records = _read_parquet(path)
-    assert any(rec["symbol"] == "600000.SH" for rec in records)
-    assert all("exchange" in rec for rec in records)
+    assert "exchange" in pq.read_schema(path).names
+    columns = _read_columns(path, "symbol")
+    assert "600000.SH" in columns["symbol"]
 
 
 def test_calendar_dataset_consistency(regression_repo: ParquetRepository) -> None:
     manager = regression_repo.manager
     config = manager.get(DatasetKind.TRADING_CALENDAR)
     path = manager.base_dir / config.relative_dir / config.filename_template
-    records = _read_parquet(path)
-    trading_days = [rec["date"] for rec in records if rec["is_trading"]]
+    columns = _read_columns(path, "date", "is_trading")
+    trading_days = [day for day, is_trading in zip(columns["date"], columns["is_trading"]) if is_trading]
     assert "2024-01-02" in trading_days
 
 
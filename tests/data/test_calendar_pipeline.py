@@ -16,7 +16,7 @@ from llm_trader.data.repositories.parquet import ParquetRepository
 
 
 @respx.mock
-def test_calendar_pipeline_sync(tmp_path: Path) -> None:
+def test_calendar_pipeline_sync(tmp_path: Path, em_client: EastMoneyClient) -> None:
     """应正确生成交易日历 Parquet。"""
 
     respx.get("https://push2.eastmoney.com/api/qt/market/getfuturestime").mock(
@@ -35,12 +35,10 @@ def test_calendar_pipeline_sync(tmp_path: Path) -> None:
 
     manager = default_manager(base_dir=tmp_path)
     repository = ParquetRepository(manager=manager)
-    client = EastMoneyClient()
-    pipeline = TradingCalendarPipeline(client=client, repository=repository)
+    pipeline = TradingCalendarPipeline(client=em_client, repository=repository)
 
     records = pipeline.sync(market="CN_A", start=date(2024, 7, 1), end=date(2024, 7, 2))
 
-    client.close()
     assert len(records) == 2
     path = manager.path_for(DatasetKind.TRADING_CALENDAR)
     stored = pq.read_table(path).to_pylist()
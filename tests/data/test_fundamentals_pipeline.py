@@ -15,7 +15,7 @@ from llm_trader.data.repositories.parquet import ParquetRepository
 
 
 @respx.mock
-def test_fundamentals_pipeline_sync(tmp_path: Path) -> None:
+def test_fundamentals_pipeline_sync(tmp_path: Path, em_client: EastMoneyClient) -> None:
     """应正确写入基础指标数据。"""
 
     base_url = "https://push2.eastmoney.com/api/qt/stock/get"
@@ -39,12 +39,10 @@ def test_fundamentals_pipeline_sync(tmp_path: Path) -> None:
 
     manager = default_manager(base_dir=tmp_path)
     repository = ParquetRepository(manager=manager)
-    client = EastMoneyClient()
-    pipeline = FundamentalsPipeline(client=client, repository=repository)
+    pipeline = FundamentalsPipeline(client=em_client, repository=repository)
 
     records = pipeline.sync(["600000.SH"])
 
-    client.close()
     assert len(records) == 1
     from datetime import datetime
 
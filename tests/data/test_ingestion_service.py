@@ -3,7 +3,8 @@ from __future__ import annotations
 from contextlib import contextmanager
 from datetime import datetime
 
-from sqlmodel import Session, SQLModel, create_engine, select
+from sqlalchemy.engine import Connection
+from sqlmodel import Session, select
 
 from llm_trader.data.ingestion import DataIngestionService
 from llm_trader.db.models import AccountPosition, AccountSnapshot
@@ -28,10 +29,10 @@ class DummyAccountPipeline:
         }
 
 
-def _session_factory(engine):
+def _session_factory(connection: Connection):
     @contextmanager
     def factory():
-        with Session(engine) as session:
+        with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
             try:
                 yield session
                 session.commit()
@@ -41,19 +42,16 @@ def _session_factory(engine):
     return factory
 
 
-def test_sync_account_snapshot_persists_payload() -> None:
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    SQLModel.metadata.create_all(engine)
+def test_sync_account_snapshot_persists_payload(db_connection: Connection, db_session: Session) -> None:
     pipeline = DummyAccountPipeline()
-    service = DataIngestionService(session_factory=_session_factory(engine), account_pipeline=pipeline)
+    service = DataIngestionService(session_factory=_session_factory(db_connection), account_pipeline=pipeline)
 
     payload = service.sync_account_snapshot()
 
     assert payload is not None
     assert pipeline._called is True
-    with Session(engine) as session:
-        snapshot = session.exec(select(AccountSnapshot)).one()
-        assert snapshot.nav == 1_200_000.0
-        positions = session.exec(select(AccountPosition)).all()
-        assert len(positions) == 1
-        assert positions[0].symbol == "600000.SH"
+    snapshot = db_session.exec(select(AccountSnapshot)).one()
+    assert snapshot.nav == 1_200_000.0
+    positions = db_session.exec(select(AccountPosition)).all()
+    assert len(positions) == 1
+    assert positions[0].symbol == "600000.SH"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from datetime import date, datetime
 from pathlib import Path
 
@@ -14,32 +15,32 @@ from llm_trader.data.pipelines.client import EastMoneyClient
 from llm_trader.data.pipelines.ohlcv import OhlcvPipeline
 from llm_trader.data.repositories.parquet import ParquetRepository
 
+# 模拟响应体在模块加载时序列化一次，各次拦截直接复用字节内容
+_JSON_HEADERS = {"content-type": "application/json"}
+_DAILY_KLINES_BYTES = json.dumps(
+    {
+        "data": {
+            "klines": [
+                "2024-07-01,10.0,10.5,10.6,9.8,1000,1000000,0,0,0.5,0.1",
+                "2024-07-02,10.5,10.7,10.8,10.4,800,900000,0,0,0.4,0.08",
+            ]
+        }
+    }
+).encode("utf-8")
 
 @respx.mock
-def test_ohlcv_pipeline_sync_daily(tmp_path: Path) -> None:
+def test_ohlcv_pipeline_sync_daily(tmp_path: Path, em_client: EastMoneyClient) -> None:
     """应正确写入日线行情，并支持增量合并。"""
 
     respx.get("https://push2his.eastmoney.com/api/qt/stock/kline/get").mock(
-        return_value=Response(
-            200,
-            json={
-                "data": {
-                    "klines": [
-                        "2024-07-01,10.0,10.5,10.6,9.8,1000,1000000,0,0,0.5,0.1",
-                        "2024-07-02,10.5,10.7,10.8,10.4,800,900000,0,0,0.4,0.08",
-                    ]
-                }
-            },
-        )
+        return_value=Response(200, content=_DAILY_KLINES_BYTES, headers=_JSON_HEADERS)
     )
 
     manager = default_manager(base_dir=tmp_path)
     repository = ParquetRepository(manager=manager)
-    client = EastMoneyClient()
-    pipeline = OhlcvPipeline(client=client, repository=repository)
+    pipeline = OhlcvPipeline(client=em_client, repository=repository)
 
     records = pipeline.sync(symbol="600000.SH", freq="D", start=date(2024, 7, 1), end=date(2024, 7, 2))
-    client.close()
 
     assert len(records) == 2
 
@@ -1,122 +1,220 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
+from typing import List, Mapping
 
-from sqlmodel import Session, SQLModel, create_engine
+from sqlalchemy import select
+from sqlmodel import Session
 
 from llm_trader.data.repositories.postgres import PostgresDataRepository
 from llm_trader.db.models import AccountSnapshot, MasterSymbol, RealtimeQuote
 from llm_trader.db.models.enums import RiskPosture
 
 
-def create_sqlite_engine():
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    SQLModel.metadata.create_all(engine)
-    return engine
-
-
-def test_upsert_and_list_master_symbols():
-    engine = create_sqlite_engine()
-    with Session(engine) as session:
-        repo = PostgresDataRepository(session)
-        repo.upsert_master_symbols(
-            [
-                {
-                    "symbol": "600000.SH",
-                    "exchange": "SH",
-                    "board": "主板",
-                    "name": "浦发银行",
-                    "is_st": False,
-                    "listed_date": datetime(1999, 11, 10).date(),
-                    "industry": "银行",
-                    "market_cap": 1000000000.0,
-                    "float_cap": 800000000.0,
-                    "pe_ttm": 8.5,
-                    "pb": 0.9,
-                    "tick_size": 0.01,
-                    "lot_size": 100,
-                    "status": "active",
-                    "as_of_date": datetime.utcnow().date(),
-                    "version": 1,
-                }
-            ]
-        )
-        session.commit()
-
-    with Session(engine) as session:
-        rows = session.query(MasterSymbol).all()
-        assert len(rows) == 1
-        repo = PostgresDataRepository(session)
-        symbols = repo.list_active_symbols()
-        assert symbols == ["600000.SH"]
-
-
-def test_upsert_realtime_quotes():
-    engine = create_sqlite_engine()
-    with Session(engine) as session:
-        repo = PostgresDataRepository(session)
-        repo.upsert_master_symbols(
-            [
-                {
-                    "symbol": "600000.SH",
-                    "exchange": "SH",
-                    "board": "主板",
-                    "name": "浦发银行",
-                    "is_st": False,
-                    "listed_date": datetime(1999, 11, 10).date(),
-                    "industry": "银行",
-                    "market_cap": 1000000000.0,
-                    "float_cap": 800000000.0,
-                    "pe_ttm": 8.5,
-                    "pb": 0.9,
-                    "tick_size": 0.01,
-                    "lot_size": 100,
-                    "status": "active",
-                    "as_of_date": datetime.utcnow().date(),
-                    "version": 1,
-                }
-            ]
-        )
-        repo.upsert_realtime_quotes(
-            [
-                {
-                    "symbol": "600000.SH",
-                    "name": "浦发银行",
-                    "last_price": 10.5,
-                    "change": 0.2,
-                    "change_ratio": 1.5,
-                    "volume": 1000000,
-                    "amount": 10500000,
-                    "snapshot_time": datetime.utcnow(),
-                }
-            ]
-        )
-        session.commit()
-
-    with Session(engine) as session:
-        quote = session.query(RealtimeQuote).first()
-        assert quote is not None
-        assert quote.symbol == "600000.SH"
-
-
-def test_store_account_snapshot_and_positions():
-    engine = create_sqlite_engine()
+def test_upsert_and_list_master_symbols(db_session: Session) -> None:
+    repo = PostgresDataRepository(db_session)
+    repo.upsert_master_symbols(
+        [
+            {
+                "symbol": "600000.SH",
+                "exchange": "SH",
+                "board": "主板",
+                "name": "浦发银行",
+                "is_st": False,
+                "listed_date": datetime(1999, 11, 10).date(),
+                "industry": "银行",
+                "market_cap": 1000000000.0,
+                "float_cap": 800000000.0,
+                "pe_ttm": 8.5,
+                "pb": 0.9,
+                "tick_size": 0.01,
+                "lot_size": 100,
+                "status": "active",
+                "as_of_date": datetime.utcnow().date(),
+                "version": 1,
+            }
+        ]
+    )
+    db_session.flush()
+
+    rows = db_session.query(MasterSymbol).all()
+    assert len(rows) == 1
+    symbols = repo.list_active_symbols()
+    assert symbols == ["600000.SH"]
+
+
+def test_upsert_realtime_quotes(db_session: Session) -> None:
+    repo = PostgresDataRepository(db_session)
+    repo.upsert_master_symbols(
+        [
+            {
+                "symbol": "600000.SH",
+                "exchange": "SH",
+                "board": "主板",
+                "name": "浦发银行",
+                "is_st": False,
+                "listed_date": datetime(1999, 11, 10).date(),
+                "industry": "银行",
+                "market_cap": 1000000000.0,
+                "float_cap": 800000000.0,
+                "pe_ttm": 8.5,
+                "pb": 0.9,
+                "tick_size": 0.01,
+                "lot_size": 100,
+                "status": "active",
+                "as_of_date": datetime.utcnow().date(),
+                "version": 1,
+            }
+        ]
+    )
+    repo.upsert_realtime_quotes(
+        [
+            {
+                "symbol": "600000.SH",
+                "name": "浦发银行",
+                "last_price": 10.5,
+                "change": 0.2,
+                "change_ratio": 1.5,
+                "volume": 1000000,
+                "amount": 10500000,
+                "snapshot_time": datetime.utcnow(),
+            }
+        ]
+    )
+    db_session.flush()
+
+    quote = db_session.query(RealtimeQuote).first()
+    assert quote is not None
+    assert quote.symbol == "600000.SH"
+
+
+def test_upsert_realtime_quotes_dedupes_and_chunks(db_session: Session, monkeypatch) -> None:
+    repo = PostgresDataRepository(db_session)
+    monkeypatch.setattr(PostgresDataRepository, "_UPSERT_CHUNK_SIZE", 2)
+    snapshot_time = datetime(2024, 1, 2, 9, 30)
+    written = repo.upsert_realtime_quotes(
+        [
+            {"symbol": "600000.SH", "last_price": 10.0, "snapshot_time": snapshot_time},
+            {"symbol": "000001.SZ", "last_price": 12.0, "snapshot_time": snapshot_time},
+            {"symbol": "600000.SH", "last_price": 10.5, "snapshot_time": snapshot_time},
+            {"symbol": "300750.SZ", "last_price": 180.0, "snapshot_time": snapshot_time},
+        ]
+    )
+    db_session.flush()
+
+    assert written == 3
+    quotes_table = RealtimeQuote.__table__
+    prices = dict(
+        db_session.execute(select(quotes_table.c.symbol, quotes_table.c.last_price)).all()
+    )
+    assert prices == {"600000.SH": 10.5, "000001.SZ": 12.0, "300750.SZ": 180.0}
+
+
+def test_bulk_upsert_updates_existing_rows_and_keeps_last_duplicate(db_session: Session) -> None:
+    repo = PostgresDataRepository(db_session)
+    first_time = datetime(2024, 1, 2, 9, 30)
+    second_time = datetime(2024, 1, 2, 9, 31)
+    repo._bulk_upsert(
+        RealtimeQuote,
+        [{"symbol": "600000.SH", "last_price": 10.0, "snapshot_time": first_time}],
+        key="symbol",
+    )
+    # 已存在的键走冲突更新；同一批内的重复键只保留最后一行
+    written = repo._bulk_upsert(
+        RealtimeQuote,
+        [
+            {"symbol": "600000.SH", "last_price": 10.5, "snapshot_time": second_time},
+            {"symbol": "000001.SZ", "last_price": 12.0, "snapshot_time": second_time},
+            {"symbol": "000001.SZ", "last_price": 12.5, "snapshot_time": second_time},
+        ],
+        key="symbol",
+    )
+    db_session.flush()
+
+    assert written == 2
+    quotes_table = RealtimeQuote.__table__
+    rows = db_session.execute(
+        select(quotes_table.c.symbol, quotes_table.c.last_price, quotes_table.c.snapshot_time)
+    ).all()
+    assert sorted(tuple(row) for row in rows) == [
+        ("000001.SZ", 12.5, second_time),
+        ("600000.SH", 10.5, second_time),
+    ]
+
+
+def test_store_account_snapshot_and_positions(db_session: Session) -> None:
     captured = datetime.utcnow()
-    with Session(engine) as session:
-        repo = PostgresDataRepository(session)
-        repo.store_account_snapshot(
-            captured_at=captured,
-            nav=1000000.0,
-            cash=500000.0,
-            available=400000.0,
-            posture=RiskPosture.CAUTIOUS,
-            positions=[
-                {"symbol": "600000.SH", "qty": 1000, "avg_price": 10.0, "market_value": 10500},
-            ],
-        )
-        session.commit()
-
-    with Session(engine) as session:
-        snapshot = session.query(AccountSnapshot).first()
-        assert snapshot is not None
-        assert snapshot.risk_posture == RiskPosture.CAUTIOUS
+    repo = PostgresDataRepository(db_session)
+    repo.store_account_snapshot(
+        captured_at=captured,
+        nav=1000000.0,
+        cash=500000.0,
+        available=400000.0,
+        posture=RiskPosture.CAUTIOUS,
+        positions=[
+            {"symbol": "600000.SH", "qty": 1000, "avg_price": 10.0, "market_value": 10500},
+        ],
+    )
+    db_session.flush()
+
+    snapshot = db_session.query(AccountSnapshot).first()
+    assert snapshot is not None
+    assert snapshot.risk_posture == RiskPosture.CAUTIOUS
+
+
+def test_universe_features_and_market_rules(db_session: Session) -> None:
+    repo = PostgresDataRepository(db_session)
+    repo.upsert_master_symbols(
+        [
+            {
+                "symbol": symbol,
+                "exchange": symbol[-2:],
+                "board": "主板",
+                "name": symbol,
+                "is_st": symbol == "000001.SZ",
+                "listed_date": datetime(2000, 1, 1).date(),
+                "industry": "银行",
+                "market_cap": 1.0,
+                "float_cap": 1.0,
+                "as_of_date": datetime(2025, 1, 1).date(),
+            }
+            for symbol in ("600000.SH", "000001.SZ")
+        ]
+    )
+    repo.upsert_realtime_quotes(
+        [{"symbol": "600000.SH", "last_price": 10.5, "change_ratio": 1.5, "snapshot_time": datetime(2025, 1, 2)}]
+    )
+    db_session.flush()
+
+    features = repo.to_universe_features(symbols=["000001.SZ", "600000.SH", "688000.SH"])
+    assert list(features) == ["000001.SZ", "600000.SH"]
+    assert features["600000.SH"]["last"] == 10.5
+    assert features["600000.SH"]["ret_5m"] == 0.015
+    assert features["000001.SZ"]["last"] is None
+    assert features["000001.SZ"]["risk_flags"] == ["st"]
+
+    rules = repo.get_market_rules(["600000.SH"])
+    assert rules["600000.SH"]["lot_size"] == 100
+    assert repo.to_position_payload() == []
+
+
+def test_upsert_master_symbols_tolerates_unparsable_values(db_session: Session, monkeypatch) -> None:
+    repo = PostgresDataRepository(db_session)
+    written: List[Mapping[str, object]] = []
+    monkeypatch.setattr(repo, "_bulk_upsert", lambda _model, rows, *, key: written.extend(rows))
+    repo.upsert_master_symbols(
+        [
+            {
+                "symbol": "600000.SH",
+                "listed_date": datetime(1999, 11, 10, 9, 30),
+                "market_cap": "-",
+                "pe_ttm": "-",
+                "pb": "0.9",
+            }
+        ]
+    )
+
+    # 单个脏值只置空该字段，不拒绝整批
+    (row,) = written
+    assert row["list_date"] == date(1999, 11, 10)
+    assert (row["market_cap"], row["pe_ttm"], row["pb"]) == (None, None, 0.9)
@@ -6,12 +6,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
-import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 
 from llm_trader.common import DataSourceError
 from llm_trader.data import DatasetKind, default_manager
-from llm_trader.config import get_settings
 from llm_trader.data.pipelines.realtime_quotes import RealtimeQuotesPipeline
 from llm_trader.data.repositories.parquet import ParquetRepository
 
@@ -52,31 +51,26 @@ def _sample_payload() -> Dict[str, object]:
     }
 
 
-def test_realtime_quotes_pipeline_sync(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("DATA_STORE_DIR", str(tmp_path / "data_store"))
-    get_settings.cache_clear()
+def test_realtime_quotes_pipeline_sync(isolated_data_store: Path) -> None:
     repository = ParquetRepository()
     pipeline = RealtimeQuotesPipeline(client=FakeClient(_sample_payload()), repository=repository)
 
     records = pipeline.sync(["600000.SH"])
     assert len(records) == 1
     assert records[0]["symbol"] == "600000.SH"
-    manager = default_manager()
+    manager = default_manager(base_dir=isolated_data_store)
     path = manager.path_for(
         DatasetKind.REALTIME_QUOTES,
         symbol="600000.SH",
         timestamp=records[0]["snapshot_time"],
     )
     assert path.exists()
-    df = pd.read_parquet(path)
-    assert df.iloc[0]["last_price"] == records[0]["last_price"]
+    table = pq.read_table(path, columns=["last_price"])
+    assert table.column(0)[0].as_py() == records[0]["last_price"]
 
 
-def test_realtime_quotes_pipeline_sync_uses_symbol_repository(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    monkeypatch.setenv("DATA_STORE_DIR", str(tmp_path / "data_store"))
-    get_settings.cache_clear()
+@pytest.mark.usefixtures("isolated_data_store")
+def test_realtime_quotes_pipeline_sync_uses_symbol_repository() -> None:
     repository = ParquetRepository()
     repository.write_symbols(
         [
@@ -136,9 +130,8 @@ def test_realtime_quotes_pipeline_sync_uses_symbol_repository(
     assert client.requests  # 确认已发起请求
 
 
-def test_realtime_quotes_pipeline_requires_symbols(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("DATA_STORE_DIR", str(tmp_path / "data_store"))
-    get_settings.cache_clear()
+@pytest.mark.usefixtures("isolated_data_store")
+def test_realtime_quotes_pipeline_requires_symbols() -> None:
     pipeline = RealtimeQuotesPipeline(client=FakeClient({"data": {"diff": []}}))
     with pytest.raises(DataSourceError):
         pipeline.sync()
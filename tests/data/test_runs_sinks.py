@@ -0,0 +1,31 @@
+"""交易历史摘要存储测试。"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Union
+
+import pytest
+
+from llm_trader.data.repositories.runs import InMemoryRunsSink, ParquetRunsSink
+
+
+def _record(minute: int, status: str, **extra: object) -> dict:
+    return {"timestamp": datetime(2024, 1, 2, 9, minute), "status": status, **extra}
+
+
+@pytest.mark.usefixtures("isolated_data_store")
+@pytest.mark.parametrize("sink_cls", [InMemoryRunsSink, ParquetRunsSink])
+def test_runs_sink_round_trip(sink_cls: type) -> None:
+    sink: Union[InMemoryRunsSink, ParquetRunsSink] = sink_cls()
+    assert sink.read("strategy", "session").empty
+
+    sink.write("strategy", "session", _record(30, "executed"))
+    # 后续记录新增字段时按列合并，旧记录缺失的列补空
+    sink.write("strategy", "session", _record(31, "rejected", alerts="[]"))
+    sink.write("strategy", "other-session", _record(32, "executed"))
+
+    frame = sink.read("strategy", "session")
+    assert frame["status"].tolist() == ["executed", "rejected"]
+    assert frame["alerts"].tolist() == [None, "[]"]
+    assert sink.read("strategy", "other-session")["status"].tolist() == ["executed"]
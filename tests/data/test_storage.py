@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import pickle
+import shutil
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from llm_trader.data import DataStoreManager, DatasetConfig, DatasetKind, default_manager
 
 
@@ -56,3 +60,44 @@ def test_directory_for_creates_folder(tmp_path: Path) -> None:
     directory = manager.directory_for(DatasetKind.FUNDAMENTALS)
     assert directory == tmp_path / "fundamentals"
     assert directory.exists()
+
+
+def test_build_path_parts_renders_templates(tmp_path: Path) -> None:
+    """路径片段应按模板展开，缺少模板变量时报错。"""
+
+    config = default_manager(base_dir=tmp_path).get(DatasetKind.OHLCV_INTRADAY)
+    dt = datetime(2024, 7, 1, 9, 30)
+    context = config.build_context(symbol="600000.SH", freq="5m", timestamp=dt)
+    assert config.build_path_parts("600000.SH", "5m", dt) == (
+        str(config.render_partition(context)),
+        config.render_filename(context),
+    )
+    with pytest.raises(ValueError):
+        config.build_path_parts("600000.SH", None, dt)
+
+    fallback = DatasetConfig(kind="custom", relative_dir="custom", filename_template="{symbol!s}.parquet")
+    assert fallback.build_path_parts("TEST") == (".", "TEST.parquet")
+
+
+def test_dataset_config_and_manager_are_picklable(tmp_path: Path) -> None:
+    """配置与管理器需可被 pickle，便于跨进程传递。"""
+
+    manager = default_manager(base_dir=tmp_path)
+    config = manager.get(DatasetKind.OHLCV_DAILY)
+    restored = pickle.loads(pickle.dumps(config))
+    assert restored == config
+    assert restored.build_path_parts("600000.SH", "D", datetime(2024, 7, 1)) == config.build_path_parts(
+        "600000.SH", "D", datetime(2024, 7, 1)
+    )
+    restored_manager = pickle.loads(pickle.dumps(manager))
+    assert restored_manager.path_for(DatasetKind.SYMBOLS) == manager.path_for(DatasetKind.SYMBOLS)
+
+
+def test_path_for_recreates_removed_directory(tmp_path: Path) -> None:
+    """运行期间分区目录被删除后，再次生成路径应重新创建目录。"""
+
+    manager = default_manager(base_dir=tmp_path)
+    path = manager.path_for(DatasetKind.REALTIME_QUOTES, symbol="600000.SH", timestamp=datetime(2024, 7, 1))
+    shutil.rmtree(path.parent)
+    path = manager.path_for(DatasetKind.REALTIME_QUOTES, symbol="600000.SH", timestamp=datetime(2024, 7, 1))
+    assert path.parent.exists()
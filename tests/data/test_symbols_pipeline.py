@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+import json
 from datetime import date
 from pathlib import Path
 
-import json
-
+import pyarrow as pa
 import pyarrow.parquet as pq
 import respx
 from httpx import Response
@@ -16,138 +16,127 @@ from llm_trader.data.pipelines.client import EastMoneyClient
 from llm_trader.data.pipelines.symbols import SymbolsPipeline
 from llm_trader.data.repositories.parquet import ParquetRepository
 
-
-@respx.mock
-def test_symbols_pipeline_sync(tmp_path: Path) -> None:
+# 模拟响应体在模块加载时序列化一次，各次拦截直接复用字节内容
+_JSON_HEADERS = {"content-type": "application/json"}
+_CLIST_BYTES = json.dumps(
+    {
+        "data": {
+            "total": 1,
+            "diff": [
+                {
+                    "f12": "600000",
+                    "f13": "SH",
+                    "f14": "浦发银行",
+                    "f100": "主板",
+                    "f26": "19991210",
+                    "f104": "",
+                    "f128": "银行",
+                    "f184": 1,
+                }
+            ],
+        }
+    },
+    ensure_ascii=False,
+).encode("utf-8")
+_SSE_BYTES = json.dumps(
+    {
+        "result": [
+            {
+                "SECURITY_CODE_A": "600000",
+                "SECURITY_ABBR_A": "浦发银行",
+                "BOARD_NAME": "上海主板",
+                "LISTING_DATE_A": "19991110",
+            }
+        ]
+    },
+    ensure_ascii=False,
+).encode("utf-8")
+_SZSE_BYTES = json.dumps(
+    [
+        {
+            "data": [
+                {
+                    "zqdm": "000001",
+                    "zqmc": "平安银行",
+                    "zqlb": "深圳主板",
+                    "ssrq": "19910403",
+                }
+            ]
+        }
+    ],
+    ensure_ascii=False,
+).encode("utf-8")
+
+
+def test_symbols_pipeline_sync(
+    tmp_path: Path,
+    em_client: EastMoneyClient,
+    eastmoney_router: respx.MockRouter,
+) -> None:
     """应正确下载并写入证券主表数据。"""
 
-    primary_route = respx.get("https://push2.eastmoney.com/api/qt/clist/get").mock(
-        return_value=Response(
-            200,
-            json={
-                "data": {
-                    "total": 1,
-                    "diff": [
-                        {
-                            "f12": "600000",
-                            "f13": "SH",
-                            "f14": "浦发银行",
-                            "f100": "主板",
-                            "f26": "19991210",
-                            "f104": "",
-                            "f128": "银行",
-                            "f184": 1,
-                        }
-                    ],
-                }
-            },
-        )
+    primary_route = eastmoney_router.get("https://push2.eastmoney.com/api/qt/clist/get").mock(
+        return_value=Response(200, content=_CLIST_BYTES, headers=_JSON_HEADERS)
     )
 
     manager = default_manager(base_dir=tmp_path)
     repository = ParquetRepository(manager=manager)
-    client = EastMoneyClient()
-    pipeline = SymbolsPipeline(client=client, repository=repository, page_size=100)
+    pipeline = SymbolsPipeline(client=em_client, repository=repository, page_size=100)
 
     records = pipeline.sync()
 
-    client.close()
     assert primary_route.called
     assert len(records) == 1
     output_path = manager.path_for(DatasetKind.SYMBOLS)
-    stored = pq.read_table(output_path).to_pylist()
+    table = pq.read_table(output_path)
+    # 低基数列只在 Parquet 层字典编码，读回的 Arrow 类型仍为 string
+    assert pa.types.is_string(table.schema.field("board").type)
+    row_group = pq.ParquetFile(output_path).metadata.row_group(0)
+    board_index = table.schema.get_field_index("board")
+    assert "RLE_DICTIONARY" in row_group.column(board_index).encodings
+    stored = table.to_pylist()
     assert stored[0]["symbol"] == "600000.SH"
     assert stored[0]["name"] == "浦发银行"
 
 
-@respx.mock
-def test_symbols_pipeline_endpoint_fallback(tmp_path: Path) -> None:
+def test_symbols_pipeline_endpoint_fallback(
+    tmp_path: Path,
+    em_client: EastMoneyClient,
+    eastmoney_unavailable: respx.MockRouter,
+) -> None:
     """当东方财富接口全部失败时，自动切换至交易所数据源。"""
 
-    respx.get("https://push2.eastmoney.com/api/qt/clist/get").mock(
-        return_value=Response(502, json={}),
+    sse_route = eastmoney_unavailable.get("https://query.sse.com.cn/security/stock/getStockListData2.do").mock(
+        return_value=Response(200, content=_SSE_BYTES, headers=_JSON_HEADERS)
     )
-    respx.get("https://80.push2.eastmoney.com/api/qt/clist/get").mock(
-        return_value=Response(502, json={}),
-    )
-    respx.get("https://81.push2.eastmoney.com/api/qt/clist/get").mock(
-        return_value=Response(502, json={}),
-    )
-    respx.get("https://82.push2.eastmoney.com/api/qt/clist/get").mock(
-        return_value=Response(502, json={}),
-    )
-    respx.get("https://83.push2.eastmoney.com/api/qt/clist/get").mock(
-        return_value=Response(502, json={}),
-    )
-
-    sse_route = respx.get("https://query.sse.com.cn/security/stock/getStockListData2.do").mock(
-        return_value=Response(
-            200,
-            content=json.dumps(
-                {
-                    "result": [
-                        {
-                            "SECURITY_CODE_A": "600000",
-                            "SECURITY_ABBR_A": "浦发银行",
-                            "BOARD_NAME": "上海主板",
-                            "LISTING_DATE_A": "19991110",
-                        }
-                    ]
-                }
-            ).encode("utf-8"),
-        )
-    )
-    szse_route = respx.get("https://www.szse.cn/api/report/ShowReport/data").mock(
-        return_value=Response(
-            200,
-            json=[
-                {
-                    "data": [
-                        {
-                            "zqdm": "000001",
-                            "zqmc": "平安银行",
-                            "zqlb": "深圳主板",
-                            "ssrq": "19910403",
-                        }
-                    ]
-                }
-            ],
-        )
+    szse_route = eastmoney_unavailable.get("https://www.szse.cn/api/report/ShowReport/data").mock(
+        return_value=Response(200, content=_SZSE_BYTES, headers=_JSON_HEADERS)
     )
 
     manager = default_manager(base_dir=tmp_path)
     repository = ParquetRepository(manager=manager)
-    client = EastMoneyClient()
-    pipeline = SymbolsPipeline(client=client, repository=repository, page_size=100)
+    pipeline = SymbolsPipeline(client=em_client, repository=repository, page_size=100)
 
     records = pipeline.sync()
 
-    client.close()
     assert sse_route.called
     assert szse_route.called
     symbols = {item["symbol"] for item in records}
     assert {"600000.SH", "000001.SZ"} <= symbols
 
 
-@respx.mock
-def test_symbols_pipeline_cache_fallback(tmp_path: Path) -> None:
+def test_symbols_pipeline_cache_fallback(
+    tmp_path: Path,
+    em_client: EastMoneyClient,
+    eastmoney_unavailable: respx.MockRouter,
+) -> None:
     """当所有线上接口不可用时，应读取缓存的证券主表。"""
 
-    # 东方财富所有端点均失败
-    for host in [
-        "https://push2.eastmoney.com/api/qt/clist/get",
-        "https://80.push2.eastmoney.com/api/qt/clist/get",
-        "https://81.push2.eastmoney.com/api/qt/clist/get",
-        "https://82.push2.eastmoney.com/api/qt/clist/get",
-        "https://83.push2.eastmoney.com/api/qt/clist/get",
-    ]:
-        respx.get(host).mock(return_value=Response(502, json={}))
-
     # 交易所接口返回 500，触发降级
-    sse_route = respx.get("https://query.sse.com.cn/security/stock/getStockListData2.do").mock(
+    sse_route = eastmoney_unavailable.get("https://query.sse.com.cn/security/stock/getStockListData2.do").mock(
         return_value=Response(500, text="error"),
     )
-    szse_route = respx.get("https://www.szse.cn/api/report/ShowReport/data").mock(
+    szse_route = eastmoney_unavailable.get("https://www.szse.cn/api/report/ShowReport/data").mock(
         return_value=Response(500, json={}),
     )
 
@@ -166,12 +155,10 @@ def test_symbols_pipeline_cache_fallback(tmp_path: Path) -> None:
         ]
     )
 
-    client = EastMoneyClient()
-    pipeline = SymbolsPipeline(client=client, repository=repository, page_size=100)
+    pipeline = SymbolsPipeline(client=em_client, repository=repository, page_size=100)
 
     records = pipeline.fetch()
 
-    client.close()
     assert sse_route.called
     assert szse_route.called
     assert len(records) == 1
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from datetime import datetime
 
-import pandas as pd
+import pyarrow.parquet as pq
 
 from llm_trader.data import DatasetKind, default_manager
 from llm_trader.data.repositories.parquet import ParquetRepository
@@ -39,9 +39,48 @@ def test_write_trading_orders_merges_by_order_id(tmp_path) -> None:
 
     manager = repo.manager
     path = manager.path_for(DatasetKind.TRADING_ORDERS, symbol="session-a", freq="strategy-x", timestamp=dt)
-    df = pd.read_parquet(path)
-    assert len(df) == 1
-    assert df.iloc[0]["order_id"] == "o-1"
+    order_ids = pq.read_table(path, columns=["order_id"]).column(0).to_pylist()
+    assert order_ids == ["o-1"]
+
+
+def test_write_trading_orders_columnar_merges_with_existing(tmp_path) -> None:
+    repo = _build_repository(tmp_path)
+    dt = datetime(2024, 1, 1, 9, 30)
+    repo.write_trading_orders(
+        "session-a",
+        "strategy-x",
+        dt,
+        [
+            {
+                "order_id": "o-1",
+                "symbol": "600000.SH",
+                "side": "buy",
+                "volume": 100,
+                "price": 10.0,
+                "status": "created",
+                "filled_volume": 0,
+                "filled_amount": 0.0,
+                "created_at": dt,
+            }
+        ],
+    )
+    columns = {
+        "order_id": ["o-2", "o-1"],
+        "symbol": ["600001.SH", "600000.SH"],
+        "side": ["sell", "buy"],
+        "volume": [200, 100],
+        "price": [8.0, 10.0],
+        "status": ["filled", "filled"],
+        "filled_volume": [200, 100],
+        "filled_amount": [1600.0, 1000.0],
+        "created_at": [dt.replace(minute=31), dt],
+    }
+    repo.write_trading_orders_columnar("session-a", "strategy-x", dt, columns)
+
+    path = repo.manager.path_for(DatasetKind.TRADING_ORDERS, symbol="session-a", freq="strategy-x", timestamp=dt)
+    table = pq.read_table(path, columns=["order_id", "status"])
+    assert table.column("order_id").to_pylist() == ["o-1", "o-2"]
+    assert table.column("status")[0].as_py() == "filled"
 
 
 def test_write_trading_trades_records(tmp_path) -> None:
@@ -64,9 +103,8 @@ def test_write_trading_trades_records(tmp_path) -> None:
 
     manager = repo.manager
     path = manager.path_for(DatasetKind.TRADING_TRADES, symbol="session-a", freq="strategy-x", timestamp=dt)
-    df = pd.read_parquet(path)
-    assert len(df) == 1
-    assert df.iloc[0]["trade_id"] == "t-1"
+    trade_ids = pq.read_table(path, columns=["trade_id"]).column(0).to_pylist()
+    assert trade_ids == ["t-1"]
 
 
 def test_write_trading_equity_appends(tmp_path) -> None:
@@ -95,9 +133,52 @@ def test_write_trading_equity_appends(tmp_path) -> None:
         freq="strategy-x",
         timestamp=later["timestamp"],
     )
-    df = pd.read_parquet(path)
-    assert len(df) == 2
-    assert df.iloc[-1]["equity"] == later["equity"]
+    equity = pq.read_table(path, columns=["equity"]).column(0).to_pylist()
+    assert len(equity) == 2
+    assert equity[-1] == later["equity"]
+
+
+def test_write_trading_tick_writes_all_datasets(tmp_path) -> None:
+    repo = _build_repository(tmp_path)
+    dt = datetime(2024, 1, 1, 9, 50)
+    repo.write_trading_tick(
+        "session-a",
+        "strategy-x",
+        dt,
+        orders_columns={
+            "order_id": ["o-1"],
+            "symbol": ["600000.SH"],
+            "side": ["buy"],
+            "volume": [100],
+            "price": [10.0],
+            "status": ["filled"],
+            "filled_volume": [100],
+            "filled_amount": [1000.0],
+            "created_at": [dt],
+        },
+        trades_columns={
+            "trade_id": ["t-1"],
+            "order_id": ["o-1"],
+            "symbol": ["600000.SH"],
+            "side": ["buy"],
+            "volume": [100],
+            "price": [10.0],
+            "fee": [5.0],
+            "tax": [0.0],
+            "timestamp": [dt],
+        },
+        equity_snapshots=[
+            {"timestamp": dt, "cash": 99000.0, "equity": 100000.0, "positions": "[]"},
+            {"timestamp": dt.replace(minute=55), "cash": 99000.0, "equity": 100100.0, "positions": "[]"},
+        ],
+    )
+
+    manager = repo.manager
+    kwargs = {"symbol": "session-a", "freq": "strategy-x", "timestamp": dt}
+    assert pq.read_metadata(manager.path_for(DatasetKind.TRADING_ORDERS, **kwargs)).num_rows == 1
+    assert pq.read_metadata(manager.path_for(DatasetKind.TRADING_TRADES, **kwargs)).num_rows == 1
+    equity = pq.read_table(manager.path_for(DatasetKind.TRADING_EQUITY, **kwargs), columns=["equity"])
+    assert equity.column(0).to_pylist() == [100000.0, 100100.0]
 
 
 def test_write_trading_run_summary(tmp_path) -> None:
@@ -130,7 +211,37 @@ def test_write_trading_run_summary(tmp_path) -> None:
         freq="session-a",
         ensure_dir=False,
     )
-    df = pd.read_parquet(path)
-    assert df.shape[0] == 1
-    assert df.iloc[0]["orders_executed"] == 2
-    assert df.iloc[0]["status"] == "executed"
+    table = pq.read_table(path, columns=["orders_executed", "status"])
+    assert table.num_rows == 1
+    assert table.column("orders_executed")[0].as_py() == 2
+    assert table.column("status")[0].as_py() == "executed"
+
+
+def test_write_trading_equity_many_merges_batch(tmp_path) -> None:
+    repo = _build_repository(tmp_path)
+    dt = datetime(2024, 1, 1, 9, 40)
+    repo.write_trading_equity("session-a", "strategy-x", {"timestamp": dt, "cash": 1.0, "equity": 1.0})
+    repo.write_trading_equity_many(
+        "session-a",
+        "strategy-x",
+        [
+            {"timestamp": dt.replace(minute=50), "cash": 3.0, "equity": 3.0},
+            {"timestamp": dt, "cash": 2.0, "equity": 2.0},
+        ],
+    )
+
+    path = repo.manager.path_for(DatasetKind.TRADING_EQUITY, symbol="session-a", freq="strategy-x", timestamp=dt)
+    equity = pq.read_table(path, columns=["equity"]).column(0).to_pylist()
+    assert equity == [2.0, 3.0]
+
+
+def test_write_options_override_dataset_defaults(tmp_path) -> None:
+    manager = default_manager(base_dir=tmp_path / "data_store")
+    records = [{"symbol": "600000.SH", "name": "浦发银行", "board": "main", "exchange": "SH"}]
+
+    path = ParquetRepository(manager=manager).write_symbols(records)
+    assert pq.ParquetFile(path).metadata.row_group(0).column(0).compression == "UNCOMPRESSED"
+
+    repo = ParquetRepository(manager=manager, write_options={"compression": "snappy"})
+    path = repo.write_symbols(records)
+    assert pq.ParquetFile(path).metadata.row_group(0).column(0).compression == "SNAPPY"
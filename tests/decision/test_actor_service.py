@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict
 
 import pytest
+from pydantic import ValidationError
 
 from llm_trader.decision.actor import ActorContext, ActorService
 from llm_trader.decision.checker import CheckerContext, CheckerService
@@ -120,3 +121,41 @@ def test_actor_service_raises_on_invalid_response():
     context = ActorContext(session_id="session", strategy_id="strategy", objective="demo")
     with pytest.raises(Exception):
         actor.generate_decision(_sample_observation(), context=context)
+
+
+def test_actor_decision_requires_actions_and_order_fields():
+    base = {
+        "decision_id": "d-1",
+        "timestamp": "2025-01-01T00:00:00Z",
+        "observations_ref": "obs-1",
+        "account_view": {"nav": 1.0},
+    }
+    with pytest.raises(ValidationError):
+        ActorDecisionPayload.model_validate({**base, "actions": []})
+    with pytest.raises(ValidationError, match="side, qty"):
+        ActorDecisionPayload.model_validate(
+            {**base, "actions": [{"type": "place_order", "symbol": "600000.SH", "order_type": "market"}]}
+        )
+    limit_order = {"type": "place_order", "symbol": "600000.SH", "side": "buy", "order_type": "limit", "qty": 100}
+    with pytest.raises(ValidationError, match="price"):
+        ActorDecisionPayload.model_validate({**base, "actions": [limit_order]})
+    with pytest.raises(ValidationError, match="target_order_id"):
+        ActorDecisionPayload.model_validate({**base, "actions": [{"type": "cancel_order"}]})
+    decision = ActorDecisionPayload.model_validate(
+        {**base, "actions": [{**limit_order, "price": 10.0}, {"type": "no_op"}]}
+    )
+    assert [action.type for action in decision.actions] == ["place_order", "no_op"]
+
+
+def test_actor_service_extracts_fenced_json():
+    content = (
+        "以下为决策：\n```json\n"
+        '{"decision_id": "dec-2", "timestamp": "2025-01-01T09:30:00Z", "observations_ref": "obs-1",'
+        ' "account_view": {"nav": 1.0}, "actions": [{"type": "no_op"}]}'
+        "\n```"
+    )
+    gateway = _StubGateway({"choices": [{"message": {"content": content}}]})
+    actor = ActorService(gateway)
+    context = ActorContext(session_id="session", strategy_id="strategy", objective="demo")
+    decision = actor.generate_decision(_sample_observation(), context=context)
+    assert decision.decision_id == "dec-2"
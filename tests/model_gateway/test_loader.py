@@ -9,6 +9,7 @@ import pytest
 from llm_trader.model_gateway.config import ModelEndpointSettings
 from llm_trader.model_gateway.loader import (
     build_gateway_settings_from_records,
+    invalidate_gateway_settings,
     load_gateway_settings,
 )
 
@@ -94,7 +95,7 @@ def test_load_gateway_settings_uses_db_records(monkeypatch: pytest.MonkeyPatch)
         def __exit__(self, exc_type, exc, tb):
             return False
 
-        def exec(self, statement):
+        def exec(self, _statement):
             return _StubResult(self.records)
 
     class _Factory:
@@ -103,3 +104,40 @@ def test_load_gateway_settings_uses_db_records(monkeypatch: pytest.MonkeyPatch)
 
     settings = load_gateway_settings(_Factory())
     assert settings.endpoints[0].name == "claude"
+
+
+def test_load_gateway_settings_caches_until_invalidated() -> None:
+    records = [_sample_endpoint(model_alias="cached")]
+    calls: List[int] = []
+
+    class _StubResult(list):
+        def all(self) -> List[Any]:
+            return list(self)
+
+    class _StubSession:
+        def __enter__(self):
+            calls.append(1)
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def exec(self, _statement):
+            return _StubResult(records)
+
+    class _Factory:
+        def __call__(self):
+            return _StubSession()
+
+    factory = _Factory()
+    first = load_gateway_settings(factory)
+    second = load_gateway_settings(factory)
+    assert second is first
+    assert len(calls) == 1
+
+    invalidate_gateway_settings()
+    third = load_gateway_settings(factory)
+    assert third.endpoints[0].name == "cached"
+    assert len(calls) == 2
+    load_gateway_settings(factory, use_cache=False)
+    assert len(calls) == 3
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from typing import Dict
 
 import pytest
@@ -120,6 +121,52 @@ def test_chat_completions_fallback_on_failure(monkeypatch: pytest.MonkeyPatch) -
 
     recorded = factory.session.records[0]
     assert isinstance(recorded.prompt_hash, str)
+    assert len(recorded.prompt_hash) == 32
+    int(recorded.prompt_hash, 16)
+
+
+@respx.mock
+def test_chat_completions_hedges_slow_primary(monkeypatch: pytest.MonkeyPatch) -> None:
+    endpoints = [
+        ModelEndpointSettings(name="slow", base_url="https://slow-llm"),
+        ModelEndpointSettings(name="fast", base_url="https://fast-llm"),
+    ]
+    settings = ModelGatewaySettings(endpoints=endpoints, hedge_delay_ms=20)
+    factory = _StubSessionFactory()
+    monkeypatch.setattr("llm_trader.model_gateway.service.LLMCallAudit", _StubAudit)
+    gateway = ModelGateway(settings=settings, session_factory=factory)
+    monkeypatch.setattr(gateway, "_weighted_attempts", lambda items: list(items))
+
+    release = threading.Event()
+    finished = threading.Event()
+
+    def slow_response(_request):
+        release.wait(1.0)
+        finished.set()
+        return Response(200, json={"choices": [{"message": {"role": "assistant", "content": "SLOW"}}]})
+
+    respx.post("https://slow-llm/v1/chat/completions").mock(side_effect=slow_response)
+    respx.post("https://fast-llm/v1/chat/completions").mock(
+        return_value=Response(200, json={"choices": [{"message": {"role": "assistant", "content": "FAST"}}]})
+    )
+
+    try:
+        result = gateway.chat_completions({"messages": [{"role": "user", "content": "hedge"}]})
+        assert not finished.is_set()  # 主端点仍未返回时已由备用端点给出结果
+        executor = gateway._executor
+        release.set()
+        gateway.chat_completions({"messages": [{"role": "user", "content": "again"}]})
+        assert gateway._executor is executor  # 对冲线程池在多次调用间复用
+    finally:
+        release.set()
+        # close 会等待落后的主端点请求结束后再关闭客户端
+        gateway.close()
+
+    assert finished.is_set()
+    assert gateway._executor is None
+    assert result.endpoint.name == "fast"
+    assert result.payload["choices"][0]["message"]["content"] == "FAST"
+    assert len(factory.session.records) == 2
 
 
 def test_model_gateway_loads_settings_when_none(monkeypatch: pytest.MonkeyPatch) -> None:
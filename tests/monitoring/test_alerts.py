@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime
 from io import StringIO
 import sys
 
@@ -17,3 +18,16 @@ def test_alert_emitter_stdout(monkeypatch) -> None:
     output = json.loads(buffer.getvalue())
     assert output["message"] == "test"
     assert output["details"]["k"] == 1
+
+
+def test_alert_emitter_stdout_serialises_datetime(monkeypatch) -> None:
+    buffer = StringIO()
+    monkeypatch.setattr(sys, "stdout", buffer)
+    emitter = AlertEmitter(channel="stdout")
+    emitter.emit("行情延迟", details={"as_of": datetime(2024, 1, 2, 9, 30)})
+    emitter.emit("second")
+    lines = buffer.getvalue().splitlines()
+    assert len(lines) == 2
+    first = json.loads(lines[0])
+    assert first["message"] == "行情延迟"
+    assert first["details"]["as_of"].startswith("2024-01-02")
@@ -2,19 +2,28 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from datetime import datetime, timedelta
+from typing import Callable, Iterator
 
+import pytest
 from sqlalchemy import func
-from sqlmodel import Session, SQLModel, create_engine, select
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, select
 
 from llm_trader.db.models import Observation
 
 from llm_trader.data.repositories.postgres import PostgresDataRepository
-from llm_trader.observation import ObservationBuilder
-from llm_trader.db.models.enums import RiskPosture
+from llm_trader.common.serialization import loads
+from llm_trader.observation import ObservationBuilder, ObservationPayload
+from llm_trader.db.models.enums import ClockPhase, RiskPosture
 
+_SEED_TIME = datetime.utcnow()
 
-def create_engine_and_seed():
-    engine = create_engine("sqlite:///:memory:", echo=False)
+
+@pytest.fixture(scope="module")
+def seeded_engine(sqlite_engine_factory: Callable[[], Engine]) -> Engine:
+    """模块级引擎：建表与种子数据只执行一次。"""
+
+    engine = sqlite_engine_factory()
     SQLModel.metadata.create_all(engine)
     with Session(engine) as session:
         repo = PostgresDataRepository(session)
@@ -35,7 +44,7 @@ def create_engine_and_seed():
                     "tick_size": 0.01,
                     "lot_size": 100,
                     "status": "active",
-                    "as_of_date": datetime.utcnow().date(),
+                    "as_of_date": _SEED_TIME.date(),
                     "version": 1,
                 }
             ]
@@ -50,12 +59,12 @@ def create_engine_and_seed():
                     "change_ratio": 1.5,
                     "volume": 1000000,
                     "amount": 10500000,
-                    "snapshot_time": datetime.utcnow(),
+                    "snapshot_time": _SEED_TIME,
                 }
             ]
         )
         repo.store_account_snapshot(
-            captured_at=datetime.utcnow(),
+            captured_at=_SEED_TIME,
             nav=1000000.0,
             cash=500000.0,
             available=400000.0,
@@ -68,6 +77,30 @@ def create_engine_and_seed():
     return engine
 
 
+@pytest.fixture
+def session_factory(seeded_engine: Engine) -> Iterator[Callable[[], Session]]:
+    """用例内的会话工厂，所有写入位于外层事务中，结束时回滚以保持种子数据不变。"""
+
+    connection = seeded_engine.connect()
+    transaction = connection.begin()
+
+    @contextmanager
+    def factory():
+        with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+
+    try:
+        yield factory
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
 class FakeRedis:
     def __init__(self) -> None:
         self._store: Dict[str, tuple[str, datetime]] = {}
@@ -87,43 +120,19 @@ class FakeRedis:
         return value
 
 
-def test_observation_builder_creates_record():
-    engine = create_engine_and_seed()
-
-    @contextmanager
-    def session_factory():
-        with Session(engine) as session:
-            try:
-                yield session
-                session.commit()
-            except Exception:
-                session.rollback()
-                raise
-
+def test_observation_builder_creates_record(session_factory) -> None:
     builder = ObservationBuilder(session_factory=session_factory, symbol_universe_limit=10)
     payload = builder.build()
     assert payload.universe
     assert "600000.SH" in payload.features
     assert payload.account["nav"] > 0
 
-    with Session(engine) as session:
+    with session_factory() as session:
         count = session.exec(select(func.count()).select_from(Observation)).one()
         assert count == 1
 
 
-def test_observation_builder_uses_cache(monkeypatch) -> None:
-    engine = create_engine_and_seed()
-
-    @contextmanager
-    def session_factory():
-        with Session(engine) as session:
-            try:
-                yield session
-                session.commit()
-            except Exception:
-                session.rollback()
-                raise
-
+def test_observation_builder_uses_cache(session_factory) -> None:
     redis_client = FakeRedis()
     builder = ObservationBuilder(
         session_factory=session_factory,
@@ -137,6 +146,36 @@ def test_observation_builder_uses_cache(monkeypatch) -> None:
     metrics = builder.cache_metrics
     assert metrics["hits"] >= 1
     assert metrics["misses"] >= 1
-    with Session(engine) as session:
+    with session_factory() as session:
         count = session.exec(select(func.count()).select_from(Observation)).one()
         assert count == 1
+
+
+def test_detect_clock_phase_uses_generated_at() -> None:
+    builder = ObservationBuilder(session_factory=None)
+    # 生成时刻为 UTC，换算北京时间（UTC+8）后判断交易阶段
+    assert builder._detect_clock_phase(datetime(2024, 1, 2, 1, 0)) == ClockPhase.PRE_OPEN
+    assert builder._detect_clock_phase(datetime(2024, 1, 2, 1, 30)) == ClockPhase.CONTINUOUS_TRADING
+    assert builder._detect_clock_phase(datetime(2024, 1, 2, 4, 0)) == ClockPhase.OFF_MARKET
+    assert builder._detect_clock_phase(datetime(2024, 1, 2, 7, 0)) == ClockPhase.CONTINUOUS_TRADING
+    assert builder._detect_clock_phase(datetime(2024, 1, 2, 7, 1)) == ClockPhase.CLOSE
+
+
+def test_observation_payload_json_round_trip() -> None:
+    generated_at = datetime(2024, 1, 2, 1, 30, 0, 250000)
+    payload = ObservationPayload(
+        observation_id="obs-1",
+        generated_at=generated_at,
+        valid_ttl_ms=3000,
+        clock={"phase": ClockPhase.CONTINUOUS_TRADING.value},
+        account={"nav": 1.0},
+        positions=[],
+        universe=["600000.SH"],
+        features={"600000.SH": {"last_price": 10.5}},
+        market_rules={},
+    )
+    data = loads(payload.to_json())
+    assert data["generated_at"] == payload.to_dict()["generated_at"]
+    restored = ObservationPayload.from_dict(data)
+    assert restored.generated_at == generated_at
+    assert restored.features == payload.features
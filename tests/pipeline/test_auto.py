@@ -3,70 +3,66 @@
 from __future__ import annotations
 
 from datetime import datetime
-from pathlib import Path
+from typing import Dict, List, Tuple
 
-import pandas as pd
+import pytest
 
-from llm_trader.config import get_settings
-from llm_trader.pipeline.auto import BacktestCriteria, AutoTradingConfig, run_full_automation
+from llm_trader.pipeline.auto import BacktestCriteria, AutoTradingConfig, InMemoryRunsSink, run_full_automation
 from llm_trader.trading import TradingCycleConfig, ManagedTradingResult, TradingSession, TradingSessionConfig, RiskDecision
 from llm_trader.strategy.llm_generator import LLMStrategySuggestion
 from llm_trader.strategy.engine import RuleConfig
 
-
-class PipelineFakeGenerator:
-    def __init__(self) -> None:
-        self.last_prompt = "prompt"
-        self.last_raw_response = "response"
-        self._suggestion = LLMStrategySuggestion(
-            description="test",
-            rules=[
-                RuleConfig(
-                    indicator="sma",
-                    column="close",
-                    params={"window": 1},
-                    operator=">",
-                    threshold=9.0,
-                )
-            ],
-            selected_symbols=["600000.SH"],
+# 各测试只读取建议内容，模块级构建一次即可
+_FAKE_SUGGESTION = LLMStrategySuggestion(
+    description="test",
+    rules=[
+        RuleConfig(
+            indicator="sma",
+            column="close",
+            params={"window": 1},
+            operator=">",
+            threshold=9.0,
         )
-
-    def generate(self, context):
-        return self._suggestion
-
-
-def _load_mock_bars(*_args, **_kwargs):
-    return [
-        {
-            "symbol": "600000.SH",
-            "dt": datetime(2024, 1, 1, 9, 30),
-            "freq": "D",
-            "open": 9.5,
-            "high": 10.2,
-            "low": 9.4,
-            "close": 10.1,
-            "volume": 100000,
-            "amount": 1000000,
-        },
-        {
-            "symbol": "600000.SH",
-            "dt": datetime(2024, 1, 2, 9, 30),
-            "freq": "D",
-            "open": 10.0,
-            "high": 10.4,
-            "low": 9.8,
-            "close": 10.6,
-            "volume": 120000,
-            "amount": 1230000,
-        },
-    ]
-
-
-def test_full_automation_executes(tmp_path: Path, monkeypatch) -> None:
-    base_dir = tmp_path / "data_store"
-    monkeypatch.setenv("DATA_STORE_DIR", str(base_dir))
-    get_settings.cache_clear()
+    ],
+    selected_symbols=["600000.SH"],
+)
+
+
+# 回测只读取行情字段，模块级构建一次，每次调用仅返回新的列表外壳
+_MOCK_BARS: Tuple[Dict[str, object], ...] = (
+    {
+        "symbol": "600000.SH",
+        "dt": datetime(2024, 1, 1, 9, 30),
+        "freq": "D",
+        "open": 9.5,
+        "high": 10.2,
+        "low": 9.4,
+        "close": 10.1,
+        "volume": 100000,
+        "amount": 1000000,
+    },
+    {
+        "symbol": "600000.SH",
+        "dt": datetime(2024, 1, 2, 9, 30),
+        "freq": "D",
+        "open": 10.0,
+        "high": 10.4,
+        "low": 9.8,
+        "close": 10.6,
+        "volume": 120000,
+        "amount": 1230000,
+    },
+)
+
+
+def _load_mock_bars(*_args, **_kwargs) -> List[Dict[str, object]]:
+    return list(_MOCK_BARS)
+
+
+@pytest.mark.usefixtures("isolated_data_store")
+def test_full_automation_executes(monkeypatch) -> None:
+    runs_sink = InMemoryRunsSink()
+    monkeypatch.setattr("llm_trader.pipeline.auto._default_runs_sink", runs_sink)
     config = AutoTradingConfig(
         trading=TradingCycleConfig(
             session_id="session",
@@ -86,7 +82,7 @@ def test_full_automation_executes(tmp_path: Path, monkeypatch) -> None:
             TradingSessionConfig(session_id="session", strategy_id="strategy")
         )
         return {
-            "suggestion": PipelineFakeGenerator().generate(None),
+            "suggestion": _FAKE_SUGGESTION,
             "quotes": [],
             "orders_executed": 0,
             "trades_filled": 0,
@@ -102,7 +98,7 @@ def test_full_automation_executes(tmp_path: Path, monkeypatch) -> None:
     managed_result = ManagedTradingResult(
         decision=RiskDecision(proceed=True, alerts=[]),
         raw_result={
-            "suggestion": PipelineFakeGenerator().generate(None),
+            "suggestion": _FAKE_SUGGESTION,
             "selected_symbols": ["600000.SH"],
             "llm_prompt": "prompt",
             "llm_response": "response",
@@ -121,17 +117,14 @@ def test_full_automation_executes(tmp_path: Path, monkeypatch) -> None:
         assert "manifest" in result.report_paths
         for attachment in result.report_paths.values():
             assert attachment.exists()
-    runs_path = base_dir / "trading" / "runs" / "strategy=strategy" / "session=session" / "runs.parquet"
-    assert runs_path.exists()
-    df = pd.read_parquet(runs_path)
+    df = runs_sink.read("strategy", "session")
     assert not df.empty
     assert df.iloc[-1]["status"] == "executed"
     assert df.iloc[-1]["orders_executed"] == 1
 
 
-def test_full_automation_rejects_on_backtest(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("DATA_STORE_DIR", str(tmp_path / "data_store"))
-    get_settings.cache_clear()
+@pytest.mark.usefixtures("isolated_data_store")
+def test_full_automation_rejects_on_backtest(monkeypatch) -> None:
     config = AutoTradingConfig(
         trading=TradingCycleConfig(
             session_id="session",
@@ -151,7 +144,7 @@ def test_full_automation_rejects_on_backtest(tmp_path: Path, monkeypatch) -> Non
             TradingSessionConfig(session_id="session", strategy_id="strategy")
         )
         return {
-            "suggestion": PipelineFakeGenerator().generate(None),
+            "suggestion": _FAKE_SUGGESTION,
             "quotes": [],
             "orders_executed": 0,
             "trades_filled": 0,
@@ -4,12 +4,12 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import List
 
 from scripts.run_full_pipeline import (
     PipelineController,
     STATUS_FILENAME,
 )
-from llm_trader.config import get_settings
 from llm_trader.pipeline.auto import AutoTradingResult
 
 
@@ -17,16 +17,9 @@ def _status_path(base_dir: Path) -> Path:
     return base_dir / STATUS_FILENAME
 
 
-def _reset_settings_cache() -> None:
-    get_settings.cache_clear()
-
-
-def test_pipeline_controller_success(tmp_path, monkeypatch) -> None:
+def test_pipeline_controller_success(tmp_path, monkeypatch, settings_factory) -> None:
     report_dir = tmp_path / "reports"
-    monkeypatch.setenv("REPORT_OUTPUT_DIR", str(report_dir))
-    monkeypatch.setenv("TRADING_EXECUTION_MODE", "sandbox")
-    _reset_settings_cache()
-    monkeypatch.addfinalizer(_reset_settings_cache)
+    settings_factory(trading={"execution_mode": "sandbox", "report_output_dir": str(report_dir)})
 
     monkeypatch.setattr("scripts.run_full_pipeline._sync_data", lambda _repo: None)
 
@@ -51,12 +44,9 @@ def test_pipeline_controller_success(tmp_path, monkeypatch) -> None:
     assert "report_generation" in stage_names
 
 
-def test_pipeline_controller_live_mode_runs_with_warning(tmp_path, monkeypatch) -> None:
+def test_pipeline_controller_live_mode_runs_with_warning(tmp_path, monkeypatch, settings_factory) -> None:
     report_dir = tmp_path / "reports"
-    monkeypatch.setenv("REPORT_OUTPUT_DIR", str(report_dir))
-    monkeypatch.setenv("TRADING_EXECUTION_MODE", "live")
-    _reset_settings_cache()
-    monkeypatch.addfinalizer(_reset_settings_cache)
+    settings_factory(trading={"execution_mode": "live", "report_output_dir": str(report_dir)})
 
     monkeypatch.setattr("scripts.run_full_pipeline._sync_data", lambda _repo: None)
     auto_result = AutoTradingResult(
@@ -67,22 +57,20 @@ def test_pipeline_controller_live_mode_runs_with_warning(tmp_path, monkeypatch)
     )
     monkeypatch.setattr("scripts.run_full_pipeline.run_full_automation", lambda _cfg: auto_result)
 
-    controller = PipelineController(status_dir=report_dir)
+    writes: List[str] = []
+    controller = PipelineController(status_dir=report_dir, status_writer=writes.append)
     status = controller.run()
 
-    payload = json.loads(_status_path(report_dir).read_text(encoding="utf-8"))
+    payload = json.loads(writes[-1])
     preflight = payload["stages"][0]
     assert preflight["status"] == "success"
     assert status.blocked is False
     assert any("mock" in warn for warn in payload.get("warnings", []))
 
 
-def test_pipeline_controller_records_sync_failure(tmp_path, monkeypatch) -> None:
+def test_pipeline_controller_records_sync_failure(tmp_path, monkeypatch, settings_factory) -> None:
     report_dir = tmp_path / "reports"
-    monkeypatch.setenv("REPORT_OUTPUT_DIR", str(report_dir))
-    monkeypatch.setenv("TRADING_EXECUTION_MODE", "sandbox")
-    _reset_settings_cache()
-    monkeypatch.addfinalizer(_reset_settings_cache)
+    settings_factory(trading={"execution_mode": "sandbox", "report_output_dir": str(report_dir)})
 
     def _failing_sync(_repo):
         raise RuntimeError("sync boom")
@@ -96,20 +84,18 @@ def test_pipeline_controller_records_sync_failure(tmp_path, monkeypatch) -> None
     )
     monkeypatch.setattr("scripts.run_full_pipeline.run_full_automation", lambda _cfg: auto_result)
 
-    controller = PipelineController(status_dir=report_dir)
+    writes: List[str] = []
+    controller = PipelineController(status_dir=report_dir, status_writer=writes.append)
     status = controller.run()
 
-    payload = json.loads(_status_path(report_dir).read_text(encoding="utf-8"))
+    payload = json.loads(writes[-1])
     assert status.failed is True
     assert any(stage["status"] == "failed" for stage in payload["stages"])
 
 
-def test_pipeline_controller_emits_alert_on_failure(tmp_path, monkeypatch) -> None:
+def test_pipeline_controller_emits_alert_on_failure(tmp_path, monkeypatch, settings_factory) -> None:
     report_dir = tmp_path / "reports"
-    monkeypatch.setenv("REPORT_OUTPUT_DIR", str(report_dir))
-    monkeypatch.setenv("TRADING_EXECUTION_MODE", "sandbox")
-    _reset_settings_cache()
-    monkeypatch.addfinalizer(_reset_settings_cache)
+    settings_factory(trading={"execution_mode": "sandbox", "report_output_dir": str(report_dir)})
 
     monkeypatch.setattr("scripts.run_full_pipeline._sync_data", lambda _repo: None)
 
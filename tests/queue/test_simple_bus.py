@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import time
+import threading
 
 from llm_trader.queue import SimpleEventBus
 
@@ -10,11 +10,16 @@ from llm_trader.queue import SimpleEventBus
 def test_simple_event_bus() -> None:
     bus = SimpleEventBus()
     results = []
+    delivered = threading.Event()
 
-    bus.subscribe("trade", lambda payload: results.append(payload["id"]))
+    def handler(payload) -> None:
+        results.append(payload["id"])
+        delivered.set()
+
+    bus.subscribe("trade", handler)
     bus.start()
     bus.publish("trade", {"id": 1})
-    time.sleep(0.1)
+    assert delivered.wait(timeout=1.0)
     bus.stop()
 
     assert results == [1]
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime
 from pathlib import Path
 
-from llm_trader.scheduler import build_scheduler_config, export_scheduler_config
+from llm_trader.scheduler import build_scheduler_config, export_scheduler_config, start_scheduler_from_dict
 from llm_trader.config.settings import AppSettings, SchedulerSettings, TradingSettings
+from tests.scheduler import stubs
 
 
-def _make_settings() -> AppSettings:
-    trading = TradingSettings(
+# 构建测试均只读取配置，模块级只构建一次并共享同一实例
+_BASE_SETTINGS = AppSettings(
+    trading=TradingSettings(
         session_id="session-demo",
         strategy_id="strategy-demo",
         symbols=["600000.SH", "000001.SZ"],
@@ -23,13 +26,13 @@ def _make_settings() -> AppSettings:
         symbol_universe_limit=100,
         scheduler_interval_minutes=15,
         selection_metric="amount",
-    )
-    scheduler = SchedulerSettings(timezone="Asia/Shanghai", enabled=True)
-    return AppSettings(trading=trading, scheduler=scheduler)
+    ),
+    scheduler=SchedulerSettings(timezone="Asia/Shanghai", enabled=True),
+)
 
 
 def test_build_scheduler_config_produces_three_jobs() -> None:
-    settings = _make_settings()
+    settings = _BASE_SETTINGS
     payload = build_scheduler_config(settings)
 
     assert payload["timezone"] == "Asia/Shanghai"
@@ -47,7 +50,7 @@ def test_build_scheduler_config_produces_three_jobs() -> None:
 
 
 def test_export_scheduler_config_writes_file(tmp_path: Path) -> None:
-    settings = _make_settings()
+    settings = _BASE_SETTINGS
     target = tmp_path / "scheduler.json"
     payload = export_scheduler_config(target, settings=settings)
 
@@ -55,3 +58,37 @@ def test_export_scheduler_config_writes_file(tmp_path: Path) -> None:
     with target.open("r", encoding="utf-8") as fp:
         loaded = json.load(fp)
     assert loaded == payload
+
+
+def test_scheduler_registers_jobs_without_starting() -> None:
+    fixed_now = datetime(2024, 7, 1, 9, 30)
+    scheduler = start_scheduler_from_dict(
+        {
+            "timezone": "Asia/Shanghai",
+            "jobs": [
+                {
+                    "id": "stub",
+                    "callable_path": "tests.scheduler.stubs.record_job",
+                    "trigger": "interval",
+                    "interval_seconds": 1,
+                    "kwargs": {"name": "interval"},
+                },
+                {
+                    "id": "stub-once",
+                    "callable_path": "tests.scheduler.stubs.record_job",
+                    "trigger": "date",
+                    "kwargs": {"name": "once"},
+                },
+            ],
+        },
+        start=False,
+        clock=lambda: fixed_now,
+    )
+    stubs.EVENTS.clear()
+
+    assert not scheduler.running
+    once = scheduler.get_job("stub-once")
+    assert once.trigger.run_date.replace(tzinfo=None) == fixed_now
+    for job in scheduler.get_jobs():
+        job.func(**job.kwargs)
+    assert sorted(event["name"] for event in stubs.EVENTS) == ["interval", "once"]
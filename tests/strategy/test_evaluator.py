@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from pathlib import Path
 
 from llm_trader.strategy.evaluator import select_and_register_best
 from llm_trader.strategy.generator import StrategyCandidate
@@ -10,8 +11,8 @@ from llm_trader.strategy.repository import StrategyRepository
 from llm_trader.strategy.engine import RuleConfig
 
 
-def test_select_and_register_best(tmp_path) -> None:
-    repo = StrategyRepository(base_dir=tmp_path)
+def test_select_and_register_best(shared_data_dir: Path) -> None:
+    repo = StrategyRepository(base_dir=shared_data_dir)
     candidates = [
         StrategyCandidate(
             rules=[RuleConfig(indicator="sma", column="close", params={"window": 3}, operator=">", threshold=10.5)],
@@ -24,8 +25,8 @@ def test_select_and_register_best(tmp_path) -> None:
             equity_curve=[{"date": datetime(2024, 7, 1), "equity": 100000.0}],
         ),
     ]
-    result = select_and_register_best("demo", candidates, repo)
-    assert result.strategy_id == "demo"
-    versions = repo.list_versions("demo")
+    result = select_and_register_best("demo-evaluator", candidates, repo)
+    assert result.strategy_id == "demo-evaluator"
+    versions = repo.list_versions("demo-evaluator")
     assert len(versions) == 1
     assert versions[0].metrics["annual_return"] == 0.15
@@ -4,22 +4,22 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import pandas as pd
+
 from llm_trader.backtest import BacktestRunner
-from llm_trader.data import default_manager
 from llm_trader.data.repositories.parquet import ParquetRepository
+from llm_trader.strategy.engine import StrategyEngine
 from llm_trader.strategy.generator import RuleSpace, StrategyGenerator
 
 
-def test_strategy_generator_returns_candidates(tmp_path) -> None:
+def test_strategy_generator_returns_candidates(shared_repository: ParquetRepository) -> None:
     bars = [
         {"dt": datetime(2024, 7, 1), "symbol": "600000.SH", "open": 10.0, "close": 10.1},
         {"dt": datetime(2024, 7, 2), "symbol": "600000.SH", "open": 10.2, "close": 10.4},
         {"dt": datetime(2024, 7, 3), "symbol": "600000.SH", "open": 10.5, "close": 10.7},
         {"dt": datetime(2024, 7, 4), "symbol": "600000.SH", "open": 10.8, "close": 10.6},
     ]
-    manager = default_manager(base_dir=tmp_path)
-    repository = ParquetRepository(manager=manager)
-    runner = BacktestRunner(initial_cash=100000.0, repository=repository)
+    runner = BacktestRunner(initial_cash=100000.0, repository=shared_repository)
 
     space = RuleSpace(
         indicator="sma",
@@ -32,3 +32,25 @@ def test_strategy_generator_returns_candidates(tmp_path) -> None:
     candidates = generator.search(bars, [space], strategy_id="test")
     assert len(candidates) <= 2
     assert candidates[0].metrics is not None
+
+
+def test_signal_matrix_matches_strategy_engine() -> None:
+    closes = [10.0, 10.3, 10.1, 10.6, 10.9, 10.4, 10.2, 10.8, 11.0, 10.7]
+    frame = pd.DataFrame(
+        {"open": closes, "close": closes},
+        index=pd.date_range("2024-07-01", periods=len(closes), freq="D", name="dt"),
+    )
+    space = RuleSpace(
+        indicator="sma",
+        column="close",
+        params_grid={"window": [2, 3]},
+        operators=[">", "cross_up", "cross_down"],
+        thresholds=[10.3, 10.6],
+    )
+    for long_only in (True, False):
+        generator = StrategyGenerator(runner=None, long_only=long_only)  # type: ignore[arg-type]
+        combos = list(generator._iter_rule_combinations([space]))
+        matrix = generator._signal_matrix(frame, combos)
+        for column, combo in enumerate(combos):
+            expected = StrategyEngine(combo, long_only=long_only).evaluate(frame)["signal"]
+            assert matrix[:, column].tolist() == expected.astype(int).tolist()
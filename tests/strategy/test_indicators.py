@@ -2,20 +2,31 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
-from llm_trader.strategy.library.indicators import ema, momentum, rsi, sma, volatility
+from llm_trader.strategy.library.indicators import (
+    _ema_kernel,
+    _return_volatility_kernel,
+    _rolling_mean_kernel,
+    ema,
+    momentum,
+    rsi,
+    sma,
+    volatility,
+)
+
+# 指标函数不修改输入，基础用例共享同一序列
+_RAMP = pd.Series([1, 2, 3, 4, 5])
 
 
 def test_sma_basic() -> None:
-    series = pd.Series([1, 2, 3, 4, 5])
-    result = sma(series, window=3)
+    result = sma(_RAMP, window=3)
     assert result.iloc[-1] == 4
 
 
 def test_ema_basic() -> None:
-    series = pd.Series([1, 2, 3, 4, 5])
-    result = ema(series, span=3)
+    result = ema(_RAMP, span=3)
     assert round(result.iloc[-1], 2) > 4.0
 
 
@@ -36,3 +47,27 @@ def test_rsi_range() -> None:
     result = rsi(series, window=3)
     tail = result.dropna().iloc[-1]
     assert 0 <= tail <= 100
+
+
+def test_kernels_match_pandas_rolling() -> None:
+    rng = np.random.default_rng(7)
+    series = pd.Series(10 + rng.standard_normal(200).cumsum() * 0.1)
+    values = series.to_numpy(dtype=np.float64)
+    for window in (1, 2, 5, 20):
+        np.testing.assert_allclose(
+            _rolling_mean_kernel(values, window),
+            series.rolling(window=window, min_periods=window).mean().to_numpy(),
+            equal_nan=True,
+        )
+        np.testing.assert_allclose(
+            _ema_kernel(values, window),
+            series.ewm(span=window, adjust=False, min_periods=window).mean().to_numpy(),
+            equal_nan=True,
+        )
+        np.testing.assert_allclose(
+            _return_volatility_kernel(values, window),
+            series.pct_change().rolling(window=window, min_periods=window).std().to_numpy(),
+            rtol=1e-6,
+            atol=1e-12,
+            equal_nan=True,
+        )
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+from typing import Any, Dict
+
 import pytest
 
 from llm_trader.strategy.engine import RuleConfig
@@ -12,6 +14,59 @@ from llm_trader.strategy.llm_generator import (
 )
 
 
+class _FakeMessage:
+    def __init__(self, content: str) -> None:
+        self.content = content
+
+
+class _FakeChoice:
+    def __init__(self, content: str) -> None:
+        self.message = _FakeMessage(content)
+
+
+class _FakeResponse:
+    def __init__(self, content: str) -> None:
+        self.choices = [_FakeChoice(content)]
+
+
+class _FakeCompletions:
+    @staticmethod
+    def create(*_args, **_kwargs):
+        payload = {
+            "description": "自定义",
+            "selected_symbols": ["000001.SZ"],
+            "rules": [
+                {
+                    "indicator": "sma",
+                    "column": "close",
+                    "params": {"window": 5},
+                    "operator": ">",
+                    "threshold": 1.0,
+                }
+            ],
+        }
+        return _FakeResponse(json.dumps(payload))
+
+
+class _FakeChat:
+    completions = _FakeCompletions
+
+
+class _FakeClient:
+    """模拟 OpenAI 客户端，构造参数记录到 ``bind`` 绑定的字典中。"""
+
+    captured: Dict[str, Any] = {}
+
+    def __init__(self, *, api_key: str, base_url: str | None = None) -> None:
+        self.captured["api_key"] = api_key
+        self.captured["base_url"] = base_url
+        self.chat = _FakeChat()
+
+    @classmethod
+    def bind(cls, captured: Dict[str, Any]) -> type:
+        return type("FakeClient", (cls,), {"captured": captured})
+
+
 def test_llm_generator_parses_rules() -> None:
     def fake_completion(prompt: str) -> str:
         payload = {
@@ -64,45 +119,8 @@ def test_llm_generator_raises_on_bad_json() -> None:
 
 
 def test_llm_generator_supports_custom_base_url(monkeypatch: pytest.MonkeyPatch) -> None:
-    captured = {}
-
-    class FakeMessage:
-        def __init__(self, content: str) -> None:
-            self.content = content
-
-    class FakeChoice:
-        def __init__(self, content: str) -> None:
-            self.message = FakeMessage(content)
-
-    class FakeResponse:
-        def __init__(self, content: str) -> None:
-            self.choices = [FakeChoice(content)]
-
-    class FakeCompletions:
-        @staticmethod
-        def create(*_args, **_kwargs):
-            payload = {
-                "description": "自定义",
-                "selected_symbols": ["000001.SZ"],
-                "rules": [
-                    {
-                        "indicator": "sma",
-                        "column": "close",
-                        "params": {"window": 5},
-                        "operator": ">",
-                        "threshold": 1.0,
-                    }
-                ],
-            }
-            return FakeResponse(json.dumps(payload))
-
-    class FakeClient:
-        def __init__(self, *, api_key: str, base_url: str | None = None) -> None:
-            captured["api_key"] = api_key
-            captured["base_url"] = base_url
-            self.chat = type("Chat", (), {"completions": FakeCompletions})()
-
-    monkeypatch.setattr("llm_trader.strategy.llm_generator.OpenAI", FakeClient)
+    captured: Dict[str, Any] = {}
+    monkeypatch.setattr("llm_trader.strategy.llm_generator.OpenAI", _FakeClient.bind(captured))
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
 
     generator = LLMStrategyGenerator(model="stub", base_url="https://multi.example/v1")
@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 from datetime import datetime
+from pathlib import Path
 
 from llm_trader.strategy.repository import StrategyRepository, StrategyVersion
 
 
-def test_strategy_repository_register_and_list(tmp_path) -> None:
-    repo = StrategyRepository(base_dir=tmp_path)
+def test_strategy_repository_register_and_list(shared_data_dir: Path) -> None:
+    repo = StrategyRepository(base_dir=shared_data_dir)
     version = StrategyVersion(
-        strategy_id="demo",
+        strategy_id="demo-repository",
         version_id="v1",
         run_id="run1",
         created_at=datetime(2024, 7, 1),
@@ -20,6 +21,6 @@ def test_strategy_repository_register_and_list(tmp_path) -> None:
     path = repo.register_version(version)
     assert path.exists()
 
-    versions = repo.list_versions("demo")
+    versions = repo.list_versions("demo-repository")
     assert len(versions) == 1
     assert versions[0].version_id == "v1"
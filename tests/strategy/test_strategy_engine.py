@@ -4,20 +4,22 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
+import pytest
 
-from llm_trader.strategy.engine import RuleConfig, StrategyEngine
+from llm_trader.strategy.engine import RuleConfig, StrategyEngine, compile_rule
 from llm_trader.strategy.signals import generate_orders_from_signals
 
+# 共享的索引与行情数组只构建一次；引擎评估前会复制输入，各测试不会相互影响
+_INDEX = pd.date_range("2024-07-01", periods=6, freq="D")
+_OPEN = np.array([10, 10.5, 11, 10.8, 10.6, 10.9])
+_CLOSE = np.array([10.1, 10.6, 11.1, 10.7, 10.5, 11.0])
+_RAMP = np.array([10, 10.2, 10.4, 10.6, 10.8, 11.0])
+
 
 def test_strategy_engine_generates_signals() -> None:
-    data = pd.DataFrame(
-        {
-            "open": [10, 10.5, 11, 10.8, 10.6, 10.9],
-            "close": [10.1, 10.6, 11.1, 10.7, 10.5, 11.0],
-        },
-        index=pd.date_range("2024-07-01", periods=6, freq="D"),
-    )
+    data = pd.DataFrame({"open": _OPEN, "close": _CLOSE}, index=_INDEX, copy=False)
     rules = [
         RuleConfig(indicator="sma", column="close", params={"window": 3}, operator=">", threshold=10.6)
     ]
@@ -28,12 +30,7 @@ def test_strategy_engine_generates_signals() -> None:
 
 
 def test_strategy_engine_supports_ema_window_alias() -> None:
-    data = pd.DataFrame(
-        {
-            "close": [10, 10.2, 10.4, 10.6, 10.8, 11.0],
-        },
-        index=pd.date_range("2024-07-01", periods=6, freq="D"),
-    )
+    data = pd.DataFrame({"close": _RAMP}, index=_INDEX, copy=False)
     rules = [
         RuleConfig(
             indicator="ema",
@@ -49,9 +46,18 @@ def test_strategy_engine_supports_ema_window_alias() -> None:
     assert result["rule_0"].iloc[-1] is True
 
 
+def test_compile_rule_cross_up_and_unknown_operator() -> None:
+    data = pd.DataFrame({"close": [9.0, 9.5, 10.5, 11.0]})
+    rule = RuleConfig(indicator="sma", column="close", params={"window": 1}, operator="cross_up", threshold=10.0)
+    mask = compile_rule(rule)(data)
+    assert mask.tolist() == [False, False, True, False]
+
+    with pytest.raises(ValueError, match="比较符"):
+        StrategyEngine([RuleConfig(indicator="sma", column="close", params={}, operator="!=", threshold=1.0)])
+
+
 def test_generate_orders_from_signals() -> None:
-    index = pd.date_range("2024-07-01", periods=3, freq="D")
-    df = pd.DataFrame({"signal": [0, 1, -1], "open": [10, 10.5, 10.8]}, index=index)
+    df = pd.DataFrame({"signal": [0, 1, -1], "open": _OPEN[:3]}, index=_INDEX[:3])
     orders = generate_orders_from_signals(df, symbol="600000.SH", volume_per_trade=100)
     assert len(orders) == 2
     assert orders[0].side.value == "buy"
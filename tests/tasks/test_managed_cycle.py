@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 
 import pytest
-from apscheduler.schedulers.background import BackgroundScheduler
 
 from llm_trader.trading import ManagedTradingResult, RiskDecision, TradingSession, TradingSessionConfig
 from llm_trader.trading.orchestrator import TradingCycleConfig
@@ -13,7 +13,7 @@ from llm_trader.trading.policy import RiskPolicy, RiskThresholds
 from llm_trader.model_gateway import ModelEndpointSettings, ModelGatewaySettings
 import llm_trader.tasks.managed_cycle as managed_cycle
 from llm_trader.tasks.managed_cycle import run_cycle
-from tests.trading.test_manager import ManagerFakeGenerator
+from tests.trading.test_manager import _FAKE_SUGGESTION
 
 
 class _StubDataService:
@@ -30,11 +30,13 @@ class _StubDataService:
 class _StubObservation:
     observation_id = "obs-1"
     universe = []
+    # 下游不校验观测时效，类定义时取一次时间戳即可，重复调用 to_dict 无需再读时钟
+    _GENERATED_AT = datetime.utcnow().isoformat()
 
     def to_dict(self):
         return {
             "observation_id": self.observation_id,
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": self._GENERATED_AT,
             "valid_ttl_ms": 3000,
             "clock": {"phase": "continuous_trading"},
             "account": {"nav": 1000000.0, "cash": 500000.0},
@@ -67,52 +69,31 @@ class _DummyDataService:
         return []
 
 
-def test_run_cycle(monkeypatch) -> None:
-    history = [
-        {
-            "symbol": "600000.SH",
-            "dt": datetime(2024, 1, 1, 9, 30),
-            "freq": "D",
-            "open": 10.0,
-            "high": 10.2,
-            "low": 9.8,
-            "close": 10.1,
-            "volume": 100000,
-            "amount": 1000000,
-        }
-    ]
+@pytest.fixture
+def stub_managed_cycle(monkeypatch: pytest.MonkeyPatch) -> None:
+    """一次性替换调度任务依赖的数据、观测与决策服务，避免触达真实数据库与网关。"""
+
+    monkeypatch.setattr(managed_cycle, "_ensure_services", lambda _limit: (_StubDataService(), _StubObservationBuilder()))
+    monkeypatch.setattr(managed_cycle, "_ensure_decision_services", lambda _factory: (None, None, None))
+    monkeypatch.setattr(managed_cycle, "_DATA_SERVICE", _StubDataService())
+    monkeypatch.setattr(managed_cycle, "_OBSERVATION_BUILDER", _StubObservationBuilder())
+    # 整体替换服务类即可，无需再逐个覆盖原类上的方法
+    monkeypatch.setattr("llm_trader.data.ingestion.service.DataIngestionService", _DummyDataService)
+    monkeypatch.setattr(managed_cycle, "DataIngestionService", _DummyDataService)
 
-    def fake_load(symbols, freq, start, end):
-        return history
 
+@pytest.mark.usefixtures("stub_managed_cycle")
+def test_run_cycle(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
         "llm_trader.trading.manager.run_ai_trading_cycle",
         lambda config, **kwargs: {
-            "suggestion": ManagerFakeGenerator().generate(None),
+            "suggestion": _FAKE_SUGGESTION,
             "quotes": [],
             "orders_executed": 0,
             "trades_filled": 0,
             "session": TradingSession(TradingSessionConfig(session_id="session", strategy_id="strategy")),
         },
     )
-    monkeypatch.setattr(managed_cycle, "_ensure_services", lambda _limit: (_StubDataService(), _StubObservationBuilder()))
-    monkeypatch.setattr(managed_cycle, "_ensure_decision_services", lambda _factory: (None, None, None))
-    monkeypatch.setattr(managed_cycle, "_DATA_SERVICE", _StubDataService())
-    monkeypatch.setattr(managed_cycle, "_OBSERVATION_BUILDER", _StubObservationBuilder())
-    monkeypatch.setattr(
-        "llm_trader.data.ingestion.service.DataIngestionService.sync_account_snapshot",
-        lambda self: None,
-    )
-    monkeypatch.setattr(
-        "llm_trader.data.ingestion.service.DataIngestionService.sync_master_symbols",
-        lambda self: [],
-    )
-    monkeypatch.setattr(
-        "llm_trader.data.ingestion.service.DataIngestionService.sync_realtime_quotes",
-        lambda self, _symbols: [],
-    )
-    monkeypatch.setattr("llm_trader.data.ingestion.service.DataIngestionService", _DummyDataService)
-    monkeypatch.setattr(managed_cycle, "DataIngestionService", _DummyDataService)
 
     config = TradingCycleConfig(
         session_id="session",
@@ -132,41 +113,51 @@ def test_run_cycle(monkeypatch) -> None:
     )
 
 
-def test_run_cycle_accepts_mapping(monkeypatch: pytest.MonkeyPatch) -> None:
-    captured = {}
-
-    def fake_run_managed(config, **_kwargs):
-        captured["config"] = config
-        return ManagedTradingResult(
-            decision=RiskDecision(proceed=True, alerts=[]),
-            raw_result={"orders_executed": 0, "trades_filled": 0},
-        )
-
-    monkeypatch.setattr("llm_trader.tasks.managed_cycle.run_managed_trading_cycle", fake_run_managed)
-
-    config_payload = {
-        "session_id": "session",
-        "strategy_id": "strategy",
-        "symbols": ["600000.SH"],
-        "objective": "测试",
-        "history_start": "2024-01-01T00:00:00",
-        "history_end": "2024-01-02T00:00:00",
-    }
-    run_cycle(
-        config_payload,
-        data_service=_StubDataService(),
-        observation_builder=_StubObservationBuilder(),
-    )
-
+def _assert_config_from_mapping(captured) -> None:
     assert isinstance(captured["config"], TradingCycleConfig)
     assert captured["config"].history_start == datetime(2024, 1, 1, 0, 0)
 
 
-def test_run_cycle_passes_runtime_kwargs(monkeypatch: pytest.MonkeyPatch) -> None:
-    received = {}
+def _assert_generator_forwarded(captured) -> None:
+    assert captured["kwargs"]["generator"] == "stub"
+
+
+@pytest.mark.parametrize(
+    ("payload_factory", "runtime_kwargs", "assertion"),
+    [
+        pytest.param(
+            lambda: {
+                "session_id": "session",
+                "strategy_id": "strategy",
+                "symbols": ["600000.SH"],
+                "objective": "测试",
+                "history_start": "2024-01-01T00:00:00",
+                "history_end": "2024-01-02T00:00:00",
+            },
+            {},
+            _assert_config_from_mapping,
+            id="accepts-mapping",
+        ),
+        pytest.param(
+            lambda: TradingCycleConfig(
+                session_id="session",
+                strategy_id="strategy",
+                symbols=["600000.SH"],
+                objective="测试",
+                history_start=datetime(2024, 1, 1),
+            ),
+            {"generator": "stub"},
+            _assert_generator_forwarded,
+            id="passes-runtime-kwargs",
+        ),
+    ],
+)
+def test_run_cycle_variants(monkeypatch: pytest.MonkeyPatch, payload_factory, runtime_kwargs, assertion) -> None:
+    captured = {}
 
-    def fake_run_managed(config, *, generator=None, **_kwargs):
-        received["generator"] = generator
+    def fake_run_managed(config, **kwargs):
+        captured["config"] = config
+        captured["kwargs"] = kwargs
         return ManagedTradingResult(
             decision=RiskDecision(proceed=True, alerts=[]),
             raw_result={"orders_executed": 0, "trades_filled": 0},
@@ -175,31 +166,24 @@ def test_run_cycle_passes_runtime_kwargs(monkeypatch: pytest.MonkeyPatch) -> Non
     monkeypatch.setattr("llm_trader.tasks.managed_cycle.run_managed_trading_cycle", fake_run_managed)
 
     run_cycle(
-        TradingCycleConfig(
-            session_id="session",
-            strategy_id="strategy",
-            symbols=["600000.SH"],
-            objective="测试",
-            history_start=datetime(2024, 1, 1),
-        ),
-        generator="stub",
+        payload_factory(),
         data_service=_StubDataService(),
         observation_builder=_StubObservationBuilder(),
+        **runtime_kwargs,
     )
 
-    assert received["generator"] == "stub"
+    assertion(captured)
 
 
 def test_ensure_trading_config_with_lookback(monkeypatch: pytest.MonkeyPatch) -> None:
     fixed_now = datetime(2024, 1, 10, 0, 0, 0)
 
-    class FrozenDateTime(datetime):
-        @classmethod
-        def utcnow(cls):  # noqa: D401 - 简单重写
-            return fixed_now
-
-    monkeypatch.setattr("llm_trader.tasks.managed_cycle.datetime", FrozenDateTime)
-    monkeypatch.setattr("llm_trader.tasks.managed_cycle.timedelta", timedelta)
+    # 只替换被调用的 utcnow/fromisoformat，无需派生 datetime 子类
+    monkeypatch.setattr(
+        managed_cycle,
+        "datetime",
+        SimpleNamespace(utcnow=lambda: fixed_now, fromisoformat=datetime.fromisoformat),
+    )
 
     config = managed_cycle._ensure_trading_config(  # pylint: disable=protected-access
         {
@@ -280,39 +264,3 @@ def test_sync_account_snapshot_job(monkeypatch: pytest.MonkeyPatch) -> None:
     managed_cycle.sync_account_snapshot()
 
     assert calls["called"] is True
-    monkeypatch.setattr(managed_cycle, "_ensure_services", lambda _limit: (_StubDataService(), _StubObservationBuilder()))
-    monkeypatch.setattr(managed_cycle, "_ensure_decision_services", lambda _factory: (None, None, None))
-    monkeypatch.setattr(managed_cycle, "_DATA_SERVICE", _StubDataService())
-    monkeypatch.setattr(managed_cycle, "_OBSERVATION_BUILDER", _StubObservationBuilder())
-    monkeypatch.setattr(
-        "llm_trader.data.ingestion.service.DataIngestionService.sync_account_snapshot",
-        lambda self: None,
-    )
-    monkeypatch.setattr(
-        "llm_trader.data.ingestion.service.DataIngestionService.sync_master_symbols",
-        lambda self: [],
-    )
-    monkeypatch.setattr(
-        "llm_trader.data.ingestion.service.DataIngestionService.sync_realtime_quotes",
-        lambda self, _symbols: [],
-    )
-    monkeypatch.setattr("llm_trader.data.ingestion.service.DataIngestionService", _DummyDataService)
-    monkeypatch.setattr(managed_cycle, "DataIngestionService", _DummyDataService)
-    monkeypatch.setattr(managed_cycle, "_ensure_services", lambda _limit: (_StubDataService(), _StubObservationBuilder()))
-    monkeypatch.setattr(managed_cycle, "_ensure_decision_services", lambda _factory: (None, None, None))
-    monkeypatch.setattr(managed_cycle, "_DATA_SERVICE", _StubDataService())
-    monkeypatch.setattr(managed_cycle, "_OBSERVATION_BUILDER", _StubObservationBuilder())
-    monkeypatch.setattr(
-        "llm_trader.data.ingestion.service.DataIngestionService.sync_account_snapshot",
-        lambda self: None,
-    )
-    monkeypatch.setattr(
-        "llm_trader.data.ingestion.service.DataIngestionService.sync_master_symbols",
-        lambda self: [],
-    )
-    monkeypatch.setattr(
-        "llm_trader.data.ingestion.service.DataIngestionService.sync_realtime_quotes",
-        lambda self, _symbols: [],
-    )
-    monkeypatch.setattr("llm_trader.data.ingestion.service.DataIngestionService", _DummyDataService)
-    monkeypatch.setattr(managed_cycle, "DataIngestionService", _DummyDataService)
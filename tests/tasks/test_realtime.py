@@ -2,24 +2,46 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
 
 from llm_trader.tasks.realtime import fetch_realtime_quotes, start_scheduler
 
 
-@patch("llm_trader.tasks.realtime.RealtimeQuotesPipeline")
-def test_fetch_realtime_quotes(mock_pipeline_cls: MagicMock) -> None:
-    pipeline = mock_pipeline_cls.return_value
-    pipeline.sync.return_value = ["record"]
+def test_fetch_realtime_quotes(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: List[Any] = []
+
+    def sync(symbols):
+        calls.append(symbols)
+        return ["record"]
+
+    monkeypatch.setattr(
+        "llm_trader.tasks.realtime.RealtimeQuotesPipeline",
+        lambda *_args, **_kwargs: SimpleNamespace(sync=sync),
+    )
     fetch_realtime_quotes()
-    pipeline.sync.assert_called_once_with(None)
+    assert calls == [None]
+
+
+class _StubScheduler:
+    def __init__(self) -> None:
+        self.jobs: List[Dict[str, Any]] = []
+        self.started = 0
+
+    def add_job(self, func, trigger, **kwargs) -> None:
+        self.jobs.append({"func": func, "trigger": trigger, **kwargs})
+
+    def start(self) -> None:
+        self.started += 1
 
 
-@patch("llm_trader.tasks.realtime.BackgroundScheduler")
-def test_start_scheduler(mock_scheduler_cls: MagicMock) -> None:
-    scheduler = mock_scheduler_cls.return_value
-    scheduler.add_job.return_value = None
+def test_start_scheduler(monkeypatch: pytest.MonkeyPatch) -> None:
+    scheduler = _StubScheduler()
+    monkeypatch.setattr("llm_trader.tasks.realtime.BackgroundScheduler", lambda: scheduler)
     result = start_scheduler(interval_minutes=5)
-    scheduler.add_job.assert_called_once()
-    scheduler.start.assert_called_once()
+    assert len(scheduler.jobs) == 1
+    assert scheduler.jobs[0]["minutes"] == 5
+    assert scheduler.started == 1
     assert result is scheduler
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
 
-from llm_trader.common import get_logger, project_root
+import pytest
+
+from llm_trader.common import get_logger, project_root, serialization
 from llm_trader.common.paths import data_store_dir
+from llm_trader.common.serialization import dumps, loads
+from llm_trader.config import get_settings, override_settings
 
 
 def test_project_root_exists() -> None:
@@ -14,10 +19,10 @@ def test_project_root_exists() -> None:
     assert project_root().exists()
 
 
-def test_data_store_directory_created() -> None:
-    """数据目录初始化后必须存在。"""
+def test_data_store_directory_created(ensure_data_directory: Path) -> None:
+    """数据目录初始化后必须存在（由会话级夹具只解析、创建一次）。"""
 
-    path = data_store_dir()
+    path = ensure_data_directory
     assert path.exists()
     assert path.is_dir()
 
@@ -28,3 +33,43 @@ def test_logging_setup() -> None:
     logger = get_logger("tests.bootstrap")
     logger.info("日志初始化验证")
     assert logger.name == "tests.bootstrap"
+
+
+def test_override_settings_restores_data_store(tmp_path: Path) -> None:
+    """临时覆盖数据目录后应恢复原配置，且不重建配置实例。"""
+
+    settings = get_settings()
+    original = settings.data_store.base_dir
+    with override_settings("data_store", base_dir=tmp_path) as overridden:
+        assert overridden is settings
+        assert data_store_dir() == tmp_path.resolve()
+    assert get_settings() is settings
+    assert settings.data_store.base_dir == original
+
+
+def test_serialization_round_trip() -> None:
+    """dumps 输出紧凑 JSON 并保留中文，loads 同时接受文本与字节。"""
+
+    payload = {"message": "告警", "details": {"k": 1}}
+    text = dumps(payload)
+    assert text == '{"message":"告警","details":{"k":1}}'
+    assert loads(text) == payload
+    assert loads(text.encode("utf-8")) == payload
+    assert loads(dumps({1: "a"})) == {"1": "a"}
+    assert dumps({"b": 1, "a": {"d": 2, "c": 3}}, sort_keys=True) == '{"a":{"c":3,"d":2},"b":1}'
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_serialization_output_independent_of_orjson(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """时间与非有限浮点数的输出不随是否安装 orjson 而变化。"""
+
+    if use_orjson and serialization.orjson is None:
+        pytest.skip("未安装 orjson")
+    if not use_orjson:
+        monkeypatch.setattr(serialization, "orjson", None)
+    payload = {"at": datetime(2024, 1, 2, 9, 30), "nan": float("nan"), "inf": float("inf")}
+    assert dumps(payload, default=str) == '{"at":"2024-01-02T09:30:00","nan":null,"inf":null}'
+    assert dumps({"a": [1, {"b": "中"}], "c": []}, indent=True) == (
+        '{\n  "a": [\n    1,\n    {\n      "b": "中"\n    }\n  ],\n  "c": []\n}'
+    )
+    assert loads(memoryview(b'{"a":1}')) == {"a": 1}
@@ -0,0 +1,31 @@
+"""交易模块测试夹具。"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from llm_trader.trading.orchestrator import TradingCycleConfig
+
+
+@pytest.fixture(autouse=True)
+def _isolate_trading_store(isolated_data_store: Path) -> Path:
+    """交易用例会写入默认数据目录中的订单、成交与权益文件，
+    各用例改用独立目录，避免并行 worker 同时读写同一份 parquet。"""
+
+    return isolated_data_store
+
+
+@pytest.fixture(scope="module")
+def cycle_config() -> TradingCycleConfig:
+    """模块内共享的基础交易循环配置；交易流程只读取该配置，需调整字段时用 ``dataclasses.replace``。"""
+
+    return TradingCycleConfig(
+        session_id="session",
+        strategy_id="strategy",
+        symbols=["600000.SH"],
+        objective="测试",
+        history_start=datetime(2024, 1, 1),
+    )
@@ -0,0 +1,32 @@
+"""交易测试辅助函数。"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+from llm_trader.data import DatasetKind, DataStoreManager
+
+
+class TradingPaths(NamedTuple):
+    """单个交易会话落盘的订单、成交与权益文件路径。"""
+
+    orders: Path
+    trades: Path
+    equity: Path
+
+
+def trading_paths(
+    manager: DataStoreManager, session_id: str, strategy_id: str, timestamp: datetime
+) -> TradingPaths:
+    """一次性给出会话的三类交易文件路径，三者共用相同的分区参数。"""
+
+    def path(kind: DatasetKind) -> Path:
+        return manager.path_for(kind, symbol=session_id, freq=strategy_id, timestamp=timestamp)
+
+    return TradingPaths(
+        orders=path(DatasetKind.TRADING_ORDERS),
+        trades=path(DatasetKind.TRADING_TRADES),
+        equity=path(DatasetKind.TRADING_EQUITY),
+    )
@@ -5,8 +5,6 @@ from __future__ import annotations
 from datetime import datetime
 
 from llm_trader.backtest.models import Order, OrderSide
-from llm_trader.data import default_manager
-from llm_trader.data.repositories.parquet import ParquetRepository
 from llm_trader.trading.brokers.base import BrokerConfig
 from llm_trader.trading.execution_adapters import LiveBrokerExecutionAdapter
 from llm_trader.trading.session import TradingSession, TradingSessionConfig
@@ -16,12 +14,9 @@ def _price_lookup(_symbol: str, side: OrderSide) -> float:
     return 10.0 if side == OrderSide.BUY else 9.5
 
 
-def test_live_adapter_with_mock_broker(tmp_path) -> None:
-    manager = default_manager(base_dir=tmp_path / "data_store")
-    session = TradingSession(
-        TradingSessionConfig(session_id="live-session", strategy_id="live-strategy"),
-        repository=ParquetRepository(manager=manager),
-    )
+def test_live_adapter_with_mock_broker() -> None:
+    # 适配器只更新内存账户，会话仓库按需懒加载，这里不会触达数据目录
+    session = TradingSession(TradingSessionConfig(session_id="live-session", strategy_id="live-strategy"))
 
     adapter = LiveBrokerExecutionAdapter(
         BrokerConfig(provider="mock", account="demo-account")
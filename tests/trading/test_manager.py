@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
 
 from llm_trader.decision import ActorDecisionPayload
 from llm_trader.db.models.enums import DecisionStatus
@@ -17,40 +18,47 @@ from llm_trader.strategy.engine import RuleConfig
 from llm_trader.strategy.llm_generator import LLMStrategySuggestion
 
 
-class ManagerFakeGenerator:
-    def __init__(self) -> None:
-        self.last_prompt = "prompt"
-        self.last_raw_response = "response"
-        self._suggestion = LLMStrategySuggestion(
-            description="test",
-            rules=[
-                RuleConfig(
-                    indicator="sma",
-                    column="close",
-                    params={"window": 1},
-                    operator=">",
-                    threshold=8.5,
-                )
-            ],
-            selected_symbols=["600000.SH"],
+# 建议内容只读，进程内构建一次供所有假生成器实例共享
+_FAKE_SUGGESTION = LLMStrategySuggestion(
+    description="test",
+    rules=[
+        RuleConfig(
+            indicator="sma",
+            column="close",
+            params={"window": 1},
+            operator=">",
+            threshold=8.5,
         )
-
-    def generate(self, context):
-        return self._suggestion
-
-
-class _SpySession(TradingSession):
-    def __init__(self, config: TradingSessionConfig) -> None:
-        super().__init__(config)
-        self.executed = False
-
-    def execute(self, *args, **kwargs):
-        self.executed = True
-        return []
+    ],
+    selected_symbols=["600000.SH"],
+)
+
+
+# 风控记录测试只读取该决策，模块级校验一次即可，避免每次运行重复走 pydantic 校验
+_ACTOR_PAYLOAD = ActorDecisionPayload.model_validate(
+    {
+        "decision_id": "dec-test",
+        "timestamp": "2025-01-01T09:30:00Z",
+        "observations_ref": "obs-1",
+        "account_view": {"nav": 1000000, "cash": 500000},
+        "actions": [
+            {
+                "type": "place_order",
+                "symbol": "600000.SH",
+                "side": "buy",
+                "order_type": "limit",
+                "price": 10.5,
+                "qty": 100,
+                "tif": "day",
+            }
+        ],
+    }
+)
 
 
-def test_run_managed_trading_cycle_triggers_policy(monkeypatch) -> None:
-    history = [
+# 只读的历史行情，模块级构建一次，假加载函数直接返回该元组
+_HISTORY = (
+    MappingProxyType(
         {
             "symbol": "600000.SH",
             "dt": datetime(2024, 1, 1, 9, 30),
@@ -61,7 +69,9 @@ def test_run_managed_trading_cycle_triggers_policy(monkeypatch) -> None:
             "close": 10.1,
             "volume": 100000,
             "amount": 1000000,
-        },
+        }
+    ),
+    MappingProxyType(
         {
             "symbol": "600000.SH",
             "dt": datetime(2024, 1, 2, 9, 30),
@@ -72,11 +82,32 @@ def test_run_managed_trading_cycle_triggers_policy(monkeypatch) -> None:
             "close": 8.9,
             "volume": 120000,
             "amount": 1000000,
-        },
-    ]
+        }
+    ),
+)
+
+
+class ManagerFakeGenerator:
+    last_prompt = "prompt"
+    last_raw_response = "response"
+
+    def generate(self, context):
+        return _FAKE_SUGGESTION
+
+
+class _SpySession(TradingSession):
+    def __init__(self, config: TradingSessionConfig) -> None:
+        super().__init__(config)
+        self.executed = False
 
+    def execute(self, *args, **kwargs):
+        self.executed = True
+        return []
+
+
+def test_run_managed_trading_cycle_triggers_policy(monkeypatch, cycle_config: TradingCycleConfig) -> None:
     def fake_load(symbols, freq, start, end):
-        return history
+        return _HISTORY
 
     generator = ManagerFakeGenerator()
     realtime = FakeRealtimePipeline(
@@ -91,15 +122,7 @@ def test_run_managed_trading_cycle_triggers_policy(monkeypatch) -> None:
     session = TradingSession(
         TradingSessionConfig(session_id="session", strategy_id="strategy", initial_cash=1000.0)
     )
-    config = TradingCycleConfig(
-        session_id="session",
-        strategy_id="strategy",
-        symbols=["600000.SH"],
-        objective="测试",
-        indicators=("sma",),
-        history_start=datetime(2024, 1, 1),
-        initial_cash=1000.0,
-    )
+    config = replace(cycle_config, indicators=("sma",), initial_cash=1000.0)
     policy = RiskPolicy(RiskThresholds(max_equity_drawdown=0.01, max_position_ratio=0.1))
 
     outcome = run_managed_trading_cycle(
@@ -114,26 +137,8 @@ def test_run_managed_trading_cycle_triggers_policy(monkeypatch) -> None:
     assert outcome.decision.alerts
 
 
-def test_run_managed_trading_cycle_records_risk(monkeypatch) -> None:
-    actor_payload = ActorDecisionPayload.model_validate(
-        {
-            "decision_id": "dec-test",
-            "timestamp": "2025-01-01T09:30:00Z",
-            "observations_ref": "obs-1",
-            "account_view": {"nav": 1000000, "cash": 500000},
-            "actions": [
-                {
-                    "type": "place_order",
-                    "symbol": "600000.SH",
-                    "side": "buy",
-                    "order_type": "limit",
-                    "price": 10.5,
-                    "qty": 100,
-                    "tif": "day",
-                }
-            ],
-        }
-    )
+def test_run_managed_trading_cycle_records_risk(monkeypatch, cycle_config: TradingCycleConfig) -> None:
+    actor_payload = _ACTOR_PAYLOAD
 
     session = TradingSession(TradingSessionConfig(session_id="session", strategy_id="strategy"))
 
@@ -162,13 +167,7 @@ def test_run_managed_trading_cycle_records_risk(monkeypatch) -> None:
     decision_service = StubDecisionService()
 
     outcome = run_managed_trading_cycle(
-        TradingCycleConfig(
-            session_id="session",
-            strategy_id="strategy",
-            symbols=["600000.SH"],
-            objective="测试",
-            history_start=datetime(2024, 1, 1),
-        ),
+        cycle_config,
         decision_service=decision_service,
     )
 
@@ -179,7 +178,7 @@ def test_run_managed_trading_cycle_records_risk(monkeypatch) -> None:
     assert decision_service.ledger_args["decision_id"] == "dec-test"
 
 
-def test_run_managed_trading_cycle_records_executed_ledger(monkeypatch) -> None:
+def test_run_managed_trading_cycle_records_executed_ledger(monkeypatch, cycle_config: TradingCycleConfig) -> None:
     actor_payload = ActorDecisionPayload.model_validate(
         {
             "decision_id": "dec-ok",
@@ -221,13 +220,7 @@ def test_run_managed_trading_cycle_records_executed_ledger(monkeypatch) -> None:
     decision_service = StubDecisionService()
 
     outcome = run_managed_trading_cycle(
-        TradingCycleConfig(
-            session_id="session",
-            strategy_id="strategy",
-            symbols=["600000.SH"],
-            objective="测试",
-            history_start=datetime(2024, 1, 1),
-        ),
+        cycle_config,
         policy=policy,
         decision_service=decision_service,
     )
@@ -237,7 +230,7 @@ def test_run_managed_trading_cycle_records_executed_ledger(monkeypatch) -> None:
     assert decision_service.ledger_args["status"] == DecisionStatus.EXECUTED
 
 
-def test_run_managed_trading_cycle_records_rejected_risk(monkeypatch) -> None:
+def test_run_managed_trading_cycle_records_rejected_risk(monkeypatch, cycle_config: TradingCycleConfig) -> None:
     actor_payload = ActorDecisionPayload.model_validate(
         {
             "decision_id": "dec-risk",
@@ -288,13 +281,7 @@ def test_run_managed_trading_cycle_records_rejected_risk(monkeypatch) -> None:
     decision_service = StubDecisionService()
 
     outcome = run_managed_trading_cycle(
-        TradingCycleConfig(
-            session_id="session",
-            strategy_id="strategy",
-            symbols=["600000.SH"],
-            objective="测试",
-            history_start=datetime(2024, 1, 1),
-        ),
+        cycle_config,
         policy=RiskPolicy(RiskThresholds()),
         decision_service=decision_service,
     )
@@ -304,7 +291,7 @@ def test_run_managed_trading_cycle_records_rejected_risk(monkeypatch) -> None:
     assert decision_service.ledger_args["status"] == DecisionStatus.REJECTED_RISK
 
 
-def test_run_managed_trading_cycle_skips_execution_when_blocked(monkeypatch) -> None:
+def test_run_managed_trading_cycle_skips_execution_when_blocked(monkeypatch, cycle_config: TradingCycleConfig) -> None:
     session = _SpySession(TradingSessionConfig(session_id="session", strategy_id="strategy"))
     actor_payload = ActorDecisionPayload.model_validate(
         {
@@ -337,13 +324,7 @@ def test_run_managed_trading_cycle_skips_execution_when_blocked(monkeypatch) ->
     )
 
     run_managed_trading_cycle(
-        TradingCycleConfig(
-            session_id="session",
-            strategy_id="strategy",
-            symbols=["600000.SH"],
-            objective="测试",
-            history_start=datetime(2024, 1, 1),
-        ),
+        cycle_config,
         policy=RiskPolicy(RiskThresholds()),
     )
 
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from types import MappingProxyType, SimpleNamespace
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
 
-import pandas as pd
+import pyarrow.parquet as pq
 import pytest
-import json
 
 from llm_trader.backtest.models import Order, OrderSide
-from llm_trader.data import DatasetKind, default_manager
+from llm_trader.common.serialization import dumps, loads
+from llm_trader.data import DataStoreManager, DatasetKind
 from llm_trader.data.repositories.parquet import ParquetRepository
 from llm_trader.strategy.llm_generator import LLMStrategySuggestion
 from llm_trader.strategy.logger import LLMStrategyLogRepository
@@ -24,50 +25,67 @@ from llm_trader.trading import (
     run_ai_trading_cycle,
 )
 from llm_trader.trading.execution_adapters import create_execution_adapter
+from tests.trading.helpers import trading_paths
+
+# 各用例均驱动完整交易循环（生成、撮合、落盘），归入集成用例
+pytestmark = pytest.mark.integration
 
 
 class FakeGenerator:
-    def __init__(self, rules: Sequence[RuleConfig]) -> None:
+    __slots__ = ("_suggestion", "last_prompt", "last_raw_response", "last_context")
+
+    # 提示词与原始响应均为常量，类定义时序列化一次即可
+    _PROMPT = "fake prompt"
+    _RAW_RESPONSE = dumps({"description": "demo", "rules": []})
+
+    def __init__(
+        self, rules: Sequence[RuleConfig], selected_symbols: Sequence[str] = ("600000.SH",)
+    ) -> None:
         self._suggestion = LLMStrategySuggestion(
             description="demo",
             rules=list(rules),
-            selected_symbols=["600000.SH"],
+            selected_symbols=list(selected_symbols),
         )
         self.last_prompt = None
         self.last_raw_response = None
         self.last_context = None
 
     def generate(self, context) -> LLMStrategySuggestion:
-        self.last_prompt = "fake prompt"
-        self.last_raw_response = json.dumps({"description": "demo", "rules": []})
+        self.last_prompt = FakeGenerator._PROMPT
+        self.last_raw_response = FakeGenerator._RAW_RESPONSE
         self.last_context = context
         return self._suggestion
 
 
 class FakeRealtimePipeline:
+    __slots__ = ("_quotes", "_by_symbol")
+
     def __init__(self, quotes: List[Dict[str, object]]) -> None:
         self._quotes = quotes
+        # 按代码预建索引，sync 按请求代码直接取行情而非逐条扫描
+        self._by_symbol = {quote["symbol"]: quote for quote in quotes}
 
     def sync(self, symbols: Sequence[str]) -> List[Dict[str, object]]:
         if symbols is None:
             return list(self._quotes)
-        target = set(symbols)
-        return [quote for quote in self._quotes if quote["symbol"] in target]
+        return [self._by_symbol[symbol] for symbol in symbols if symbol in self._by_symbol]
 
 
-def _load_bars(_: Sequence[str], __: str, ___, ____):
-    raise AssertionError("Should be patched in test")
+# 常用时间点均为不可变对象，模块级构建一次
+_DT_D1 = datetime(2024, 1, 1, 9, 30)
+_DT_D2 = datetime(2024, 1, 2, 9, 30)
+_HISTORY_START = datetime(2024, 1, 1)
+_TRADE_DAY = datetime(2024, 1, 2)
 
+# 会话配置模板，各用例只替换会话与策略标识
+_SESSION_TEMPLATE = TradingSessionConfig(session_id="", strategy_id="", initial_cash=100000.0)
 
-def test_run_ai_trading_cycle_executes_orders(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    base_dir = tmp_path / "data_store"
-    manager = default_manager(base_dir=base_dir)
-    repo = ParquetRepository(manager=manager)
-
-    history = [
+# 历史行情与实时行情均为只读输入，模块级构建一次供各用例共享
+_HISTORY_MULTI = (
+    MappingProxyType(
         {
             "symbol": "600000.SH",
-            "dt": datetime(2024, 1, 1, 9, 30),
+            "dt": _DT_D1,
             "freq": "D",
             "open": 9.5,
             "high": 10.2,
@@ -75,10 +93,12 @@ def test_run_ai_trading_cycle_executes_orders(tmp_path: Path, monkeypatch: pytes
             "close": 10.1,
             "volume": 100000,
             "amount": 1000000,
-        },
+        }
+    ),
+    MappingProxyType(
         {
             "symbol": "600000.SH",
-            "dt": datetime(2024, 1, 2, 9, 30),
+            "dt": _DT_D2,
             "freq": "D",
             "open": 10.0,
             "high": 10.4,
@@ -86,12 +106,103 @@ def test_run_ai_trading_cycle_executes_orders(tmp_path: Path, monkeypatch: pytes
             "close": 10.3,
             "volume": 120000,
             "amount": 1230000,
-        },
-    ]
+        }
+    ),
+)
+_HISTORY_SINGLE = (
+    MappingProxyType(
+        {
+            "symbol": "600000.SH",
+            "dt": _DT_D1,
+            "freq": "D",
+            "open": 10.0,
+            "high": 10.2,
+            "low": 9.8,
+            "close": 10.1,
+            "volume": 100000,
+            "amount": 1000000,
+        }
+    ),
+)
+_HISTORY_TOP = (
+    MappingProxyType(
+        {
+            "symbol": "600001.SH",
+            "dt": _DT_D1,
+            "freq": "D",
+            "open": 10.0,
+            "high": 10.5,
+            "low": 9.8,
+            "close": 10.3,
+            "volume": 200000,
+            "amount": 2000000,
+        }
+    ),
+)
+_QUOTES_SINGLE = (
+    MappingProxyType(
+        {
+            "symbol": "600000.SH",
+            "last_price": 10.5,
+            "change_ratio": 1.2,
+            "turnover_rate": 3.5,
+        }
+    ),
+)
+_QUOTES_TOP = (
+    MappingProxyType(
+        {
+            "symbol": "600001.SH",
+            "last_price": 10.5,
+            "amount": 2_000_000,
+            "turnover_rate": 4.0,
+        }
+    ),
+    MappingProxyType(
+        {
+            "symbol": "600002.SH",
+            "last_price": 8.0,
+            "amount": 1_500_000,
+            "turnover_rate": 3.0,
+        }
+    ),
+    MappingProxyType(
+        {
+            "symbol": "600003.SH",
+            "last_price": 5.0,
+            "amount": 500_000,
+            "turnover_rate": 2.0,
+        }
+    ),
+)
+
+
+def _make_fake_load(
+    rows: Sequence[Mapping[str, object]], expected_symbols: Optional[List[str]] = None
+) -> Callable[..., Sequence[Mapping[str, object]]]:
+    """构造历史行情加载函数：返回固定行情，给定 ``expected_symbols`` 时校验请求的标的。"""
 
     def fake_load(symbols, freq, start, end):
-        assert symbols == ["600000.SH"]
-        return history
+        if expected_symbols is not None:
+            assert symbols == expected_symbols
+        return rows
+
+    return fake_load
+
+
+def test_run_ai_trading_cycle_executes_orders(
+    shared_manager: DataStoreManager,
+    shared_repository: ParquetRepository,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager = shared_manager
+    repo = shared_repository
+    # 固定日志时间，日志按日期分区，可直接算出文件路径而无需遍历目录
+    logged_at = datetime(2024, 1, 2, 15, 0)
+    monkeypatch.setattr(
+        "llm_trader.strategy.logger.datetime",
+        SimpleNamespace(utcnow=lambda: logged_at),
+    )
 
     generator = FakeGenerator(
         [
@@ -104,19 +215,10 @@ def test_run_ai_trading_cycle_executes_orders(tmp_path: Path, monkeypatch: pytes
             )
         ]
     )
-    realtime = FakeRealtimePipeline(
-        [
-            {
-                "symbol": "600000.SH",
-                "last_price": 10.5,
-                "change_ratio": 1.2,
-                "turnover_rate": 3.5,
-            }
-        ]
-    )
+    realtime = FakeRealtimePipeline(_QUOTES_SINGLE)
 
     session = TradingSession(
-        TradingSessionConfig(session_id="session-1", strategy_id="strategy-ai", initial_cash=100000.0),
+        replace(_SESSION_TEMPLATE, session_id="session-1", strategy_id="strategy-ai"),
         repository=repo,
     )
     log_repo = LLMStrategyLogRepository(manager=manager)
@@ -128,12 +230,12 @@ def test_run_ai_trading_cycle_executes_orders(tmp_path: Path, monkeypatch: pytes
             symbols=["600000.SH"],
             objective="获取日内收益",
             indicators=("sma",),
-            history_start=datetime(2024, 1, 1),
+            history_start=_HISTORY_START,
         ),
         generator=generator,
         trading_session=session,
         realtime_pipeline=realtime,
-        load_ohlcv_fn=fake_load,
+        load_ohlcv_fn=_make_fake_load(_HISTORY_MULTI, ["600000.SH"]),
         log_repository=log_repo,
     )
 
@@ -141,64 +243,35 @@ def test_run_ai_trading_cycle_executes_orders(tmp_path: Path, monkeypatch: pytes
     assert result["trades_filled"] >= 1
     assert result["selected_symbols"] == ["600000.SH"]
     assert result["llm_prompt"] == "fake prompt"
-    assert result["llm_response"] == json.dumps({"description": "demo", "rules": []})
-
-    orders_path = manager.path_for(
-        DatasetKind.TRADING_ORDERS,
-        symbol="session-1",
-        freq="strategy-ai",
-        timestamp=datetime(2024, 1, 2),
+    assert result["llm_response"] == FakeGenerator._RAW_RESPONSE
+
+    paths = trading_paths(manager, "session-1", "strategy-ai", _TRADE_DAY)
+
+    # 行数直接取自文件元数据；权益只读取单列，不经过 DataFrame 构建
+    assert pq.ParquetFile(paths.orders).metadata.num_rows >= 1
+    assert pq.ParquetFile(paths.trades).metadata.num_rows >= 1
+    equity = pq.read_table(paths.equity, columns=["equity"]).column("equity")
+    last_equity = equity[-1].as_py()
+    total_equity = session.account.total_equity()
+    assert last_equity <= total_equity
+
+    log_path = manager.path_for(
+        DatasetKind.STRATEGY_LLM_LOGS,
+        symbol="strategy-ai",
+        freq="session-1",
+        timestamp=logged_at,
+        ensure_dir=False,
     )
-    trades_path = manager.path_for(
-        DatasetKind.TRADING_TRADES,
-        symbol="session-1",
-        freq="strategy-ai",
-        timestamp=datetime(2024, 1, 2),
-    )
-    equity_path = manager.path_for(
-        DatasetKind.TRADING_EQUITY,
-        symbol="session-1",
-        freq="strategy-ai",
-        timestamp=datetime(2024, 1, 2),
-    )
-
-    orders_df = pd.read_parquet(orders_path)
-    trades_df = pd.read_parquet(trades_path)
-    equity_df = pd.read_parquet(equity_path)
-
-    assert orders_df.shape[0] >= 1
-    assert trades_df.shape[0] >= 1
-    assert equity_df.iloc[-1]["equity"] <= session.account.total_equity()
-
-    logs_dir = manager.directory_for(DatasetKind.STRATEGY_LLM_LOGS) / "strategy=strategy-ai" / "session=session-1"
-    files = list(logs_dir.rglob("logs.jsonl"))
-    assert files
-    with files[0].open("r", encoding="utf-8") as fp:
-        lines = fp.readlines()
-    assert len(lines) >= 1
-    entry = json.loads(lines[-1])
+    assert log_path.exists()
+    # 只需校验最后一条日志，按字节切出末行即可，无需把所有行读入列表
+    data = log_path.read_bytes().rstrip(b"\n")
+    assert data
+    entry = loads(data.rsplit(b"\n", 1)[-1])
     assert entry["objective"] == "获取日内收益"
     assert "prompt" in entry
 
 
 def test_run_ai_trading_cycle_uses_provided_quotes(monkeypatch: pytest.MonkeyPatch) -> None:
-    history = [
-        {
-            "symbol": "600000.SH",
-            "dt": datetime(2024, 1, 1, 9, 30),
-            "freq": "D",
-            "open": 10.0,
-            "high": 10.2,
-            "low": 9.8,
-            "close": 10.1,
-            "volume": 100000,
-            "amount": 1000000,
-        }
-    ]
-
-    def fake_load(symbols, freq, start, end):
-        return history
-
     generator = FakeGenerator(
         [
             RuleConfig(
@@ -220,16 +293,7 @@ def test_run_ai_trading_cycle_uses_provided_quotes(monkeypatch: pytest.MonkeyPat
             self.calls.append(tuple(symbols) if symbols is not None else None)
             return super().sync(symbols or [])
 
-    pipeline = RecordingPipeline(
-        [
-            {
-                "symbol": "600000.SH",
-                "last_price": 10.5,
-                "change_ratio": 1.2,
-                "turnover_rate": 3.5,
-            }
-        ]
-    )
+    pipeline = RecordingPipeline(_QUOTES_SINGLE)
     session = TradingSession(TradingSessionConfig(session_id="session", strategy_id="strategy"))
 
     result = run_ai_trading_cycle(
@@ -243,15 +307,8 @@ def test_run_ai_trading_cycle_uses_provided_quotes(monkeypatch: pytest.MonkeyPat
         generator=generator,
         trading_session=session,
         realtime_pipeline=pipeline,
-        load_ohlcv_fn=fake_load,
-        quotes=[
-            {
-                "symbol": "600000.SH",
-                "last_price": 10.5,
-                "change_ratio": 1.2,
-                "turnover_rate": 3.5,
-            }
-        ],
+        load_ohlcv_fn=_make_fake_load(_HISTORY_SINGLE),
+        quotes=_QUOTES_SINGLE,
     )
 
     assert result["quotes"]
@@ -259,23 +316,6 @@ def test_run_ai_trading_cycle_uses_provided_quotes(monkeypatch: pytest.MonkeyPat
 
 
 def test_run_ai_trading_cycle_records_actor_decision(monkeypatch: pytest.MonkeyPatch) -> None:
-    history = [
-        {
-            "symbol": "600000.SH",
-            "dt": datetime(2024, 1, 1, 9, 30),
-            "freq": "D",
-            "open": 10.0,
-            "high": 10.2,
-            "low": 9.8,
-            "close": 10.1,
-            "volume": 100000,
-            "amount": 1000000,
-        }
-    ]
-
-    def fake_load(symbols, freq, start, end):
-        return history
-
     generator = FakeGenerator(
         [
             RuleConfig(
@@ -362,11 +402,11 @@ def test_run_ai_trading_cycle_records_actor_decision(monkeypatch: pytest.MonkeyP
             symbols=["600000.SH"],
             objective="测试",
             indicators=("sma",),
-            history_start=datetime(2024, 1, 1),
+            history_start=_HISTORY_START,
         ),
         generator=generator,
         quotes=[{"symbol": "600000.SH", "last_price": 10.5}],
-        load_ohlcv_fn=fake_load,
+        load_ohlcv_fn=_make_fake_load(_HISTORY_SINGLE),
         actor_service=actor_service,
         checker_service=checker_service,
         decision_service=decision_service,
@@ -380,29 +420,7 @@ def test_run_ai_trading_cycle_records_actor_decision(monkeypatch: pytest.MonkeyP
     assert decision_service.called_with["observation_id"] == "obs-stub"
 
 
-def test_run_ai_trading_cycle_live_mode_raises(tmp_path: Path) -> None:
-    base_dir = tmp_path / "data_store"
-    manager = default_manager(base_dir=base_dir)
-    repo = ParquetRepository(manager=manager)
-
-    history = [
-        {
-            "symbol": "600000.SH",
-            "dt": datetime(2024, 1, 1, 9, 30),
-            "freq": "D",
-            "open": 9.5,
-            "high": 10.2,
-            "low": 9.4,
-            "close": 10.1,
-            "volume": 100000,
-            "amount": 1000000,
-        }
-    ]
-
-    def fake_load(symbols, freq, start, end):
-        assert symbols == ["600000.SH"]
-        return history
-
+def test_run_ai_trading_cycle_live_mode_raises() -> None:
     generator = FakeGenerator(
         [
             RuleConfig(
@@ -414,20 +432,11 @@ def test_run_ai_trading_cycle_live_mode_raises(tmp_path: Path) -> None:
             )
         ]
     )
-    realtime = FakeRealtimePipeline(
-        [
-            {
-                "symbol": "600000.SH",
-                "last_price": 10.5,
-                "change_ratio": 1.2,
-                "turnover_rate": 3.5,
-            }
-        ]
-    )
+    realtime = FakeRealtimePipeline(_QUOTES_SINGLE)
 
+    # live 适配器在落盘前即抛出异常，会话仓库按需懒加载，这里不会被构建
     session = TradingSession(
-        TradingSessionConfig(session_id="session-live", strategy_id="strategy-live", initial_cash=100000.0),
-        repository=repo,
+        replace(_SESSION_TEMPLATE, session_id="session-live", strategy_id="strategy-live"),
         adapter=create_execution_adapter("live"),
     )
 
@@ -439,38 +448,18 @@ def test_run_ai_trading_cycle_live_mode_raises(tmp_path: Path) -> None:
                 symbols=["600000.SH"],
                 objective="获取收益",
                 indicators=("sma",),
-                history_start=datetime(2024, 1, 1),
+                history_start=_HISTORY_START,
                 execution_mode="live",
             ),
             generator=generator,
             trading_session=session,
             realtime_pipeline=realtime,
-            load_ohlcv_fn=fake_load,
+            load_ohlcv_fn=_make_fake_load(_HISTORY_MULTI[:1], ["600000.SH"]),
         )
 
 
-def test_auto_selects_top_symbols(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    base_dir = tmp_path / "data_store"
-    manager = default_manager(base_dir=base_dir)
-    repo = ParquetRepository(manager=manager)
-
-    history = [
-        {
-            "symbol": "600001.SH",
-            "dt": datetime(2024, 1, 1, 9, 30),
-            "freq": "D",
-            "open": 10.0,
-            "high": 10.5,
-            "low": 9.8,
-            "close": 10.3,
-            "volume": 200000,
-            "amount": 2000000,
-        }
-    ]
-
-    def fake_load(symbols, freq, start, end):
-        assert symbols == ["600001.SH"]
-        return history
+def test_auto_selects_top_symbols(shared_repository: ParquetRepository, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = shared_repository
 
     generator = FakeGenerator(
         [
@@ -481,34 +470,13 @@ def test_auto_selects_top_symbols(tmp_path: Path, monkeypatch: pytest.MonkeyPatc
                 operator=">",
                 threshold=9.0,
             )
-        ]
-    )
-    generator._suggestion.selected_symbols = ["600001.SH"]
-    realtime = FakeRealtimePipeline(
-        [
-            {
-                "symbol": "600001.SH",
-                "last_price": 10.5,
-                "amount": 2_000_000,
-                "turnover_rate": 4.0,
-            },
-            {
-                "symbol": "600002.SH",
-                "last_price": 8.0,
-                "amount": 1_500_000,
-                "turnover_rate": 3.0,
-            },
-            {
-                "symbol": "600003.SH",
-                "last_price": 5.0,
-                "amount": 500_000,
-                "turnover_rate": 2.0,
-            },
-        ]
+        ],
+        selected_symbols=["600001.SH"],
     )
+    realtime = FakeRealtimePipeline(_QUOTES_TOP)
 
     session = TradingSession(
-        TradingSessionConfig(session_id="session-auto", strategy_id="strategy-auto", initial_cash=100000.0),
+        replace(_SESSION_TEMPLATE, session_id="session-auto", strategy_id="strategy-auto"),
         repository=repo,
     )
 
@@ -518,7 +486,7 @@ def test_auto_selects_top_symbols(tmp_path: Path, monkeypatch: pytest.MonkeyPatc
         symbols=[],
         objective="获取稳健收益",
         indicators=("sma",),
-        history_start=datetime(2024, 1, 1),
+        history_start=_HISTORY_START,
         symbol_universe_limit=2,
         selection_metric="amount",
     )
@@ -528,7 +496,7 @@ def test_auto_selects_top_symbols(tmp_path: Path, monkeypatch: pytest.MonkeyPatc
         generator=generator,
         trading_session=session,
         realtime_pipeline=realtime,
-        load_ohlcv_fn=fake_load,
+        load_ohlcv_fn=_make_fake_load(_HISTORY_TOP, ["600001.SH"]),
     )
 
     assert result["selected_symbols"] == ["600001.SH"]
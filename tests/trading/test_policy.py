@@ -4,81 +4,79 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import pytest
+
 from llm_trader.trading.policy import RiskDecision, RiskPolicy, RiskThresholds
 
 
-def test_risk_policy_detects_drawdown_and_exposure() -> None:
-    policy = RiskPolicy(RiskThresholds(max_equity_drawdown=0.05, max_position_ratio=0.4))
-    equity_curve = [
-        {"timestamp": datetime(2024, 1, 1), "equity": 100000.0},
-        {"timestamp": datetime(2024, 1, 2), "equity": 94000.0},
-    ]
-    positions = [
-        {"symbol": "600000.SH", "volume": 1000, "cost_price": 90.0},
-    ]
-    decision = policy.evaluate(equity_curve, positions)
-    assert isinstance(decision, RiskDecision)
-    assert not decision.proceed
-    assert len(decision.alerts) >= 2
+# 仅含单个权益点的基础曲线，只读共享；回撤、波动率场景单独给出多点曲线
+_BASE_CURVE = ({"timestamp": datetime(2024, 1, 20), "equity": 100000.0},)
 
 
-def test_risk_policy_detects_volatility() -> None:
-    thresholds = RiskThresholds(
-        max_equity_drawdown=1.0,
-        max_position_ratio=1.0,
-        max_equity_volatility=0.01,
-    )
-    policy = RiskPolicy(thresholds)
-    equity_curve = [
-        {"timestamp": datetime(2024, 1, 1), "equity": 100000.0},
-        {"timestamp": datetime(2024, 1, 2), "equity": 120000.0},
-        {"timestamp": datetime(2024, 1, 3), "equity": 90000.0},
-    ]
-    decision = policy.evaluate(equity_curve, [])
-    assert not decision.proceed
-    assert any("波动率" in alert for alert in decision.alerts)
+def _bank_sector(symbol: str) -> str:
+    return "银行" if symbol == "600000.SH" else "UNKNOWN"
 
 
-def test_risk_policy_detects_sector_exposure() -> None:
-    thresholds = RiskThresholds(
-        max_equity_drawdown=1.0,
-        max_position_ratio=1.0,
-        max_sector_exposure=0.4,
-    )
-    policy = RiskPolicy(thresholds, sector_lookup=lambda symbol: "银行" if symbol == "600000.SH" else "UNKNOWN")
-    equity_curve = [
-        {"timestamp": datetime(2024, 1, 2), "equity": 100000.0},
-    ]
-    positions = [
-        {"symbol": "600000.SH", "volume": 1000, "cost_price": 50.0},
-        {"symbol": "000001.SZ", "volume": 100, "cost_price": 5.0},
-    ]
-    decision = policy.evaluate(equity_curve, positions)
-    assert not decision.proceed
-    assert any("行业" in alert for alert in decision.alerts)
-
-
-def test_risk_policy_detects_holding_period() -> None:
-    thresholds = RiskThresholds(
-        max_equity_drawdown=1.0,
-        max_position_ratio=1.0,
-        max_holding_days=10,
-    )
-    policy = RiskPolicy(thresholds)
-    reference = datetime(2024, 1, 20)
-    equity_curve = [
-        {"timestamp": reference, "equity": 100000.0},
-    ]
-    positions = [
-        {
-            "symbol": "600000.SH",
-            "volume": 1000,
-            "cost_price": 10.0,
-            "lots": [
-                {"volume": 1000, "cost_price": 10.0, "acquired_at": "2023-12-20T09:30:00"},
+@pytest.mark.parametrize(
+    ("thresholds", "sector_lookup", "equity_curve", "positions", "keywords"),
+    [
+        pytest.param(
+            RiskThresholds(max_equity_drawdown=0.05, max_position_ratio=0.4),
+            None,
+            (
+                {"timestamp": datetime(2024, 1, 1), "equity": 100000.0},
+                {"timestamp": datetime(2024, 1, 2), "equity": 94000.0},
+            ),
+            [{"symbol": "600000.SH", "volume": 1000, "cost_price": 90.0}],
+            ("回撤", "仓位"),
+            id="drawdown-and-exposure",
+        ),
+        pytest.param(
+            RiskThresholds(max_equity_drawdown=1.0, max_position_ratio=1.0, max_equity_volatility=0.01),
+            None,
+            (
+                {"timestamp": datetime(2024, 1, 1), "equity": 100000.0},
+                {"timestamp": datetime(2024, 1, 2), "equity": 120000.0},
+                {"timestamp": datetime(2024, 1, 3), "equity": 90000.0},
+            ),
+            [],
+            ("波动率",),
+            id="volatility",
+        ),
+        pytest.param(
+            RiskThresholds(max_equity_drawdown=1.0, max_position_ratio=1.0, max_sector_exposure=0.4),
+            _bank_sector,
+            _BASE_CURVE,
+            [
+                {"symbol": "600000.SH", "volume": 1000, "cost_price": 50.0},
+                {"symbol": "000001.SZ", "volume": 100, "cost_price": 5.0},
             ],
-        }
-    ]
+            ("行业",),
+            id="sector-exposure",
+        ),
+        pytest.param(
+            RiskThresholds(max_equity_drawdown=1.0, max_position_ratio=1.0, max_holding_days=10),
+            None,
+            _BASE_CURVE,
+            [
+                {
+                    "symbol": "600000.SH",
+                    "volume": 1000,
+                    "cost_price": 10.0,
+                    "lots": [
+                        {"volume": 1000, "cost_price": 10.0, "acquired_at": "2023-12-20T09:30:00"},
+                    ],
+                }
+            ],
+            ("持仓",),
+            id="holding-period",
+        ),
+    ],
+)
+def test_risk_policy_detects_breach(thresholds, sector_lookup, equity_curve, positions, keywords) -> None:
+    policy = RiskPolicy(thresholds, sector_lookup=sector_lookup)
     decision = policy.evaluate(equity_curve, positions)
+    assert isinstance(decision, RiskDecision)
     assert not decision.proceed
-    assert any("持仓" in alert for alert in decision.alerts)
+    for keyword in keywords:
+        assert any(keyword in alert for alert in decision.alerts)
@@ -2,32 +2,46 @@
 
 from __future__ import annotations
 
-import json
+import os
+import subprocess
+import sys
+import threading
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, List, Tuple
 
-import pandas as pd
+import pyarrow.parquet as pq
 
-from llm_trader.backtest.models import Order, OrderSide
-from llm_trader.data import DatasetKind, default_manager
+from llm_trader.backtest.models import Order, OrderSide, Trade
+from llm_trader.common.serialization import loads
+from llm_trader.config import AppSettings
+from llm_trader.data import DataStoreManager, default_manager
 from llm_trader.data.repositories.parquet import ParquetRepository
 import pytest
 
 from llm_trader.trading import TradingSession, TradingSessionConfig
 from llm_trader.trading.execution_adapters import create_execution_adapter
+from llm_trader.trading.session import _order_columns, _trade_columns, safe_price_lookup
+from tests.trading.helpers import trading_paths
+
+
+# 用例共用的成交时间点，模块级构建一次
+_DT = datetime(2024, 1, 2, 9, 30)
+_NEXT_DT = datetime(2024, 1, 3, 9, 30)
+# 会话配置模板，各用例只替换会话标识等差异字段
+_SESSION_TEMPLATE = TradingSessionConfig(session_id="", strategy_id="demo-strategy", initial_cash=100000.0)
 
 
-def _build_session(tmp_path: Path) -> TradingSession:
-    base_dir = tmp_path / "data_store"
-    manager = default_manager(base_dir=base_dir)
-    repository = ParquetRepository(manager=manager)
-    config = TradingSessionConfig(session_id="demo-session", strategy_id="demo-strategy", initial_cash=100000.0)
-    return TradingSession(config, repository=repository)
+def _build_session(repository: ParquetRepository, session_id: str) -> TradingSession:
+    """基于共享仓库构建会话；各用例使用不同的 ``session_id``，写入的文件互不干扰。"""
 
+    return TradingSession(replace(_SESSION_TEMPLATE, session_id=session_id), repository=repository)
 
-def test_trading_session_executes_and_persists(tmp_path: Path) -> None:
-    session = _build_session(tmp_path)
-    dt = datetime(2024, 1, 2, 9, 30)
+
+def test_trading_session_executes_and_persists(shared_repository: ParquetRepository) -> None:
+    session = _build_session(shared_repository, "persist-session")
+    dt = _DT
     order = Order(
         order_id="order-1",
         symbol="600000.SH",
@@ -47,41 +61,26 @@ def test_trading_session_executes_and_persists(tmp_path: Path) -> None:
     assert session.account.positions["600000.SH"].volume == 100
 
     manager = session.repository.manager
-    orders_path = manager.path_for(
-        DatasetKind.TRADING_ORDERS,
-        symbol="demo-session",
-        freq="demo-strategy",
-        timestamp=dt,
-    )
-    trades_path = manager.path_for(
-        DatasetKind.TRADING_TRADES,
-        symbol="demo-session",
-        freq="demo-strategy",
-        timestamp=dt,
-    )
-    equity_path = manager.path_for(
-        DatasetKind.TRADING_EQUITY,
-        symbol="demo-session",
-        freq="demo-strategy",
-        timestamp=dt,
-    )
+    paths = trading_paths(manager, "persist-session", "demo-strategy", dt)
 
-    orders_df = pd.read_parquet(orders_path)
-    trades_df = pd.read_parquet(trades_path)
-    equity_df = pd.read_parquet(equity_path)
+    # 只读取断言用到的列，直接从 Arrow 列取值，不经过 DataFrame 构建
+    order_ids = pq.read_table(paths.orders, columns=["order_id"]).column("order_id")
+    trade_ids = pq.read_table(paths.trades, columns=["trade_id"]).column("trade_id")
+    positions = pq.read_table(paths.equity, columns=["positions"]).column("positions")
 
-    assert orders_df.iloc[0]["order_id"] == "order-1"
-    assert trades_df.iloc[0]["trade_id"] == "trade-order-1"
+    assert order_ids[0].as_py() == "order-1"
+    assert trade_ids[0].as_py() == "trade-order-1"
 
-    positions_payload = json.loads(equity_df.iloc[-1]["positions"])
+    raw_positions = positions[-1].as_py()
+    positions_payload = loads(raw_positions)
     assert positions_payload[0]["symbol"] == "600000.SH"
     assert session.account.cash < 100000.0
 
 
-def test_trading_session_live_mode_raises(tmp_path: Path) -> None:
-    session = _build_session(tmp_path)
+def test_trading_session_live_mode_raises(shared_repository: ParquetRepository) -> None:
+    session = _build_session(shared_repository, "live-session")
     session.adapter = create_execution_adapter("live")
-    dt = datetime(2024, 1, 2, 9, 30)
+    dt = _DT
     order = Order(
         order_id="order-1",
         symbol="600000.SH",
@@ -97,3 +96,258 @@ def test_trading_session_live_mode_raises(tmp_path: Path) -> None:
 
     with pytest.raises(NotImplementedError):
         session.execute(dt, [order], price_lookup)
+
+
+def test_trading_session_settles_trade_batch(shared_repository: ParquetRepository) -> None:
+    session = _build_session(shared_repository, "settle-session")
+    bought_at = _DT
+    sold_at = _NEXT_DT
+    buy = Trade(
+        trade_id="t-1",
+        order_id="o-1",
+        symbol="600000.SH",
+        side=OrderSide.BUY,
+        volume=200,
+        price=10.0,
+        fee=5.0,
+        tax=0.0,
+        timestamp=bought_at,
+    )
+    session._settle_trades([], [buy], bought_at)
+    sell = Trade(
+        trade_id="t-2",
+        order_id="o-2",
+        symbol="600000.SH",
+        side=OrderSide.SELL,
+        volume=100,
+        price=11.0,
+        fee=5.0,
+        tax=1.1,
+        timestamp=sold_at,
+    )
+    session._settle_trades([], [sell], sold_at)
+
+    assert session.account.cash == pytest.approx(100000.0 - 2005.0 + 1100.0 - 6.1)
+    assert session.account.positions["600000.SH"].volume == 100
+    assert len(session.account.trades) == 2
+
+
+def test_trading_session_settles_cash_only_for_booked_trades(shared_repository: ParquetRepository) -> None:
+    session = _build_session(shared_repository, "partial-settle-session")
+    for symbol in ("600000.SH", "000001.SZ"):
+        session.account.get_position(symbol).add_lot(100, 10.0, _DT)
+
+    def sell(symbol: str, volume: int) -> Trade:
+        return Trade(
+            trade_id=f"t-{symbol}",
+            order_id=f"o-{symbol}",
+            symbol=symbol,
+            side=OrderSide.SELL,
+            volume=volume,
+            price=11.0,
+            fee=1.0,
+            tax=0.0,
+            timestamp=_NEXT_DT,
+        )
+
+    # 第二笔卖出数量超过持仓，第一笔已完成的簿记与现金应同时保留
+    with pytest.raises(ValueError):
+        session._settle_trades([], [sell("600000.SH", 100), sell("000001.SZ", 500)], _NEXT_DT)
+
+    assert "600000.SH" not in session.account.positions
+    assert session.account.positions["000001.SZ"].volume == 100
+    assert session.account.cash == pytest.approx(100000.0 + 1100.0 - 1.0)
+
+
+def test_trading_session_async_record_flushes_on_close(shared_manager: DataStoreManager) -> None:
+    manager = shared_manager
+    config = replace(_SESSION_TEMPLATE, session_id="async-session", async_record=True)
+    dt = _DT
+    # 退出 with 语句时关闭会话，等待后台线程写完
+    with TradingSession(config, repository=ParquetRepository(manager=manager)) as session:
+        for index in range(3):
+            order = Order(
+                order_id=f"order-{index}",
+                symbol="600000.SH",
+                side=OrderSide.BUY,
+                volume=100,
+                price=10.0,
+                created_at=dt.replace(minute=30 + index),
+            )
+            session.execute(dt.replace(minute=30 + index), [order], lambda _symbol, _side: 10.0)
+
+    paths = trading_paths(manager, "async-session", "demo-strategy", dt)
+    order_ids = pq.read_table(paths.orders, columns=["order_id"]).column("order_id")
+    assert order_ids.to_pylist() == ["order-0", "order-1", "order-2"]
+    assert pq.ParquetFile(paths.equity).metadata.num_rows == 3
+
+
+_UNCLOSED_SESSION_SCRIPT = """
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from llm_trader.backtest.models import Order, OrderSide
+from llm_trader.data import default_manager
+from llm_trader.data.repositories.parquet import ParquetRepository
+from llm_trader.trading import TradingSession, TradingSessionConfig
+
+config = TradingSessionConfig(session_id="unclosed", strategy_id="demo-strategy", async_record=True)
+session = TradingSession(
+    config, repository=ParquetRepository(manager=default_manager(base_dir=Path(sys.argv[1])))
+)
+dt = datetime(2024, 1, 2, 9, 30)
+order = Order(
+    order_id="order-0", symbol="600000.SH", side=OrderSide.BUY, volume=100, price=10.0, created_at=dt
+)
+session.execute(dt, [order], lambda _symbol, _side: 10.0)
+"""
+
+
+def test_trading_session_async_record_flushes_at_exit_without_close(tmp_path: Path) -> None:
+    # 未调用 close() 的会话在解释器退出时仍应落盘已排队的记录
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run(
+        [sys.executable, "-c", _UNCLOSED_SESSION_SCRIPT, str(tmp_path)], check=True, env=env, timeout=60
+    )
+
+    paths = trading_paths(default_manager(base_dir=tmp_path), "unclosed", "demo-strategy", _DT)
+    order_ids = pq.read_table(paths.orders, columns=["order_id"]).column("order_id")
+    assert order_ids.to_pylist() == ["order-0"]
+
+
+def test_trading_session_records_synchronously_after_close(shared_repository: ParquetRepository) -> None:
+    config = replace(_SESSION_TEMPLATE, session_id="closed-async-session", async_record=True)
+    session = TradingSession(config, repository=shared_repository)
+    session.close()
+
+    order = Order(
+        order_id="late-order",
+        symbol="600000.SH",
+        side=OrderSide.BUY,
+        volume=100,
+        price=10.0,
+        created_at=_DT,
+    )
+    session.execute(_DT, [order], lambda _symbol, _side: 10.0)
+    # 关闭后的记录应同步落盘，flush 不应阻塞在无人消费的队列上
+    flusher = threading.Thread(target=session.flush, daemon=True)
+    flusher.start()
+    flusher.join(timeout=5)
+    assert not flusher.is_alive()
+
+    paths = trading_paths(shared_repository.manager, "closed-async-session", "demo-strategy", _DT)
+    order_ids = pq.read_table(paths.orders, columns=["order_id"]).column("order_id")
+    assert order_ids.to_pylist() == ["late-order"]
+
+
+def test_trading_session_columns_cover_empty_and_filled_batches() -> None:
+    # 无成交时仍输出完整的空列，供仓储按固定 schema 建表
+    empty = _trade_columns([])
+    assert list(empty) == [
+        "trade_id",
+        "order_id",
+        "symbol",
+        "side",
+        "volume",
+        "price",
+        "fee",
+        "tax",
+        "timestamp",
+    ]
+    assert all(values == [] for values in empty.values())
+
+    orders, _ = _orders_with_trades(_DT)
+    columns = _order_columns(orders)
+    assert columns["order_id"] == ["o-0", "o-1"]
+    assert columns["side"] == ["buy", "buy"]
+
+
+def _orders_with_trades(dt: datetime) -> Tuple[List[Order], List[Trade]]:
+    """构造两笔订单及其成交，成交价各不相同，便于核对配对结果。"""
+
+    orders = [
+        Order(
+            order_id=f"o-{index}",
+            symbol="600000.SH",
+            side=OrderSide.BUY,
+            volume=100,
+            price=10.0,
+            created_at=dt,
+        )
+        for index in range(2)
+    ]
+    trades = [
+        Trade(
+            trade_id=f"t-{order.order_id}",
+            order_id=order.order_id,
+            symbol=order.symbol,
+            side=order.side,
+            volume=order.volume,
+            price=10.0 + index,
+            fee=0.0,
+            tax=0.0,
+            timestamp=dt,
+        )
+        for index, order in enumerate(orders)
+    ]
+    return orders, trades
+
+
+def test_trading_session_matches_orders_by_position_when_ordered(shared_repository: ParquetRepository) -> None:
+    session = _build_session(shared_repository, "ordered-session")
+    orders, trades = _orders_with_trades(_DT)
+    # 顺序与订单号一致时按位置配对，每笔成交对应同位置的订单
+    pairs = list(TradingSession._match_orders(orders, trades, ordered=True))
+    assert [(order.order_id, trade.trade_id) for order, trade in pairs] == [
+        ("o-0", "t-o-0"),
+        ("o-1", "t-o-1"),
+    ]
+
+    session._settle_trades(orders, trades, _DT, ordered=True)
+
+    assert [order.status for order in orders] == ["filled", "filled"]
+    assert [order.filled_amount for order in orders] == [1000.0, 1100.0]
+
+
+def test_trading_session_matches_orders_falls_back_when_out_of_order(
+    shared_repository: ParquetRepository,
+) -> None:
+    session = _build_session(shared_repository, "unordered-session")
+    orders, trades = _orders_with_trades(_DT)
+    # 顺序不一致时应回退为按订单号匹配
+    session._settle_trades(orders, list(reversed(trades)), _DT, ordered=True)
+
+    assert [order.status for order in orders] == ["filled", "filled"]
+    assert [order.filled_amount for order in orders] == [1000.0, 1100.0]
+
+
+def test_trading_session_equity_uses_safe_lookup_fast_path(shared_repository: ParquetRepository) -> None:
+    session = _build_session(shared_repository, "equity-session")
+    session.account.get_position("600000.SH").add_lot(100, 10.0, _DT)
+
+    def failing_lookup(_symbol: str, _side: OrderSide) -> float:
+        raise KeyError("missing quote")
+
+    # 未标记的查询函数失败时回退成本价
+    assert session._compute_equity(failing_lookup) == 100000.0 + 1000.0
+
+    @safe_price_lookup
+    def quote_lookup(_symbol: str, _side: OrderSide) -> float:
+        return 12.0
+
+    assert session._compute_equity(quote_lookup) == 100000.0 + 1200.0
+
+
+def test_trading_session_reuses_default_repository_per_data_dir(
+    tmp_path: Path, settings_factory: Callable[..., AppSettings]
+) -> None:
+    settings_factory(data_store={"base_dir": tmp_path / "store-a"})
+    first = TradingSession(TradingSessionConfig(session_id="a", strategy_id="s"))
+    second = TradingSession(TradingSessionConfig(session_id="b", strategy_id="s"))
+    assert first.repository is second.repository
+
+    settings_factory(data_store={"base_dir": tmp_path / "store-b"})
+    third = TradingSession(TradingSessionConfig(session_id="c", strategy_id="s"))
+    assert third.repository is not first.repository
+    assert third.repository.manager.base_dir == tmp_path / "store-b"